@@ -31,9 +31,10 @@ import time
 import math
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, asdict, field, fields, replace
 from enum import Enum
-from functools import lru_cache
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -51,6 +52,38 @@ from rich.text import Text
 from scipy.signal import argrelextrema
 from scipy.stats import linregress, zscore
 
+# Optional JIT for hot numeric loops; without numba the decorated functions run as plain Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Pacific time zone for the trade tracker's extended-hours flag; None without zoneinfo/tzdata
+try:
+    from zoneinfo import ZoneInfo
+    _PT_TZ = ZoneInfo('America/Los_Angeles')
+except Exception:
+    _PT_TZ = None
+
+# Optional matplotlib artists for the analysis chart. Only the OO API is imported (no pyplot),
+# so the interactive backend used by plot_efficient_frontier is left alone.
+try:
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.patches import Circle, Polygon, FancyBboxPatch, Rectangle
+    from matplotlib.lines import Line2D
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.colors import to_rgba
+    MATPLOTLIB_AVAILABLE = True
+except ImportError:
+    MATPLOTLIB_AVAILABLE = False
+
 # Initialize
 console = Console()
 LOG_DIR = Path("logs")
@@ -1803,6 +1836,12 @@ class TradeSummary:
     risk_per_share: Optional[float] = None
     reward_per_share: Optional[float] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of the fields; list/dict values are JSON-native, so asdict's deep copy is unneeded."""
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+TradeSummary._FIELDS = tuple(f.name for f in fields(TradeSummary))
+
 @dataclass
 class ScannerOpportunity:
     """Scanner-detected opportunity."""
@@ -1819,6 +1858,12 @@ class ScannerOpportunity:
     market_cap: Optional[str] = None
     sector: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dict of the fields (no nested dataclasses, so asdict's recursion is unneeded)."""
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+ScannerOpportunity._FIELDS = tuple(f.name for f in fields(ScannerOpportunity))
+
 @dataclass
 class NewsItem:
     """News article item."""
@@ -2608,6 +2653,77 @@ class DataManager:
             console.print(f"[yellow]Debug: yfinance error details for {ticker}: {str(e)[:200]}[/yellow]")
             return None
     
+    @staticmethod
+    def fetch_data_batch(tickers: List[str], period: str, interval: str,
+                         max_workers: int = 8) -> Dict[str, pd.DataFrame]:
+        """Fetch bars for a whole universe in one pass, keyed by ticker (misses omitted).
+
+        yfinance tickers share a single multi-ticker yf.download call. Polygon has no
+        multi-ticker intraday aggregates endpoint, so Polygon tickers and anything the
+        batch call missed go through fetch_data on a thread pool.
+        """
+        results: Dict[str, pd.DataFrame] = {}
+        now_ts = time.time()
+        
+        # Fresh 1m frames from the recent-cache need no request at all
+        if interval == '1m':
+            for t in tickers:
+                cached = DataManager._recent_cache.get(f"{t}|{period}|{interval}")
+                if cached and now_ts - cached[0] < 5.0:
+                    results[t] = cached[1]
+        
+        # Same routing as fetch_data: which tickers would be served by Polygon
+        polygon_on = False
+        if interval in ['1m', '5m', '15m', '30m', '1h']:
+            try:
+                cfg = ConfigurationManager.load_config()
+            except Exception:
+                cfg = {}
+            api_key = os.getenv('POLYGON_API_KEY') or cfg.get('polygon_api_key')
+            polygon_on = bool(cfg.get('prefer_polygon_intraday', True)) and bool(api_key)
+        
+        def _is_crypto(t: str) -> bool:
+            return t.upper().endswith('-USD') or t.upper().startswith('BTC') or '-' in t
+        
+        yf_batch = [t for t in tickers if t not in results and not (polygon_on and not _is_crypto(t))]
+        if len(yf_batch) > 1:
+            yf_interval = interval.replace('1w', '1wk') if interval == '1w' else interval
+            try:
+                raw = yf.download(yf_batch, period=period, interval=yf_interval, group_by='ticker',
+                                  progress=False, auto_adjust=True, prepost=True)
+                if raw is not None and not raw.empty and isinstance(raw.columns, pd.MultiIndex):
+                    present = set(raw.columns.get_level_values(0))
+                    for t in yf_batch:
+                        if t not in present:
+                            continue
+                        df = raw[t].dropna(how='all').copy()
+                        if 'Volume' not in df.columns:
+                            df['Volume'] = 1
+                        df['Volume'] = df['Volume'].fillna(1).replace(0, 1)
+                        df = df.dropna()
+                        if df.empty or not DataManager.validate_data(df):
+                            continue
+                        results[t] = df
+                        if interval == '1m':
+                            DataManager._recent_cache[f"{t}|{period}|{interval}"] = (time.time(), df)
+                logger.info(f"Batch yf.download returned {sum(t in results for t in yf_batch)}/{len(yf_batch)} tickers")
+            except Exception as e:
+                logger.warning(f"Batch yf.download failed, fetching per ticker: {e}")
+        
+        remaining = [t for t in tickers if t not in results]
+        if remaining:
+            def _fetch_one(t: str) -> Optional[pd.DataFrame]:
+                try:
+                    return DataManager.fetch_data(t, period, interval)
+                except Exception:
+                    return None
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(remaining)))) as ex:
+                for t, df in zip(remaining, ex.map(_fetch_one, remaining)):
+                    if df is not None and not df.empty:
+                        results[t] = df
+        
+        return {t: results[t] for t in tickers if t in results}
+    
     @staticmethod
     def get_ticker_info(ticker: str) -> Dict[str, Any]:
         """Get ticker information."""
@@ -2639,10 +2755,13 @@ class DataManager:
     _price_updater_thread = None
     _price_updater_stop = False
     _greeks_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+    _fundamentals_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
     # Crypto WS state
     _crypto_ws_thread = None
     _crypto_ws_stop = False
     _crypto_ws_symbols: set = set()
+    # {ticker: threading.Event} set on each WS tick, for callers that wait on a first price
+    _price_events: Dict[str, Any] = {}
 
     @staticmethod
     def start_price_updater(adapter=None, tickers: list = None, interval: float = 0.5):
@@ -2782,18 +2901,7 @@ class DataManager:
                                 # Parse both direct and nested formats
                                 try:
                                     if (data.get('channel') == 'ticker') and ('price' in data) and ('product_id' in data):
-                                        pid = data['product_id']
-                                        price = float(data['price'])
-                                        nowts = time.time()
-                                        DataManager._latest_prices[pid] = (nowts, price)
-                                        # Append to tick history
-                                        try:
-                                            from collections import deque
-                                            if pid not in DataManager._tick_history:
-                                                DataManager._tick_history[pid] = deque(maxlen=20000)
-                                            DataManager._tick_history[pid].append((nowts, price))
-                                        except Exception:
-                                            pass
+                                        DataManager._store_ws_tick(data['product_id'], float(data['price']))
                                         continue
                                 except Exception:
                                     pass
@@ -2806,16 +2914,7 @@ class DataManager:
                                                 pid = t.get('product_id') or t.get('productId')
                                                 prw = t.get('price') or t.get('p')
                                                 if pid and prw:
-                                                    price = float(prw)
-                                                    nowts = time.time()
-                                                    DataManager._latest_prices[pid] = (nowts, price)
-                                                    try:
-                                                        from collections import deque
-                                                        if pid not in DataManager._tick_history:
-                                                            DataManager._tick_history[pid] = deque(maxlen=20000)
-                                                        DataManager._tick_history[pid].append((nowts, price))
-                                                    except Exception:
-                                                        pass
+                                                    DataManager._store_ws_tick(pid, float(prw))
                                 except Exception:
                                     pass
 
@@ -2836,6 +2935,31 @@ class DataManager:
         except Exception as e:
             logger.error(f"Coinbase WS thread error: {e}")
 
+    @staticmethod
+    def _store_ws_tick(pid: str, price: float):
+        """Record a WS tick: latest price, tick history, and wake any registered waiter."""
+        nowts = time.time()
+        DataManager._latest_prices[pid] = (nowts, price)
+        # Append to tick history
+        try:
+            from collections import deque
+            if pid not in DataManager._tick_history:
+                DataManager._tick_history[pid] = deque(maxlen=20000)
+            DataManager._tick_history[pid].append((nowts, price))
+        except Exception:
+            pass
+        evt = DataManager._price_events.get(pid)
+        if evt is not None:
+            evt.set()
+
+    @staticmethod
+    def register_price_event(ticker: str):
+        """Return a cleared threading.Event that the WS consumer sets on the next tick for `ticker`."""
+        import threading
+        evt = DataManager._price_events.setdefault(ticker.upper(), threading.Event())
+        evt.clear()
+        return evt
+
     @staticmethod
     def start_crypto_ws(symbols: Optional[List[str]] = None):
         """Start Coinbase WS for given crypto product IDs (e.g., 'BTC-USD')."""
@@ -3036,7 +3160,24 @@ class DataManager:
 
     @staticmethod
     def get_fundamentals(ticker: str) -> Dict[str, Any]:
-        """Return simple fundamentals like PE ratios via yfinance."""
+        """Return simple fundamentals like PE ratios via yfinance.
+
+        Results are cached per ticker (fundamentals don't move intraday); override the
+        TTL with FUNDAMENTALS_CACHE_TTL (seconds).
+        """
+        ttl_default = 900.0  # seconds
+        try:
+            ttl_env = os.getenv('FUNDAMENTALS_CACHE_TTL')
+            if ttl_env:
+                ttl_default = float(ttl_env)
+        except Exception:
+            pass
+
+        now_ts = time.time()
+        cached = DataManager._fundamentals_cache.get(ticker)
+        if cached and (now_ts - cached[0] <= ttl_default):
+            return cached[1]
+
         out = {}
         try:
             tk = yf.Ticker(ticker)
@@ -3046,7 +3187,9 @@ class DataManager:
             out['pegRatio'] = info.get('pegRatio')
             out['marketCap'] = info.get('marketCap')
         except Exception:
-            pass
+            return out
+
+        DataManager._fundamentals_cache[ticker] = (now_ts, out)
         return out
 
     @staticmethod
@@ -3173,6 +3316,21 @@ class DataManager:
 class NewsAnalyzer:
     """Fetches and analyzes market news."""
     
+    # (ticker, limit) -> (fetched_at, items); headlines only move every few minutes
+    _news_cache: Dict[Tuple[str, int], Tuple[float, List[NewsItem]]] = {}
+    
+    @staticmethod
+    def get_news_cached(ticker: str, limit: int = 10, ttl: float = 300.0) -> List[NewsItem]:
+        """get_news with a wall-clock TTL cache (5 minutes by default)."""
+        key = (ticker.upper(), limit)
+        now = time.time()
+        cached = NewsAnalyzer._news_cache.get(key)
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        items = NewsAnalyzer.get_news(ticker, limit=limit)
+        NewsAnalyzer._news_cache[key] = (now, items)
+        return items
+    
     @staticmethod
     def get_news(ticker: str, limit: int = 10) -> List[NewsItem]:
         """Get news headlines from all sources for the last 7 days relevant to a ticker."""
@@ -3188,6 +3346,31 @@ class NewsAnalyzer:
             now_utc = datetime.now(timezone.utc)
             cutoff_utc = now_utc - timedelta(days=7)
             
+            # Fire the source requests up front so their round-trips overlap each other and
+            # the company-name lookup; each method below still parses in priority order
+            poly_key = os.getenv('POLYGON_API_KEY')
+            fh_key = os.getenv('FINNHUB_API_KEY')
+            av_key = os.getenv('ALPHAVANTAGE_API_KEY')
+            nd_key = os.getenv('NEWSDATA_API_KEY')
+            yahoo_headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+            }
+            news_pool = ThreadPoolExecutor(max_workers=5, thread_name_prefix='news')
+            poly_future = news_pool.submit(
+                requests.get, f"https://api.polygon.io/v2/reference/news?query={ticker}&limit={limit*3}&apiKey={poly_key}", timeout=8
+            ) if poly_key else None
+            fh_future = news_pool.submit(
+                requests.get, f"https://finnhub.io/api/v1/company-news?symbol={ticker}&token={fh_key}&limit={limit*3}", timeout=8
+            ) if fh_key else None
+            av_future = news_pool.submit(
+                requests.get, f"https://www.alphavantage.co/query?function=NEWS_SENTIMENT&tickers={ticker}&apikey={av_key}&limit={limit*3}", timeout=8
+            ) if av_key else None
+            yahoo_future = news_pool.submit(
+                requests.get, f"https://finance.yahoo.com/quote/{ticker}/news", headers=yahoo_headers, timeout=10
+            )
+            
             # Try to resolve company name for more accurate relevance filtering
             company_name = ""
             try:
@@ -3208,6 +3391,22 @@ class NewsAnalyzer:
             cleaned_company = _clean_company_name(company_name)
             company_tokens = [t for t in re.split(r"\s+", cleaned_company) if t]
             
+            # NewsData's query includes the company name, so it goes out once that is known
+            nd_future = None
+            if nd_key:
+                q_terms = [ticker_upper]
+                if cleaned_company:
+                    q_terms.append(f'"{cleaned_company}"')
+                params = {
+                    'q': " OR ".join(q_terms),
+                    'apikey': nd_key,
+                    'language': 'en',
+                    'sort': 'recent',
+                    'limit': min(limit * 4, 50)
+                }
+                nd_future = news_pool.submit(requests.get, "https://newsdata.io/api/1/news", params=params, timeout=10)
+            news_pool.shutdown(wait=False)
+            
             def _parse_date(val: Any) -> Optional[datetime]:
                 """Parse a date from multiple API formats, returning UTC datetime if possible."""
                 if val is None:
@@ -3271,10 +3470,8 @@ class NewsAnalyzer:
             
             # Method 1: Polygon.io News API - BEST FOR TICKER-SPECIFIC
             try:
-                poly_key = os.getenv('POLYGON_API_KEY')
-                if poly_key:
-                    url = f"https://api.polygon.io/v2/reference/news?query={ticker}&limit={limit*3}&apiKey={poly_key}"
-                    response = requests.get(url, timeout=8)
+                if poly_future is not None:
+                    response = poly_future.result()
                     if response.status_code == 200:
                         data = response.json()
                         if data.get('status') == 'OK' and 'results' in data:
@@ -3314,10 +3511,8 @@ class NewsAnalyzer:
             
             # Method 2: Finnhub News API - TICKER-SPECIFIC
             try:
-                fh_key = os.getenv('FINNHUB_API_KEY')
-                if fh_key:
-                    url = f"https://finnhub.io/api/v1/company-news?symbol={ticker}&token={fh_key}&limit={limit*3}"
-                    response = requests.get(url, timeout=8)
+                if fh_future is not None:
+                    response = fh_future.result()
                     if response.status_code == 200:
                         items = response.json()
                         if items and isinstance(items, list):
@@ -3355,10 +3550,8 @@ class NewsAnalyzer:
             
             # Method 3: AlphaVantage News API
             try:
-                av_key = os.getenv('ALPHAVANTAGE_API_KEY')
-                if av_key:
-                    url = f"https://www.alphavantage.co/query?function=NEWS_SENTIMENT&tickers={ticker}&apikey={av_key}&limit={limit*3}"
-                    response = requests.get(url, timeout=8)
+                if av_future is not None:
+                    response = av_future.result()
                     if response.status_code == 200:
                         data = response.json()
                         items = data.get('feed', [])
@@ -3397,20 +3590,8 @@ class NewsAnalyzer:
 
             # Method 4: NewsData.io (general) - filter by relevance and recency
             try:
-                nd_key = os.getenv('NEWSDATA_API_KEY')
-                if nd_key:
-                    url = "https://newsdata.io/api/1/news"
-                    q_terms = [ticker_upper]
-                    if cleaned_company:
-                        q_terms.append(f'"{cleaned_company}"')
-                    params = {
-                        'q': " OR ".join(q_terms),
-                        'apikey': nd_key,
-                        'language': 'en',
-                        'sort': 'recent',
-                        'limit': min(limit * 4, 50)
-                    }
-                    response = requests.get(url, params=params, timeout=10)
+                if nd_future is not None:
+                    response = nd_future.result()
                     if response.status_code == 200:
                         data = response.json()
                         items = data.get('results', [])
@@ -3446,15 +3627,7 @@ class NewsAnalyzer:
             try:
                 from bs4 import BeautifulSoup
                 
-                news_url = f"https://finance.yahoo.com/quote/{ticker}/news"
-                
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                }
-                
-                response = requests.get(news_url, headers=headers, timeout=10)
+                response = yahoo_future.result()
                 
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.content, 'html.parser')
@@ -4638,6 +4811,67 @@ class SECAnalyzer:
 # QUANTITATIVE FACTOR MODELS
 # ==========================================
 
+@njit(cache=True)
+def _momentum_loop(closes: np.ndarray, lookback: int) -> float:
+    """Compounded simple return over the last `lookback` bar-to-bar returns."""
+    n = closes.shape[0]
+    growth = 1.0
+    for i in range(max(1, n - lookback), n):
+        r = closes[i] / closes[i - 1]
+        if not np.isnan(r):
+            growth *= r
+    return growth - 1.0
+
+
+@njit(cache=True)
+def _zscore_loop(closes: np.ndarray, window: int) -> Tuple[float, bool]:
+    """Z-score of the last close vs its rolling mean, plus a close/SMA crossing test.
+
+    Expects len(closes) >= window. Returns (0.0, False) when the window is flat. Like
+    rolling(window), a NaN close only blanks the SMA of the windows that contain it.
+    """
+    n = closes.shape[0]
+    running = 0.0  # sum of the non-NaN closes in the window
+    nans = 0
+    prev_above = False
+    crossings = 0
+    for i in range(n):
+        if np.isnan(closes[i]):
+            nans += 1
+        else:
+            running += closes[i]
+        if i >= window:
+            if np.isnan(closes[i - window]):
+                nans -= 1
+            else:
+                running -= closes[i - window]
+        above = False
+        if i >= window - 1 and nans == 0:
+            above = closes[i] > running / window
+        if i > 0 and above != prev_above:
+            crossings += 1
+        prev_above = above
+
+    # Last window summed directly: exact, and NaN if it holds a NaN (as rolling gives)
+    mean = 0.0
+    for i in range(n - window, n):
+        mean += closes[i]
+    mean /= window
+    var = 0.0
+    for i in range(n - window, n):
+        var += (closes[i] - mean) ** 2
+    std = math.sqrt(var / (window - 1))
+    if std == 0:
+        return 0.0, False
+    return (closes[n - 1] - mean) / std, crossings > (n / window) * 0.5
+
+
+def _ohlcv_arrays(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Float64 column arrays for the OHLCV columns present in df (extract once, reuse)."""
+    return {c: np.asarray(df[c], dtype=np.float64).ravel()
+            for c in ('Open', 'High', 'Low', 'Close', 'Volume') if c in df.columns}
+
+
 class FactorModels:
     """Advanced factor analysis: Fama-French, momentum, value, quality."""
     
@@ -4652,17 +4886,19 @@ class FactorModels:
         return np.log(df['Close'] / df['Close'].shift(1))
     
     @staticmethod
-    def calculate_momentum_factor(df: pd.DataFrame, lookback: int = 126) -> float:
+    def calculate_momentum_factor(df: pd.DataFrame, lookback: int = 126,
+                                  closes: Optional[np.ndarray] = None) -> float:
         """
         Momentum factor: cumulative return over lookback period.
         126 days ≈ 6 months (standard momentum period).
+        Pass `closes` to reuse an already-extracted float64 close array.
         """
-        if len(df) < lookback:
+        if closes is None:
+            closes = np.asarray(df['Close'], dtype=np.float64).ravel()
+        if len(closes) < lookback:
             return 0.0
         
-        returns = FactorModels.calculate_returns(df)
-        momentum = (1 + returns.tail(lookback)).prod() - 1
-        return float(momentum)
+        return float(_momentum_loop(closes, lookback))
     
     @staticmethod
     def calculate_volatility_factor(df: pd.DataFrame, window: int = 20) -> float:
@@ -4728,25 +4964,20 @@ class FactorModels:
         return (values - mean) / std
     
     @staticmethod
-    def detect_mean_reversion(df: pd.DataFrame, window: int = 20) -> Tuple[float, bool]:
+    def detect_mean_reversion(df: pd.DataFrame, window: int = 20,
+                              closes: Optional[np.ndarray] = None) -> Tuple[float, bool]:
         """
         Detect mean reversion using Bollinger Bands + Hurst exponent approximation.
         Returns: (z_score, is_mean_reverting)
         """
-        close = df['Close']
-        sma = close.rolling(window).mean()
-        std = close.rolling(window).std()
-        
-        if len(close) < window or std.iloc[-1] == 0:
+        if closes is None:
+            closes = np.asarray(df['Close'], dtype=np.float64).ravel()
+        if len(closes) < window:
             return 0.0, False
         
-        # Z-score: how many std devs from mean
-        z_score = (close.iloc[-1] - sma.iloc[-1]) / std.iloc[-1]
-        
-        # Simple mean reversion check: price oscillates around SMA
-        crossings = ((close > sma).astype(int).diff().abs().sum())
-        is_reverting = crossings > (len(close) / window) * 0.5  # At least 0.5 crosses per window
-        
+        # Z-score vs the rolling SMA, and whether price oscillates around it
+        # (at least 0.5 close/SMA crossings per window)
+        z_score, is_reverting = _zscore_loop(closes, window)
         return float(z_score), bool(is_reverting)
     
     @staticmethod
@@ -5751,6 +5982,35 @@ IMPORTANT: Use real numbers throughout - include stock prices, percentage change
             "opportunities": []
         }
 
+
+def _theme_cache_file(theme: str) -> Path:
+    """results/.themes/<normalized theme>.json: case and whitespace don't split entries."""
+    key = ' '.join(theme.lower().split())
+    return RESULTS_DIR / '.themes' / (re.sub(r'[^\w.-]', '_', key) + '.json')
+
+
+def _load_theme_research(theme: str, max_age: float) -> Optional[Dict[str, Any]]:
+    """Cached research for `theme` if it was saved less than `max_age` seconds ago."""
+    cache_file = _theme_cache_file(theme)
+    try:
+        if time.time() - cache_file.stat().st_mtime < max_age:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _save_theme_research(theme: str, research: Dict[str, Any]) -> None:
+    """Store `research` as the cached result for `theme` (best effort)."""
+    cache_file = _theme_cache_file(theme)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(research, f)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Theme research cache write failed for {cache_file}: {e}")
+
 # ==========================================
 # REGIME DETECTION & MULTI-TIMEFRAME
 # ==========================================
@@ -5759,25 +6019,26 @@ class RegimeDetector:
     """Detect market regime: Trending/Ranging/Volatile."""
     
     @staticmethod
-    def detect_regime(df: pd.DataFrame, indicators: AdvancedIndicators) -> MarketRegime:
-        """Classify current market regime."""
+    def detect_regime(df: pd.DataFrame, indicators: AdvancedIndicators,
+                      arrs: Optional[Dict[str, np.ndarray]] = None) -> MarketRegime:
+        """Classify current market regime. `arrs` may carry pre-extracted OHLCV arrays."""
         try:
             adx = indicators.adx
             atr = indicators.atr
-            close = df['Close'].values
-            
-            # Calculate ATR percentile (last 50 periods)
-            recent_atr = []
-            for i in range(max(0, len(df) - 50), len(df)):
-                if i >= 14:
-                    tr = max(df['High'].iloc[i] - df['Low'].iloc[i],
-                            abs(df['High'].iloc[i] - df['Close'].iloc[i-1]),
-                            abs(df['Low'].iloc[i] - df['Close'].iloc[i-1]))
-                    recent_atr.append(tr)
-            
+            if arrs is None:
+                arrs = _ohlcv_arrays(df)
+            close = arrs['Close']
+            high = arrs['High']
+            low = arrs['Low']
+            n = len(close)
+            
+            # Calculate ATR percentile (true range over the last 50 periods)
             atr_percentile = 50.0
-            if len(recent_atr) > 0:
-                atr_percentile = (sum(1 for x in recent_atr if x < atr) / len(recent_atr)) * 100
+            start = max(14, n - 50)
+            if start < n:
+                h, l, prev_c = high[start:], low[start:], close[start - 1:n - 1]
+                recent_atr = np.maximum(h - l, np.maximum(np.abs(h - prev_c), np.abs(l - prev_c)))
+                atr_percentile = float(np.count_nonzero(recent_atr < atr)) / len(recent_atr) * 100
             
             # Trend strength using linear regression
             x = np.arange(len(close[-50:]))
@@ -6229,6 +6490,169 @@ class TechnicalAnalyzer:
             logger.exception("Full traceback:")
             return None
 
+    # EMA spans carried by the intrabar state (20 = Keltner middle)
+    _INTRABAR_EMA_SPANS = (8, 12, 20, 21, 26, 34, 50, 200)
+
+    @staticmethod
+    def intrabar_state(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        """Capture the recursive/rolling state as of the bar *before* the last one.
+
+        Lets `update_intrabar` re-price the last (still forming) candle in O(1)
+        instead of re-running `calculate_indicators` over the whole frame.
+        Returns None when there is too little history for the fast path.
+        """
+        try:
+            close, high, low = df['Close'], df['High'], df['Low']
+            if isinstance(close, pd.DataFrame):
+                close = close.iloc[:, 0]
+            if isinstance(high, pd.DataFrame):
+                high = high.iloc[:, 0]
+            if isinstance(low, pd.DataFrame):
+                low = low.iloc[:, 0]
+            n = len(close)
+            if n < 60:
+                return None
+
+            c = close.to_numpy(dtype=np.float64)
+            h = high.to_numpy(dtype=np.float64)
+            l = low.to_numpy(dtype=np.float64)
+
+            emas = {span: close.ewm(span=span, adjust=False).mean() for span in TechnicalAnalyzer._INTRABAR_EMA_SPANS}
+            macd_sig = (emas[12] - emas[26]).ewm(span=9, adjust=False).mean()
+
+            delta = close.diff()
+            rsi_prev = {}
+            for period in (14, 7):
+                gain = delta.clip(lower=0).ewm(alpha=1/period, min_periods=period, adjust=False).mean()
+                loss = (-delta.clip(upper=0)).ewm(alpha=1/period, min_periods=period, adjust=False).mean()
+                rsi_prev[period] = (float(gain.iloc[-2]), float(loss.iloc[-2]))
+
+            stoch_period = min(14, n - 1)
+            low_14 = low.rolling(stoch_period).min()
+            high_14 = high.rolling(stoch_period).max()
+            stoch_k = 100 * ((close - low_14) / (high_14 - low_14).replace(0, 1e-10))
+
+            def hl_prefix(period):
+                # Max high / min low of the window ending at the last bar, excluding that bar
+                return float(h[-period:-1].max()), float(l[-period:-1].min())
+
+            roc_n = min(12, n - 1)
+            return {
+                'prev_close': float(c[-2]),
+                'sma_sums': {w: float(c[-w:-1].sum()) for w in (10, 20, 50, min(200, n))},
+                'sma200_window': min(200, n),
+                'bb_window': c[-20:-1].copy(),
+                'ema_prev': {span: float(s_.iloc[-2]) for span, s_ in emas.items()},
+                'macd_signal_prev': float(macd_sig.iloc[-2]),
+                'rsi_prev': rsi_prev,
+                'stoch_hl': hl_prefix(stoch_period),
+                'stoch_k_prev': (float(stoch_k.iloc[-3]), float(stoch_k.iloc[-2])),
+                'tenkan_hl': hl_prefix(9),
+                'kijun_hl': hl_prefix(26),
+                'senkou_b_hl': hl_prefix(52),
+                'roc_base': float(c[-1 - roc_n]),
+            }
+        except Exception as e:
+            logger.debug(f"Intrabar state error: {e}")
+            return None
+
+    @staticmethod
+    def update_intrabar(indicators: AdvancedIndicators, state: Dict[str, Any],
+                        close: float, high: float, low: float) -> AdvancedIndicators:
+        """Return `indicators` re-priced for a new tick on the still-forming last bar.
+
+        Close-driven indicators (SMA/EMA/MACD/RSI/Bollinger/Stochastic/Williams %R/ROC/
+        Ichimoku/Keltner middle) are updated from `state`; volume- and TR-based ones
+        (ADX, ATR, CCI, MFI, OBV, VWAP, HMA) keep their values from the last full calc.
+        """
+        prev_close = state['prev_close']
+
+        sums = state['sma_sums']
+        sma = {w: (sums[w] + close) / w for w in sums}
+        sma_200 = sma[state['sma200_window']]
+
+        ema = {}
+        for span, prev in state['ema_prev'].items():
+            alpha = 2.0 / (span + 1)
+            ema[span] = alpha * close + (1 - alpha) * prev
+        macd_line = ema[12] - ema[26]
+        macd_signal = (2.0 / 10) * macd_line + (1 - 2.0 / 10) * state['macd_signal_prev']
+
+        delta = close - prev_close
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        rsi = {}
+        for period, (avg_gain, avg_loss) in state['rsi_prev'].items():
+            a = 1.0 / period
+            avg_gain = (1 - a) * avg_gain + a * gain
+            avg_loss = (1 - a) * avg_loss + a * loss
+            rs = avg_gain / (avg_loss if avg_loss != 0 else 1e-10)
+            val = 100 - (100 / (1 + rs))
+            rsi[period] = 50.0 if math.isnan(val) else min(100.0, max(0.0, val))
+
+        bb_vals = np.append(state['bb_window'], close)
+        bb_mid = float(bb_vals.mean())
+        bb_std = float(bb_vals.std(ddof=1))
+
+        hh, ll = state['stoch_hl']
+        hh, ll = max(hh, high), min(ll, low)
+        rng = hh - ll
+        stoch_k = 100 * (close - ll) / (rng if rng != 0 else 1e-10)
+        k_prev = state['stoch_k_prev']
+        stoch_d = (k_prev[0] + k_prev[1] + stoch_k) / 3
+        if math.isnan(stoch_d):
+            stoch_d = 50.0
+        williams_r = -100 * (hh - close) / (rng if rng != 0 else 1)
+
+        def midpoint(key):
+            p_hi, p_lo = state[key]
+            return (max(p_hi, high) + min(p_lo, low)) / 2
+
+        tenkan_sen = midpoint('tenkan_hl')
+        kijun_sen = midpoint('kijun_hl')
+
+        roc_base = state['roc_base']
+        roc_12 = (close - roc_base) / (roc_base if roc_base != 0 else 1) * 100
+
+        kc_width = indicators.keltner_upper - indicators.keltner_middle
+        return replace(
+            indicators,
+            price=round(close, 2),
+            close=round(close, 2),
+            high=round(high, 2),
+            low=round(low, 2),
+            sma_10=round(sma[10], 2),
+            sma_20=round(sma[20], 2),
+            sma_50=round(sma[50], 2),
+            sma_200=round(sma_200, 2),
+            ema_8=round(ema[8], 2),
+            ema_12=round(ema[12], 2),
+            ema_21=round(ema[21], 2),
+            ema_26=round(ema[26], 2),
+            ema_34=round(ema[34], 2),
+            ema_50=round(ema[50], 2),
+            ema_200=round(ema[200], 2),
+            macd=round(macd_line, 4),
+            macd_signal=round(macd_signal, 4),
+            macd_histogram=round(macd_line - macd_signal, 4),
+            rsi_14=round(rsi[14], 2),
+            rsi_7=round(rsi[7], 2),
+            bb_upper=round(bb_mid + 2 * bb_std, 2),
+            bb_middle=round(bb_mid, 2),
+            bb_lower=round(bb_mid - 2 * bb_std, 2),
+            stochastic_k=round(stoch_k, 2),
+            stochastic_d=round(stoch_d, 2),
+            williams_r=round(williams_r, 2),
+            roc_12=round(roc_12, 2),
+            tenkan_sen=round(tenkan_sen, 2),
+            kijun_sen=round(kijun_sen, 2),
+            senkou_a=round((tenkan_sen + kijun_sen) / 2, 2),
+            senkou_b=round(midpoint('senkou_b_hl'), 2),
+            keltner_middle=round(ema[20], 2),
+            keltner_upper=round(ema[20] + kc_width, 2),
+            keltner_lower=round(ema[20] - kc_width, 2),
+            atr_percent=round((indicators.atr / close) * 100 if close > 0 else 0, 2),
+        )
+
 class PatternRecognizer:
     """Detect chart patterns."""
     
@@ -8328,6 +8752,356 @@ class DisplayManager:
         console.print(f"           {'+' + '-'*len(curve) + '+'}")
         console.print(f"           Start{' '*(len(curve)-10)}End\n")
 
+# ==========================================
+# LIVE SCAN HELPERS
+# ==========================================
+
+@njit(cache=True)
+def _confirm_micro(action: int, mr: float, vdev: float, tr: float, age: float) -> bool:
+    """Crypto microstructure gate: action 0 = BUY, 1 = SELL. Needs fresh ticks
+    (rate >= 0.5/s, last tick <= 3s old) with 5s momentum and VWAP deviation agreeing."""
+    if action == 0:
+        return (mr > 0.05) and (vdev <= 0.6) and (tr >= 0.5) and (age <= 3.0)
+    return (mr < -0.05) and (vdev >= -0.6) and (tr >= 0.5) and (age <= 3.0)
+
+
+def _compute_atr14(highs: np.ndarray, lows: np.ndarray) -> float:
+    """14-bar high-low range used for live-scan stops (last bar's range as fallback)."""
+    if len(highs) >= 14:
+        atr = float(highs[-14:].max() - lows[-14:].min())
+        if atr != 0 and not np.isnan(atr):
+            return atr
+    return float(highs[-1] - lows[-1])
+
+
+def _shared_features(closes: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+                     live_price: float) -> Dict[str, Any]:
+    """Close-derived values used by both the live-scan factor boost and
+    `MLSignalWeighter.engineer_features`, computed once per tick. `closes` already
+    ends with the live tick; `highs`/`lows` are the bar's and are widened to it."""
+    z_score, is_reverting = FactorModels.detect_mean_reversion(None, closes=closes)
+    return {
+        'closes': closes,
+        'returns': pd.Series(closes).pct_change(),
+        'momentum_126': FactorModels.calculate_momentum_factor(None, 126, closes=closes),
+        'zscore_20': z_score,
+        'reverting_20': is_reverting,
+        'high_20': max(float(highs[-20:].max()), live_price),
+        'low_20': min(float(lows[-20:].min()), live_price),
+    }
+
+
+# Live-scan price-source debug line (formatted only when debug_price_source is on)
+_DBG_PRICE_FMT = "[dim]Price source: {} | Price: ${:.4f}{}{}[/dim]"
+
+# Live-scan position status line; color and side label come from lookup tables
+_POS_STATUS_FMT = "[{c}]💼 {t} ({s}) | Entry: ${e:.2f} | Current: ${p:.2f} | P&L: {pl:+.2f}%[/{c}]"
+_PNL_COLORS = {True: "green", False: "red"}
+_SIDE_LABELS = {1: "LONG", -1: "SHORT"}
+
+# Entry prompts shared by the LONG and SHORT branches
+_TRAILING_PROMPT = "[cyan]Enable trailing stop?[/cyan]"
+_TRADE_ACTION_PROMPT = "[bold]Trade action[/bold]"
+
+
+def _rsi_cross_signals(close: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Replay fallback signals from a 14-bar simple-average RSI: buy when it crosses up
+    through 30, sell when it crosses down through 70, score = (RSI - 50) / 50."""
+    close = np.asarray(close, dtype=float)
+    rsi = np.full(len(close), 50.0)
+    if len(close) > 14:
+        delta = np.diff(close)
+        # Mean of each full 14-delta window; NaN in a window propagates like rolling(14).mean()
+        gain = np.lib.stride_tricks.sliding_window_view(np.clip(delta, 0, None), 14).mean(axis=1)
+        loss = np.lib.stride_tricks.sliding_window_view(np.clip(-delta, 0, None), 14).mean(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            vals = 100 - (100 / (1 + gain / np.where(loss == 0, np.nan, loss)))
+        rsi[14:] = np.where(np.isnan(vals), 50.0, vals)
+    prev = np.concatenate(([np.nan], rsi[:-1]))
+    buy = ((prev < 30) & (rsi >= 30)).astype(int)
+    sell = ((prev > 70) & (rsi <= 70)).astype(int)
+    return buy, sell, (rsi - 50) / 50.0
+
+
+@dataclass
+class PositionState:
+    """A real position opened from the live scanner's entry prompt."""
+    side: str  # 'LONG' or 'SHORT'
+    side_sign: int  # +1 LONG, -1 SHORT
+    entry_price: float
+    stop_loss: float
+    take_profit: float
+    entry_time: str
+    confidence: float
+    use_trailing_stop: bool = False
+    trail_extreme: Optional[float] = None
+    trailing_distance: Optional[float] = None
+
+# Signal-chart level lines: (signal key, color, legend label template)
+_SIGNAL_LEVELS = (
+    ('entry_price', 'cyan', 'Entry: $%.2f'),
+    ('stop_loss', 'red', 'Stop: $%.2f'),
+    ('take_profit_1', 'green', 'TP1: $%.2f'),
+)
+
+# (Figure, axes) reused by every signal-switch render; only the chart thread touches it
+_signal_chart_fig: Optional[Tuple[Any, Any]] = None
+
+
+def _signal_chart_figure():
+    """Return the shared signal-chart Figure and axes, with the axes cleared."""
+    global _signal_chart_fig
+    if _signal_chart_fig is None:
+        fig = Figure(figsize=(16, 12))
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(3, 1, gridspec_kw={'height_ratios': [3, 1, 1]})
+        _signal_chart_fig = (fig, axes)
+    else:
+        fig, axes = _signal_chart_fig
+        for ax in axes:
+            ax.cla()
+    return fig, axes
+
+
+# (Figure, axes) reused by every analysis-chart render; Agg canvas, no pyplot registry
+_analysis_chart_fig: Optional[Tuple[Any, Any]] = None
+
+
+def _analysis_chart_figure():
+    """Return the shared analysis-chart Figure and axes, cleared of the last render."""
+    global _analysis_chart_fig
+    if _analysis_chart_fig is None:
+        fig = Figure(figsize=(18, 11), facecolor='#0f0f0f')
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        _analysis_chart_fig = (fig, ax)
+    else:
+        fig, ax = _analysis_chart_fig
+        ax.cla()
+        for text in list(fig.texts):
+            text.remove()
+    return fig, ax
+
+
+def _render_signal_chart(ticker: str, bars_live: pd.DataFrame, signal: Dict[str, Any],
+                         current_price: float, chart_path: Path) -> Path:
+    """Render the live-scan signal-switch chart to `chart_path`.
+
+    Runs on the live scanner's chart thread, so it only touches plain data and an
+    Agg-backed Figure (no pyplot global state).
+    """
+    fig, axes = _signal_chart_figure()
+    fig.patch.set_facecolor('#0E1117')
+    
+    # Price chart with candlesticks
+    ax_price = axes[0]
+    ax_price.set_facecolor('#0E1117')
+    
+    # Plot candlesticks
+    candle_width = 0.8
+    plot_df = bars_live.tail(200).reset_index(drop=True)
+    for idx, row in plot_df.iterrows():
+        x = idx
+        open_price = row.get('Open', row['Close'])
+        high = row.get('High', row['Close'])
+        low = row.get('Low', row['Close'])
+        close = row.get('Close', row['Close'])
+        
+        is_bullish = close >= open_price
+        color = '#00ff00' if is_bullish else '#ff0000'
+        
+        # Wick
+        ax_price.plot([x, x], [low, high], color=color, linewidth=1.5, alpha=0.9)
+        
+        # Body
+        body_height = abs(close - open_price)
+        body_bottom = min(open_price, close)
+        if body_height < close * 0.0001:
+            body_height = close * 0.0001
+        
+        if is_bullish:
+            rect = Rectangle((x - candle_width/2, body_bottom), candle_width, body_height,
+                           facecolor='#0a0a0a', edgecolor=color, linewidth=1.5, alpha=0.9)
+        else:
+            rect = Rectangle((x - candle_width/2, body_bottom), candle_width, body_height,
+                           facecolor=color, edgecolor=color, linewidth=1.5, alpha=0.9)
+        ax_price.add_patch(rect)
+    
+    ax_price.set_xlim(-0.5, len(plot_df) - 0.5)
+    
+    # Add moving averages on top of candlesticks
+    if 'SMA_20' in bars_live.columns:
+        sma20_plot = bars_live['SMA_20'].tail(200).reset_index(drop=True)
+        ax_price.plot(range(len(sma20_plot)), sma20_plot, label='SMA 20', alpha=0.7, color='orange', linewidth=1.5)
+    if 'SMA_50' in bars_live.columns:
+        sma50_plot = bars_live['SMA_50'].tail(200).reset_index(drop=True)
+        ax_price.plot(range(len(sma50_plot)), sma50_plot, label='SMA 50', alpha=0.7, color='red', linewidth=1.5)
+    
+    # Mark entry/SL/TP
+    for key, color, label in _SIGNAL_LEVELS:
+        level = signal[key]
+        ax_price.axhline(y=level, color=color, linestyle='--', label=label % level, linewidth=1.5)
+    
+    # Highlight current price (at last candle)
+    ax_price.scatter([len(plot_df) - 1], [current_price], color='yellow', s=150, zorder=5, label=f'Signal Switch')
+    
+    ax_price.set_title('%s - %s (%.0f%%)' % (ticker, signal['action'], signal['confidence']), fontsize=14, fontweight='bold', pad=20, color='white')
+    ax_price.set_ylabel('Price ($)', fontsize=11, color='white')
+    ax_price.legend(loc='best', fontsize=9, facecolor='#1a1a1a', edgecolor='cyan')
+    ax_price.grid(True, alpha=0.3, color='#333333')
+    ax_price.tick_params(colors='white')
+    
+    # Omit supporting signals block to keep chart clean
+    
+    # RSI chart
+    ax_rsi = axes[1]
+    ax_rsi.set_facecolor('#0E1117')
+    if 'RSI' in bars_live.columns:
+        ax_rsi.plot(bars_live.index, bars_live['RSI'], label='RSI', color='purple', linewidth=1.5)
+        ax_rsi.axhline(y=70, color='red', linestyle='--', alpha=0.5, label='Overbought')
+        ax_rsi.axhline(y=30, color='green', linestyle='--', alpha=0.5, label='Oversold')
+        ax_rsi.fill_between(bars_live.index, 30, 70, alpha=0.1, color='gray')
+    ax_rsi.set_ylabel('RSI', fontsize=11, color='white')
+    ax_rsi.legend(loc='best', fontsize=9, facecolor='#1a1a1a')
+    ax_rsi.grid(True, alpha=0.3, color='#333333')
+    ax_rsi.set_ylim(0, 100)
+    ax_rsi.tick_params(colors='white')
+    
+    # Volume chart
+    ax_vol = axes[2]
+    ax_vol.set_facecolor('#0E1117')
+    colors = np.where(bars_live['Close'].to_numpy() >= bars_live['Open'].to_numpy(), 'green', 'red')
+    ax_vol.bar(bars_live.index, bars_live['Volume'], color=colors, alpha=0.6)
+    ax_vol.set_ylabel('Volume', fontsize=11, color='white')
+    ax_vol.set_xlabel('Time', fontsize=11, color='white')
+    ax_vol.grid(True, alpha=0.3, color='#333333')
+    ax_vol.tick_params(colors='white')
+    
+    fig.tight_layout()
+    fig.savefig(chart_path, dpi=150, bbox_inches='tight', facecolor='#0E1117')
+    return chart_path
+
+
+def _sleep_or_enter(max_sleep: float) -> bool:
+    """Wait up to `max_sleep` seconds between scans; return True as soon as Enter is
+    pressed. Blocks in the OS (select / WaitForSingleObject) rather than polling."""
+    deadline = time.monotonic() + max_sleep
+    try:
+        import msvcrt
+    except ImportError:
+        msvcrt = None
+
+    if msvcrt is None:
+        try:
+            import select
+            if not sys.stdin.isatty():
+                raise OSError("stdin is not a terminal")
+            ready, _, _ = select.select([sys.stdin], [], [], max_sleep)
+            if ready:
+                sys.stdin.readline()
+                return True
+            return False
+        except Exception:
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            return False
+
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class _KeyEventRecord(ctypes.Structure):
+            _fields_ = [('bKeyDown', wintypes.BOOL), ('wRepeatCount', wintypes.WORD),
+                        ('wVirtualKeyCode', wintypes.WORD), ('wVirtualScanCode', wintypes.WORD),
+                        ('uChar', wintypes.WCHAR), ('dwControlKeyState', wintypes.DWORD)]
+
+        class _InputRecord(ctypes.Structure):
+            # KEY_EVENT_RECORD is the largest member of the event union, so this is full size
+            _fields_ = [('EventType', wintypes.WORD), ('KeyEvent', _KeyEventRecord)]
+
+        kernel32 = ctypes.windll.kernel32
+        kernel32.WaitForSingleObject.restype = ctypes.c_uint32
+        handle = kernel32.GetStdHandle(-10)  # STD_INPUT_HANDLE
+        mode = wintypes.DWORD()
+        is_console = bool(kernel32.GetConsoleMode(handle, ctypes.byref(mode)))
+    except Exception:
+        is_console = False
+    if not is_console:
+        # Redirected stdin is always signalled; waiting on it would spin
+        time.sleep(max(0.0, deadline - time.monotonic()))
+        return False
+
+    record = _InputRecord()
+    count = wintypes.DWORD()
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        # The console handle is signalled by any input event, not just keys
+        result = kernel32.WaitForSingleObject(handle, int(remaining * 1000))
+        if result == 0xFFFFFFFF:  # WAIT_FAILED
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            return False
+        if result != 0:  # WAIT_TIMEOUT
+            continue
+        try:
+            if not kernel32.PeekConsoleInputW(handle, ctypes.byref(record), 1, ctypes.byref(count)):
+                time.sleep(max(0.0, deadline - time.monotonic()))
+                return False
+            if count.value == 0:
+                continue
+            key = record.KeyEvent
+            if record.EventType != 0x0001 or not key.bKeyDown or key.uChar == '\0' or not msvcrt.kbhit():
+                # Mouse/focus/resize, key-up or non-character event at the head: read it off
+                # so the handle is not left signalled; character keys stay queued for getch
+                kernel32.ReadConsoleInputW(handle, ctypes.byref(record), 1, ctypes.byref(count))
+                continue
+            if msvcrt.getch() in (b"\r", b"\n"):
+                # Flush any additional buffered keys
+                while msvcrt.kbhit():
+                    msvcrt.getch()
+                return True
+        except Exception:
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            return False
+
+
+# Managed chart viewers (config 'chart_viewer'): per-ticker latest chart -> viewer Popen
+_signal_chart_viewers: Dict[Path, Any] = {}
+
+
+def _open_rendered_chart(fut, viewer_cmd: Optional[str] = None) -> None:
+    """Done-callback for `_render_signal_chart`: mirror the chart to a per-ticker
+    `*_signal_switch_latest.png` and show it.
+
+    With a `viewer_cmd` one viewer process is kept per ticker: a still-running viewer is
+    replaced by one on the new chart (most viewers don't reload an overwritten file), and
+    a closed one is simply reopened. The OS file association gives no process handle, so
+    without a command every new chart is opened."""
+    try:
+        chart_path = fut.result()
+    except Exception as e:
+        logger.debug(f"Signal chart render error: {e}")
+        return
+    try:
+        import shutil
+        latest_path = chart_path.with_name(chart_path.name.rsplit('_signal_switch_', 1)[0] + '_signal_switch_latest.png')
+        shutil.copyfile(chart_path, latest_path)
+        if not viewer_cmd:
+            os.startfile(str(chart_path))
+            return
+        import shlex
+        import subprocess
+        viewer = _signal_chart_viewers.get(latest_path)
+        if viewer is not None and viewer.poll() is None:
+            viewer.terminate()
+        _signal_chart_viewers[latest_path] = subprocess.Popen(
+            shlex.split(viewer_cmd, posix=os.name != 'nt') + [str(latest_path)]
+        )
+    except Exception:
+        pass
+
 # ==========================================
 # MAIN APPLICATION
 # ==========================================
@@ -8343,6 +9117,119 @@ class FinalAIQuantum:
         self.scanner = None
         self.paper_trading = PaperTradingManager()  # Initialize paper trading
         self.current_user = None  # Track logged in user
+        # Single worker keeps live-scan chart rendering off the scan loop
+        self._chart_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='chart')
+        # Single worker for result-file writes that shouldn't block prompts
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='io')
+        self._pending_scan_save = None
+        self._charts_dir_ready = False  # results/charts created on first signal chart
+        import threading
+        self._ml_weighter = None  # built once; loading the saved models is slow
+        self._ml_weighter_lock = threading.Lock()
+        # (kind, ticker, interval, last bar ns) -> regime / MTF result; recomputed once per bar
+        self._regime_cache: Dict[tuple, Any] = {}
+        # Long-lived append handle for ai_performance_tracking.csv; flushed in batches and
+        # always before the file is read or rewritten
+        import atexit
+        self._tracking_fh = None
+        self._tracking_csv = None
+        self._tracking_unflushed = 0
+        atexit.register(self._flush_tracking)
+    
+    def _get_ml_weighter(self) -> 'MLSignalWeighter':
+        """Return the shared MLSignalWeighter, constructing it on first use."""
+        ml_weighter = self._ml_weighter
+        if ml_weighter is None:
+            with self._ml_weighter_lock:
+                if self._ml_weighter is None:
+                    self._ml_weighter = MLSignalWeighter()
+                ml_weighter = self._ml_weighter
+        return ml_weighter
+    
+    _REGIME_CACHE_MAX = 512
+    
+    def _cached_per_bar(self, key: tuple, compute):
+        """Return the cached result for key, computing and storing it on a miss (FIFO-capped)."""
+        cache = self._regime_cache
+        if key in cache:
+            return cache[key]
+        value = compute()
+        cache[key] = value
+        if len(cache) > self._REGIME_CACHE_MAX:
+            del cache[next(iter(cache))]
+        return value
+    
+    def _early_drop(self, bars: pd.DataFrame, ticker: str) -> Optional[str]:
+        """Cheap eligibility checks run before the quant/regime stack; returns a drop reason or None."""
+        try:
+            if len(bars) < 30:
+                return f"only {len(bars)} bars"
+            vol_mean = float(bars['Volume'].iloc[-20:].mean())
+            min_volume = float(self.config.get('live_min_volume', 0) or 0)
+            if not vol_mean > 0:
+                return "no volume in last 20 bars"
+            if min_volume and vol_mean < min_volume:
+                return f"avg volume {vol_mean:,.0f} < {min_volume:,.0f}"
+            # First bar after a session/data gap: indicators still straddle the break. The gap
+            # is measured in typical bar spacings, so thinly traded tickers that skip a few
+            # minutes aren't dropped (config 'live_session_gap_bars')
+            spacing = bars.index[-30:].to_series().diff().median()
+            gap_bars = float(self.config.get('live_session_gap_bars', 60) or 60)
+            if bars.index[-1] - bars.index[-2] > spacing * gap_bars:
+                return "session boundary"
+        except Exception:
+            return None
+        return None
+    
+    def _execute_entry(self, side: str, ticker: str, current_price: float, atr: float,
+                       desired_rrr: Optional[float], confidence: float) -> Optional[PositionState]:
+        """Show a live-scan entry, ask about trailing stop and trade action, and return the
+        position to monitor when the user takes it for real (paper trades are opened here)."""
+        sign = 1 if side == 'LONG' else -1
+        # Calculate stop loss and take profit FIRST (for immediate alert); SHORT stops sit above
+        entry_price = current_price
+        stop_loss = entry_price - sign * atr * 1.5
+        stop_distance = sign * (entry_price - stop_loss)
+        take_profit = entry_price + sign * stop_distance * float(desired_rrr if desired_rrr else 2.0)
+        
+        # Clear instruction to ENTER
+        console.print(f"{ticker}: ENTER {side} {confidence:.0f}% | ${entry_price:.2f}")
+        
+        # Ask about trailing stop (follows price up for LONG, down for SHORT)
+        trailing_distance = None
+        use_trailing = Confirm.ask(_TRAILING_PROMPT, default=False)
+        if use_trailing:
+            trailing_distance = atr * 1.5
+            stop_loss = entry_price - sign * trailing_distance
+            console.print(f"[cyan]✓ Trailing stop enabled. Will follow price {'up' if sign > 0 else 'down'} by ${trailing_distance:.2f}[/cyan]\n")
+        
+        # Ask if user took the trade
+        trade_choice = Prompt.ask(_TRADE_ACTION_PROMPT, choices=["real", "paper", "skip"], default="real")
+        
+        if trade_choice == "real":
+            console.print(f"\n[green]✓ {'Real trade' if sign > 0 else 'SHORT'} tracked. Monitoring {ticker} position...[/green]")
+            console.print(f"  Exit this scan (Ctrl+C) when ready. Will continue monitoring until exit.\n")
+            return PositionState(
+                side=side,
+                side_sign=sign,
+                entry_price=entry_price,
+                stop_loss=stop_loss,
+                take_profit=take_profit,
+                entry_time=time.strftime('%H:%M:%S'),
+                confidence=confidence,
+                use_trailing_stop=use_trailing,
+                trail_extreme=entry_price if use_trailing else None,
+                trailing_distance=trailing_distance,
+            )
+        
+        if trade_choice == "paper":
+            # Open paper trade
+            position_size_calc = int((self.config.get('account_size', 10000) * 0.02) / stop_distance)
+            self.paper_trading.open_trade(ticker, side, entry_price, stop_loss, take_profit, position_size_calc)
+            console.print("[cyan]Paper trade opened. Will track virtually.[/cyan]\n")
+        else:
+            console.print("[yellow]Trade skipped. Continuing to scan for next signal...\n")
+        return None
     
     def _validate_and_setup_api_keys(self):
         """Check for required API keys and prompt user to enter them if missing."""
@@ -12657,6 +13544,14 @@ List:"""
         
         name, universe = universe_map[choice]
         
+        # Reap the previous scan's background save before starting a new one
+        if self._pending_scan_save is not None:
+            try:
+                self._pending_scan_save.result()
+            except Exception as e:
+                logger.error(f"Scanner results save error: {e}")
+            self._pending_scan_save = None
+        
         console.print(f"\n[yellow]Scanning {name}...[/yellow]")
         
         opportunities = self.scanner.scan_universe(universe, self.config)
@@ -12668,10 +13563,28 @@ List:"""
         
         if opportunities:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = SCANNER_DIR / f"scan_{name.replace(' ', '_')}_{timestamp}.json"
+            stem = SCANNER_DIR / f"scan_{name.replace(' ', '_')}_{timestamp}"
+            records = [opp.to_dict() for opp in opportunities]
             
-            with open(filename, 'w') as f:
-                json.dump([asdict(opp) for opp in opportunities], f, indent=2)
+            # Parquet by default (compact, fast to reload); JSON if configured or pyarrow is missing
+            fmt = str(self.config.get('scanner_results_format', 'parquet')).lower()
+            if fmt == 'parquet':
+                try:
+                    import pyarrow  # noqa: F401 - pandas' parquet engine
+                except ImportError:
+                    fmt = 'json'
+            
+            # Serialize here, write on the I/O worker so the prompt isn't held up by disk
+            if fmt == 'parquet':
+                filename = stem.with_suffix('.parquet')
+                results_df = pd.DataFrame.from_records(records)
+                self._pending_scan_save = self._io_pool.submit(
+                    results_df.to_parquet, filename, compression='zstd', index=False
+                )
+            else:
+                filename = stem.with_suffix('.json')
+                payload = json.dumps(records, indent=2)
+                self._pending_scan_save = self._io_pool.submit(filename.write_text, payload)
             
             console.print(f"[dim]Results saved to: {filename}[/dim]\n")
         
@@ -12710,8 +13623,8 @@ List:"""
         stop_loss = None
         take_profit = None
         use_trailing_stop = False
-        highest_price = None  # For LONG trailing
-        lowest_price = None   # For SHORT trailing
+        side_sign = 1  # +1 LONG, -1 SHORT (set on entry)
+        trail_extreme = None  # Best price since entry (highest LONG / lowest SHORT)
         trailing_distance = None
         entry_confidence = 0
         position_size = 0.0
@@ -12720,10 +13633,37 @@ List:"""
         initial_r_distance = None
         breakeven_applied = False
 
+        # Price-source diagnostics are fixed for the whole scan
+        try:
+            debug_price = bool(self.config.get('debug_price_source', False) or os.getenv('DEBUG_PRICE_SOURCE', '0') in ['1','true','True'])
+        except Exception:
+            debug_price = False
+
+        # Intrabar view cache (see bars_live below)
+        live_src = None
+        live_frame = None
+        live_last_hl = None
+        live_ci = None
+        # Bar index timezone, resolved once per fetched frame (debug latency line)
+        bar_tz = None
+        bar_tz_src = None
+        # (last_bar_time, intrabar state, indicators from the last full calculation)
+        ind_cache = None
+        # OHLCV arrays of the fetched frame, plus its closes with the live tick as last
+        arrs_src = None
+        bar_arrs = None
+        live_closes = None
+
+        # Fundamentals are fetched alongside the bars (TTL-cached in DataManager); Greeks
+        # only when a signal is actually surfaced
+        enrich_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='enrich')
+        want_greeks = bool(analysis_options.get('include_option_flow') or debug_price)
+
         try:
             scan_count = 0
             while True:
                 scan_count += 1
+                f_funds = enrich_pool.submit(DataManager.get_fundamentals, ticker)
                 # Fetch latest data using DataManager (auto uses Polygon for 1m interval)
                 bars = DataManager.fetch_data(ticker, '5d', '1m')
 
@@ -12735,11 +13675,6 @@ List:"""
                 # Get realtime tick price when available (Polygon or yfinance)
                 current_price = None
                 price_source = 'unknown'
-                debug_price = False
-                try:
-                    debug_price = bool(self.config.get('debug_price_source', False) or os.getenv('DEBUG_PRICE_SOURCE', '0') in ['1','true','True'])
-                except Exception:
-                    debug_price = False
                 
                 try:
                     # Get current price from DataManager (uses Coinbase WS for crypto, Polygon/yfinance for stocks)
@@ -12763,13 +13698,22 @@ List:"""
                     current_price = float(bars['Close'].iloc[-1])
                     price_source = 'bar_close'
 
+                # Column arrays for the numpy helpers, extracted once per fetched frame
+                if bars is not arrs_src:
+                    bar_arrs = _ohlcv_arrays(bars)
+                    arrs_src = bars
+                    live_closes = bar_arrs['Close'].copy()
+                live_closes[-1] = float(current_price)
+
                 # Optionally show which price source was used (useful for debugging accuracy)
                 if debug_price:
                     # Compute latency diagnostics
                     try:
-                        import datetime as _dt
+                        if bars is not bar_tz_src:
+                            bar_tz = getattr(bars.index, 'tz', None)
+                            bar_tz_src = bars
                         last_bar_time = bars.index[-1]
-                        now_ts = _dt.datetime.utcnow().replace(tzinfo=bars.index.tz) if getattr(bars.index, 'tz', None) else _dt.datetime.utcnow()
+                        now_ts = datetime.now(bar_tz) if bar_tz else datetime.utcnow()
                         bar_age_sec = float((now_ts - last_bar_time).total_seconds()) if last_bar_time is not None else None
                     except Exception:
                         bar_age_sec = None
@@ -12784,7 +13728,7 @@ List:"""
                     bar_age_info = ''
                     if bar_age_sec is not None:
                         bar_age_info = f" | last_bar_age={bar_age_sec:.1f}s"
-                    console.print(f"[dim]Price source: {price_source} | Price: ${current_price:.4f}{age_info}{bar_age_info}[/dim]")
+                    console.print(_DBG_PRICE_FMT.format(price_source, current_price, age_info, bar_age_info))
                     if bar_age_sec is not None and bar_age_sec > 90:
                         console.print("[yellow]Warning: Last 1m bar is older than 90s — data feed may be delayed.[/yellow]")
 
@@ -12796,27 +13740,38 @@ List:"""
                 except Exception as e:
                     logger.error(f"Paper trade update error: {e}")
 
-                # Build an intrabar-updated view of the last candle using current_price
+                # Build an intrabar-updated view of the last candle using current_price.
+                # The copy is only taken when a new frame is fetched; later ticks on the
+                # same frame just rewrite the last row from the bar's original high/low.
                 bars_live = None
+                live_hlc = None
                 try:
-                    bars_live = bars.copy()
-                    # Update last row close, and expand high/low to include current tick
-                    last_idx = bars_live.index[-1]
-                    last_high = float(bars_live.loc[last_idx, 'High'])
-                    last_low = float(bars_live.loc[last_idx, 'Low'])
-                    last_open = float(bars_live.loc[last_idx, 'Open'])
-                    # Set close to current tick
-                    bars_live.loc[last_idx, 'Close'] = float(current_price)
-                    # Expand high/low
-                    if float(current_price) > last_high:
-                        bars_live.loc[last_idx, 'High'] = float(current_price)
-                    if float(current_price) < last_low:
-                        bars_live.loc[last_idx, 'Low'] = float(current_price)
+                    if bars is not live_src:
+                        live_frame = bars.copy()
+                        live_src = bars
+                        # Positional column indices for the hot last-row cells
+                        live_ci = tuple(live_frame.columns.get_loc(col) for col in ('Close', 'High', 'Low'))
+                        live_last_hl = (float(live_frame.iat[-1, live_ci[1]]), float(live_frame.iat[-1, live_ci[2]]))
+                    bars_live = live_frame
+                    last_high, last_low = live_last_hl
+                    cp = float(current_price)
+                    # Set close to current tick and expand high/low to include it
+                    live_hlc = (cp, max(last_high, cp), min(last_low, cp))
+                    for ci, val in zip(live_ci, live_hlc):
+                        bars_live.iat[-1, ci] = val
                 except Exception:
+                    live_src = None
+                    live_hlc = None
                     bars_live = bars
 
-                # Calculate indicators on the intrabar-updated data
-                indicators = TechnicalAnalyzer.calculate_indicators(bars_live)
+                # Calculate indicators on the intrabar-updated data. Until the bar rolls,
+                # only the forming candle moves, so re-price it from the cached state.
+                if live_hlc is not None and ind_cache is not None and ind_cache[0] == last_bar_time:
+                    indicators = TechnicalAnalyzer.update_intrabar(ind_cache[2], ind_cache[1], *live_hlc)
+                else:
+                    indicators = TechnicalAnalyzer.calculate_indicators(bars_live)
+                    ind_state = TechnicalAnalyzer.intrabar_state(bars_live) if indicators is not None else None
+                    ind_cache = (last_bar_time, ind_state, indicators) if ind_state is not None else None
                 
                 # Override indicators.price with live current_price for accurate entry
                 original_price = indicators.price
@@ -12824,26 +13779,40 @@ List:"""
                     indicators.price = round(current_price, 2)
                     indicators.close = round(current_price, 2)
                 
-                # Debug: show price adjustment
-                if debug_price and current_price is not None:
-                    console.print(f"[dim]Price override: bar close ${original_price:.2f} → live ${current_price:.2f}[/dim]")
-                
-                # Debug: show last 5 closes and calculated RSI for verification
                 if debug_price:
+                    # Debug: show price adjustment
+                    if current_price is not None:
+                        console.print(f"[dim]Price override: bar close ${original_price:.2f} → live ${current_price:.2f}[/dim]")
+                    # Debug: show last 5 closes and calculated RSI for verification
                     last_5_closes = indicators.closes.tail(5).tolist()
-                    console.print(f"[dim]Last 5 closes: {[f'${c:.2f}' for c in last_5_closes]}[/dim]")
+                    console.print("[dim]Last 5 closes: %s[/dim]" % ("$%.2f " * len(last_5_closes) % tuple(last_5_closes)).rstrip())
                     console.print(f"[dim]Calculated RSI(14): {indicators.rsi_14:.2f} | MACD: {indicators.macd:.4f}[/dim]")
                 
+                # Join the fundamentals prefetch so the analysis below reads a warm cache
+                try:
+                    funds = f_funds.result()
+                except Exception:
+                    funds = {}
+
                 signal = self.analyzer._fallback_analysis(
                     ticker, indicators, self.config.get('account_size', 10000),
                     (self.config.get('risk_per_trade', 2.0)/100.0), float(desired_rrr) if desired_rrr else 2.0,
                     is_day_trading=True  # Enable 5-20min profit optimization
                 )
-                # Enrich signal with fundamentals and option Greeks (lightweight, optional)
+                # ===== NEW SIGNAL DETECTION =====
+                # Track action flips separately from confidence jitters
+                action_key = (signal.action if signal else None)
+                if not hasattr(self, '_last_signal_action'):
+                    self._last_signal_action = None
+                action_changed = (action_key != self._last_signal_action)
+                if action_changed:
+                    self._last_signal_action = action_key
+                
+                # Enrich signal with fundamentals and option Greeks (lightweight, optional).
+                # Skipped when the signal won't be shown or acted on this iteration.
                 try:
-                    if signal is not None:
+                    if signal and signal.action != 'HOLD' and (action_changed or float(signal.confidence) >= 70):
                         try:
-                            funds = DataManager.get_fundamentals(ticker)
                             if funds:
                                 pe = funds.get('trailingPE') or funds.get('forwardPE')
                                 if pe is not None:
@@ -12858,7 +13827,7 @@ List:"""
 
                         # option Greeks fetch only if requested to avoid heavy API calls
                         try:
-                            if analysis_options.get('include_option_flow') or debug_price:
+                            if want_greeks:
                                 opt = DataManager.get_option_chain_greeks(ticker)
                                 if opt:
                                     cg = opt.get('call_greeks', {})
@@ -12873,15 +13842,6 @@ List:"""
                 except Exception:
                     pass
                 
-                # ===== NEW SIGNAL DETECTION =====
-                # Track action flips separately from confidence jitters
-                action_key = (signal.action if signal else None)
-                if not hasattr(self, '_last_signal_action'):
-                    self._last_signal_action = None
-                action_changed = (action_key != self._last_signal_action)
-                if action_changed:
-                    self._last_signal_action = action_key
-                
                 # Only print when something ACTUALLY changes
                 if action_changed and signal and signal.action != "HOLD":
                     # Minimal, user-friendly line: ACTION + CONFIDENCE + PRICE
@@ -12889,120 +13849,26 @@ List:"""
                         f"[bold]{ticker}[/bold]: {signal.action}  {signal.confidence:.0f}%  |  ${current_price:.2f}"
                     )
                     
-                    # Generate chart (silent) highlighting the signal switch
+                    # Render the switch chart on the background chart thread (silent)
                     try:
-                        import matplotlib
-                        matplotlib.use('Agg')
-                        import matplotlib.pyplot as plt
-                        from pathlib import Path
-                        import os
-                        
-                        fig, axes = plt.subplots(3, 1, figsize=(16, 12), gridspec_kw={'height_ratios': [3, 1, 1]})
-                        fig.patch.set_facecolor('#0E1117')
-                        
-                        # Price chart with candlesticks
-                        ax_price = axes[0]
-                        ax_price.set_facecolor('#0E1117')
-                        
-                        # Plot candlesticks
-                        candle_width = 0.8
-                        plot_df = bars_live.tail(200).reset_index(drop=True)
-                        for idx, row in plot_df.iterrows():
-                            x = idx
-                            open_price = row.get('Open', row['Close'])
-                            high = row.get('High', row['Close'])
-                            low = row.get('Low', row['Close'])
-                            close = row.get('Close', row['Close'])
-                            
-                            is_bullish = close >= open_price
-                            color = '#00ff00' if is_bullish else '#ff0000'
-                            
-                            # Wick
-                            ax_price.plot([x, x], [low, high], color=color, linewidth=1.5, alpha=0.9)
-                            
-                            # Body
-                            body_height = abs(close - open_price)
-                            body_bottom = min(open_price, close)
-                            if body_height < close * 0.0001:
-                                body_height = close * 0.0001
-                            
-                            from matplotlib.patches import Rectangle
-                            if is_bullish:
-                                rect = Rectangle((x - candle_width/2, body_bottom), candle_width, body_height,
-                                               facecolor='#0a0a0a', edgecolor=color, linewidth=1.5, alpha=0.9)
-                            else:
-                                rect = Rectangle((x - candle_width/2, body_bottom), candle_width, body_height,
-                                               facecolor=color, edgecolor=color, linewidth=1.5, alpha=0.9)
-                            ax_price.add_patch(rect)
-                        
-                        ax_price.set_xlim(-0.5, len(plot_df) - 0.5)
-                        
-                        # Add moving averages on top of candlesticks
-                        if 'SMA_20' in bars_live.columns:
-                            sma20_plot = bars_live['SMA_20'].tail(200).reset_index(drop=True)
-                            ax_price.plot(range(len(sma20_plot)), sma20_plot, label='SMA 20', alpha=0.7, color='orange', linewidth=1.5)
-                        if 'SMA_50' in bars_live.columns:
-                            sma50_plot = bars_live['SMA_50'].tail(200).reset_index(drop=True)
-                            ax_price.plot(range(len(sma50_plot)), sma50_plot, label='SMA 50', alpha=0.7, color='red', linewidth=1.5)
-                        
-                        # Mark entry/SL/TP
-                        ax_price.axhline(y=signal.entry_price, color='cyan', linestyle='--', label=f'Entry: ${signal.entry_price:.2f}', linewidth=1.5)
-                        ax_price.axhline(y=signal.stop_loss, color='red', linestyle='--', label=f'Stop: ${signal.stop_loss:.2f}', linewidth=1.5)
-                        ax_price.axhline(y=signal.take_profit_1, color='green', linestyle='--', label=f'TP1: ${signal.take_profit_1:.2f}', linewidth=1.5)
-                        
-                        # Highlight current price (at last candle)
-                        ax_price.scatter([len(plot_df) - 1], [current_price], color='yellow', s=150, zorder=5, label=f'Signal Switch')
-                        
-                        switch_reason = signal.primary_reason[:80]
-                        title = f'{ticker} - {signal.action} ({signal.confidence:.0f}%)'
-                        ax_price.set_title(title, fontsize=14, fontweight='bold', pad=20, color='white')
-                        ax_price.set_ylabel('Price ($)', fontsize=11, color='white')
-                        ax_price.legend(loc='best', fontsize=9, facecolor='#1a1a1a', edgecolor='cyan')
-                        ax_price.grid(True, alpha=0.3, color='#333333')
-                        ax_price.tick_params(colors='white')
-                        
-                        # Omit supporting signals block to keep chart clean
-                        
-                        # RSI chart
-                        ax_rsi = axes[1]
-                        ax_rsi.set_facecolor('#0E1117')
-                        if 'RSI' in bars_live.columns:
-                            ax_rsi.plot(bars_live.index, bars_live['RSI'], label='RSI', color='purple', linewidth=1.5)
-                            ax_rsi.axhline(y=70, color='red', linestyle='--', alpha=0.5, label='Overbought')
-                            ax_rsi.axhline(y=30, color='green', linestyle='--', alpha=0.5, label='Oversold')
-                            ax_rsi.fill_between(bars_live.index, 30, 70, alpha=0.1, color='gray')
-                        ax_rsi.set_ylabel('RSI', fontsize=11, color='white')
-                        ax_rsi.legend(loc='best', fontsize=9, facecolor='#1a1a1a')
-                        ax_rsi.grid(True, alpha=0.3, color='#333333')
-                        ax_rsi.set_ylim(0, 100)
-                        ax_rsi.tick_params(colors='white')
-                        
-                        # Volume chart
-                        ax_vol = axes[2]
-                        ax_vol.set_facecolor('#0E1117')
-                        colors = ['green' if bars_live['Close'].iloc[i] >= bars_live['Open'].iloc[i] else 'red' 
-                                 for i in range(len(bars_live))]
-                        ax_vol.bar(bars_live.index, bars_live['Volume'], color=colors, alpha=0.6)
-                        ax_vol.set_ylabel('Volume', fontsize=11, color='white')
-                        ax_vol.set_xlabel('Time', fontsize=11, color='white')
-                        ax_vol.grid(True, alpha=0.3, color='#333333')
-                        ax_vol.tick_params(colors='white')
-                        
-                        plt.tight_layout()
-                        
-                        # Save chart
                         charts_dir = Path("results/charts")
-                        charts_dir.mkdir(exist_ok=True, parents=True)
+                        if not self._charts_dir_ready:
+                            charts_dir.mkdir(exist_ok=True, parents=True)
+                            self._charts_dir_ready = True
                         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                         chart_path = charts_dir / f"{ticker.replace(' ', '_')}_signal_switch_{timestamp}.png"
-                        plt.savefig(chart_path, dpi=150, bbox_inches='tight', facecolor='#0E1117')
-                        plt.close()
-                        
-                        # Auto-open chart silently
-                        try:
-                            os.startfile(str(chart_path))
-                        except Exception:
-                            pass
+                        signal_info = {
+                            'action': signal.action,
+                            'confidence': float(signal.confidence),
+                            'entry_price': float(signal.entry_price),
+                            'stop_loss': float(signal.stop_loss),
+                            'take_profit_1': float(signal.take_profit_1),
+                        }
+                        # bars_live is rewritten in place on the next tick, so hand the worker a snapshot
+                        fut = self._chart_pool.submit(
+                            _render_signal_chart, ticker, bars_live.copy(), signal_info, float(current_price), chart_path
+                        )
+                        fut.add_done_callback(partial(_open_rendered_chart, viewer_cmd=(self.config or {}).get('chart_viewer')))
                     except Exception:
                         pass
                     
@@ -13032,45 +13898,28 @@ List:"""
                 
                 # ===== POSITION MONITORING (if trade active) =====
                 if position_active:
-                    # Compute P&L based on side
-                    if position_side == 'SHORT':
-                        pnl = (entry_price - current_price)
-                    else:
-                        pnl = (current_price - entry_price)
+                    # P&L, trailing, break-even and exits are all expressed through
+                    # side_sign (+1 LONG, -1 SHORT) so both sides share one path
+                    pnl = side_sign * (current_price - entry_price)
                     pnl_pct = (pnl / entry_price) * 100 if entry_price else 0.0
                     
-                    # Update highest price for trailing stop
+                    # Ratchet the trailing stop behind the best price seen
                     if use_trailing_stop:
-                        if position_side == 'SHORT':
-                            if lowest_price is None:
-                                lowest_price = entry_price
-                            if current_price < lowest_price:
-                                lowest_price = current_price
-                                stop_loss = lowest_price + (trailing_distance or 0)
-                        else:
-                            if highest_price is None:
-                                highest_price = entry_price
-                            if current_price > highest_price:
-                                highest_price = current_price
-                                stop_loss = highest_price - (trailing_distance or 0)
+                        if trail_extreme is None:
+                            trail_extreme = entry_price
+                        if side_sign * (current_price - trail_extreme) > 0:
+                            trail_extreme = current_price
+                            stop_loss = trail_extreme - side_sign * (trailing_distance or 0)
 
                     # Auto move stop to break-even at +1R
                     try:
                         if not breakeven_applied and stop_loss is not None and entry_price is not None:
-                            if position_side == 'LONG':
-                                r_dist = float(entry_price) - float(stop_loss)
-                                if r_dist > 0 and (float(current_price) - float(entry_price)) >= r_dist:
-                                    stop_loss = float(entry_price)
-                                    breakeven_applied = True
-                                    if hasattr(self, 'notifier') and self.notifier:
-                                        self.notifier.send(f"{ticker}: BE stop @ ${entry_price:.2f}")
-                            elif position_side == 'SHORT':
-                                r_dist = float(stop_loss) - float(entry_price)
-                                if r_dist > 0 and (float(entry_price) - float(current_price)) >= r_dist:
-                                    stop_loss = float(entry_price)
-                                    breakeven_applied = True
-                                    if hasattr(self, 'notifier') and self.notifier:
-                                        self.notifier.send(f"{ticker}: BE stop @ ${entry_price:.2f}")
+                            r_dist = side_sign * (float(entry_price) - float(stop_loss))
+                            if r_dist > 0 and side_sign * (float(current_price) - float(entry_price)) >= r_dist:
+                                stop_loss = float(entry_price)
+                                breakeven_applied = True
+                                if hasattr(self, 'notifier') and self.notifier:
+                                    self.notifier.send(f"{ticker}: BE stop @ ${entry_price:.2f}")
                     except Exception:
                         pass
                     
@@ -13086,35 +13935,26 @@ List:"""
                     exit_reason = ""
                     
                     # Stop loss / Take profit based on side
-                    if position_side == 'SHORT':
-                        if stop_loss is not None and current_price >= stop_loss:
-                            exit_triggered = True
-                            exit_reason = f"🛑 STOP LOSS HIT (SHORT)"
-                        elif take_profit is not None and current_price <= take_profit:
-                            exit_triggered = True
-                            exit_reason = f"🎯 TAKE PROFIT HIT (SHORT)"
-                    else:
-                        if stop_loss is not None and current_price <= stop_loss:
-                            exit_triggered = True
-                            exit_reason = f"🛑 STOP LOSS HIT"
-                        elif take_profit is not None and current_price >= take_profit:
-                            exit_triggered = True
-                            exit_reason = f"🎯 TAKE PROFIT HIT"
+                    side_suffix = " (SHORT)" if side_sign < 0 else ""
+                    if stop_loss is not None and side_sign * (current_price - stop_loss) <= 0:
+                        exit_triggered = True
+                        exit_reason = f"🛑 STOP LOSS HIT{side_suffix}"
+                    elif take_profit is not None and side_sign * (current_price - take_profit) >= 0:
+                        exit_triggered = True
+                        exit_reason = f"🎯 TAKE PROFIT HIT{side_suffix}"
                     
                     # Strong reversal signal (sell when buy, buy when sell)
                     if (not exit_triggered) and signal and signal.confidence > 70:
-                        if position_side == 'LONG' and signal.action == 'SELL':
+                        if signal.action == ('SELL' if side_sign > 0 else 'BUY'):
                             exit_triggered = True
-                            exit_reason = f"⚠️ REVERSAL: EXIT LONG (Market flipped to SELL)"
-                        elif position_side == 'SHORT' and signal.action == 'BUY':
-                            exit_triggered = True
-                            exit_reason = f"⚠️ REVERSAL: EXIT SHORT (Market flipped to BUY)"
+                            exit_reason = (f"⚠️ REVERSAL: EXIT LONG (Market flipped to SELL)" if side_sign > 0
+                                           else f"⚠️ REVERSAL: EXIT SHORT (Market flipped to BUY)")
                     
                     # Display position status (minimal) - only on changes
                     if pnl_changed or exit_triggered:
-                        pos_color = "green" if pnl >= 0 else "red"
-                        side_label = 'SHORT' if position_side == 'SHORT' else 'LONG'
-                        console.print(f"[{pos_color}]💼 {ticker} ({side_label}) | Entry: ${entry_price:.2f} | Current: ${current_price:.2f} | P&L: {pnl_pct:+.2f}%[/{pos_color}]")
+                        console.print(_POS_STATUS_FMT.format(
+                            c=_PNL_COLORS[pnl >= 0], t=ticker, s=_SIDE_LABELS[side_sign],
+                            e=entry_price, p=current_price, pl=pnl_pct))
                         self._last_pnl_pct = pnl_pct
                     
                     if exit_triggered:
@@ -13145,7 +13985,13 @@ List:"""
 
                 # ===== ENTRY SIGNAL (>75% confidence) =====
                 # Raised threshold from 60% to 75% to filter weak/risky signals
-                if not position_active and signal and signal.confidence > 75:
+                entry_ready = bool(not position_active and signal and signal.confidence > 75)
+                if entry_ready:
+                    drop_reason = self._early_drop(bars, ticker)
+                    if drop_reason:
+                        logger.debug(f"drop {ticker}: {drop_reason}")
+                        entry_ready = False
+                if entry_ready:
                     # For crypto, require microstructure confirmation (if WS ticks available)
                     if ticker.upper().endswith('-USD'):
                         try:
@@ -13155,11 +14001,10 @@ List:"""
                                 vdev = float(micro.get('vwap_dev', 0.0))
                                 tr = float(micro.get('tick_rate', 0.0))
                                 age = float(micro.get('last_tick_age', 99.0))
-                                if signal.action == 'BUY' and not ((mr > 0.05) and (vdev <= 0.6) and (tr >= 0.5) and (age <= 3.0)):
+                                if signal.action in ('BUY', 'SELL') and not _confirm_micro(
+                                        0 if signal.action == 'BUY' else 1, mr, vdev, tr, age):
                                     # Wait for micro confirmation
                                     continue
-                                if signal.action == 'SELL' and not ((mr < -0.05) and (vdev >= -0.6) and (tr >= 0.5) and (age <= 3.0)):
-                                    continue
                         except Exception:
                             pass
                     
@@ -13169,16 +14014,20 @@ List:"""
                             # Factor scoring
                             factor_boost = 0
                             factor_details = []
+                            shared = None
                             
                             try:
+                                # One pass over the live closes feeds both the factors and the ML features
+                                shared = _shared_features(live_closes, bar_arrs['High'], bar_arrs['Low'], float(current_price))
+                                
                                 # Calculate momentum factor
-                                momentum = FactorModels.calculate_momentum_factor(bars_live, lookback=126)
+                                momentum = shared['momentum_126']
                                 if abs(momentum) > 0.1:  # 10% momentum
                                     factor_boost += 5 if momentum > 0 else -5
                                     factor_details.append(f"Momentum: {momentum:.1%}")
                                 
                                 # Mean reversion check
-                                z_score, is_reverting = FactorModels.detect_mean_reversion(bars_live)
+                                z_score, is_reverting = shared['zscore_20'], shared['reverting_20']
                                 if is_reverting and abs(z_score) > 2:
                                     # Boost for oversold BUY or overbought SELL
                                     if (signal.action == "BUY" and z_score < -2) or (signal.action == "SELL" and z_score > 2):
@@ -13192,9 +14041,9 @@ List:"""
                             ml_details = []
                             
                             try:
-                                ml_weighter = MLSignalWeighter()
+                                ml_weighter = self._get_ml_weighter()
                                 if ml_weighter.models:  # Check if trained
-                                    features = ml_weighter.engineer_features(bars_live, indicators)
+                                    features = ml_weighter.engineer_features(bars_live, indicators, shared=shared)
                                     if features is not None:
                                         ml_prob, individual = ml_weighter.get_ensemble_prediction(features)
                                         
@@ -13222,152 +14071,55 @@ List:"""
                     
                     # ===== REGIME & MULTI-TIMEFRAME GATING =====
                     # Check market regime - skip if volatile/ranging unless high confidence
-                    try:
-                        regime = RegimeDetector.detect_regime(bars, indicators)
-                        if regime.regime == "VOLATILE" and signal.confidence < 80:
-                            console.print(f"[dim]{ticker}: {signal.action} signal skipped - {regime.details}[/dim]")
-                            continue
-                        elif regime.regime == "RANGING" and signal.confidence < 70:
-                            console.print(f"[dim]{ticker}: {signal.action} signal skipped - {regime.details}[/dim]")
-                            continue
+                    # Every regime/MTF rejection needs confidence < 85, so stronger signals skip the checks
+                    if signal.confidence < 85:
+                        try:
+                            bar_key = (ticker, config.interval, bars.index[-1].value)
+                            regime = self._cached_per_bar(('regime',) + bar_key,
+                                                          lambda: RegimeDetector.detect_regime(bars, indicators, bar_arrs))
+                            if regime.regime == "VOLATILE" and signal.confidence < 80:
+                                console.print(f"[dim]{ticker}: {signal.action} signal skipped - {regime.details}[/dim]")
+                                continue
+                            elif regime.regime == "RANGING" and signal.confidence < 70:
+                                console.print(f"[dim]{ticker}: {signal.action} signal skipped - {regime.details}[/dim]")
+                                continue
                         
-                        # Multi-timeframe confirmation
-                        mtf = MultiTimeframeAnalyzer.analyze(ticker, config.interval)
-                        if not mtf.higher_tf_aligned and signal.confidence < 85:
-                            console.print(f"[dim]{ticker}: {signal.action} signal skipped - Higher TF not aligned ({mtf.details})[/dim]")
-                            continue
+                            # Multi-timeframe confirmation
+                            mtf = self._cached_per_bar(('mtf',) + bar_key,
+                                                       lambda: MultiTimeframeAnalyzer.analyze(ticker, config.interval))
+                            if not mtf.higher_tf_aligned and signal.confidence < 85:
+                                console.print(f"[dim]{ticker}: {signal.action} signal skipped - Higher TF not aligned ({mtf.details})[/dim]")
+                                continue
                         
-                        # Pass all filters - show regime/MTF info
-                        console.print(f"[dim]Regime: {regime.regime} ({regime.confidence:.0f}%) | MTF: {mtf.primary_trend} ({mtf.confirmation_score:.0f}% aligned)[/dim]")
-                    except Exception as e:
-                        # If regime/MTF check fails, log and continue
-                        logger.error(f"Regime/MTF check error: {e}")
+                            # Pass all filters - show regime/MTF info
+                            console.print(f"[dim]Regime: {regime.regime} ({regime.confidence:.0f}%) | MTF: {mtf.primary_trend} ({mtf.confirmation_score:.0f}% aligned)[/dim]")
+                        except Exception as e:
+                            # If regime/MTF check fails, log and continue
+                            logger.error(f"Regime/MTF check error: {e}")
                     
-                    if signal.action == "BUY":
-                        # Calculate stop loss and take profit FIRST (for immediate alert)
-                        entry_price_calc = current_price
-                        atr = (bars['High'].rolling(14).max().iloc[-1] - bars['Low'].rolling(14).min().iloc[-1])
-                        if atr == 0 or np.isnan(atr):
-                            atr = (bars['High'].iloc[-1] - bars['Low'].iloc[-1])
-                        
-                        stop_loss_calc = entry_price_calc - atr * 1.5
-                        stop_distance = entry_price_calc - stop_loss_calc
-                        take_profit_calc = entry_price_calc + (stop_distance * float(desired_rrr if desired_rrr else 2.0))
-                        
-                        # Clear instruction to ENTER
-                        console.print(f"{ticker}: ENTER LONG {signal.confidence:.0f}% | ${entry_price_calc:.2f}")
-                        
-                        # Ask about trailing stop
-                        console_print_text = "[cyan]Enable trailing stop?[/cyan]"
-                        use_trailing = Confirm.ask(console_print_text, default=False)
-                        if use_trailing:
-                            use_trailing_stop = True
-                            position_side = 'LONG'
-                            highest_price = entry_price_calc
-                            lowest_price = None
-                            trailing_distance = atr * 1.5
-                            stop_loss_calc = highest_price - trailing_distance
-                            console.print(f"[cyan]✓ Trailing stop enabled. Will follow price up by ${trailing_distance:.2f}[/cyan]\n")
-                        
-                        # Ask if user took the trade
-                        trade_choice = Prompt.ask("[bold]Trade action[/bold]", choices=["real", "paper", "skip"], default="real")
-                        
-                        if trade_choice == "real":
-                            entry_price = entry_price_calc
-                            position_side = 'LONG'
-                            stop_loss = stop_loss_calc
-                            take_profit = take_profit_calc
-                            entry_time = datetime.now().strftime('%H:%M:%S')
-                            entry_confidence = signal.confidence
-                            position_active = True
-                            breakeven_applied = False
-                            
-                            console.print(f"\n[green]✓ Real trade tracked. Monitoring {ticker} position...[/green]")
-                            console.print(f"  Exit this scan (Ctrl+C) when ready. Will continue monitoring until exit.\n")
-                        
-                        elif trade_choice == "paper":
-                            # Open paper trade
-                            position_size_calc = int((self.config.get('account_size', 10000) * 0.02) / stop_distance)
-                            self.paper_trading.open_trade(ticker, "LONG", entry_price_calc, stop_loss_calc, take_profit_calc, position_size_calc)
-                            console.print("[cyan]Paper trade opened. Will track virtually.[/cyan]\n")
-                        
-                        else:
-                            console.print("[yellow]Trade skipped. Continuing to scan for next signal...\n")
+                    # 14-bar high-low range, shared by the BUY and SELL stop math
+                    atr = _compute_atr14(bar_arrs['High'], bar_arrs['Low'])
                     
-                    elif signal.action == "SELL":
-                        # Calculate stop loss and take profit for SHORT (IMMEDIATELY)
-                        entry_price_calc = current_price
-                        atr = (bars['High'].rolling(14).max().iloc[-1] - bars['Low'].rolling(14).min().iloc[-1])
-                        if atr == 0 or np.isnan(atr):
-                            atr = (bars['High'].iloc[-1] - bars['Low'].iloc[-1])
-                        
-                        stop_loss_calc = entry_price_calc + atr * 1.5  # For SHORT, SL is above
-                        stop_distance = stop_loss_calc - entry_price_calc
-                        take_profit_calc = entry_price_calc - (stop_distance * float(desired_rrr if desired_rrr else 2.0))
-                        
-                        # Clear instruction to ENTER
-                        console.print(f"{ticker}: ENTER SHORT {signal.confidence:.0f}% | ${entry_price_calc:.2f}")
-                        
-                        # Ask about trailing stop (for SHORT, trailing means following DOWN)
-                        use_trailing = Confirm.ask("[cyan]Enable trailing stop?[/cyan]", default=False)
-                        if use_trailing:
-                            use_trailing_stop = True
-                            position_side = 'SHORT'
-                            lowest_price = entry_price_calc
-                            highest_price = None
-                            trailing_distance = atr * 1.5
-                            stop_loss_calc = lowest_price + trailing_distance
-                            console.print(f"[cyan]✓ Trailing stop enabled. Will follow price down by ${trailing_distance:.2f}[/cyan]\n")
-                        
-                        # Ask if user took the trade
-                        trade_choice = Prompt.ask("[bold]Trade action[/bold]", choices=["real", "paper", "skip"], default="real")
-                        
-                        if trade_choice == "real":
-                            entry_price = entry_price_calc
-                            position_side = 'SHORT'
-                            stop_loss = stop_loss_calc
-                            take_profit = take_profit_calc
-                            entry_time = datetime.now().strftime('%H:%M:%S')
-                            entry_confidence = signal.confidence
+                    if signal.action in ("BUY", "SELL"):
+                        pos = self._execute_entry('LONG' if signal.action == 'BUY' else 'SHORT', ticker,
+                                                  current_price, atr, desired_rrr, signal.confidence)
+                        if pos is not None:
+                            position_side = pos.side
+                            side_sign = pos.side_sign
+                            entry_price = pos.entry_price
+                            stop_loss = pos.stop_loss
+                            take_profit = pos.take_profit
+                            entry_time = pos.entry_time
+                            entry_confidence = pos.confidence
+                            use_trailing_stop = pos.use_trailing_stop
+                            trail_extreme = pos.trail_extreme
+                            trailing_distance = pos.trailing_distance
                             position_active = True
                             breakeven_applied = False
-                            
-                            console.print(f"\n[green]✓ SHORT tracked. Monitoring {ticker} position...[/green]")
-                            console.print(f"  Exit this scan (Ctrl+C) when ready. Will continue monitoring until exit.\n")
-                        
-                        elif trade_choice == "paper":
-                            # Open paper trade
-                            position_size_calc = int((self.config.get('account_size', 10000) * 0.02) / stop_distance)
-                            self.paper_trading.open_trade(ticker, "SHORT", entry_price_calc, stop_loss_calc, take_profit_calc, position_size_calc)
-                            console.print("[cyan]Paper trade opened. Will track virtually.[/cyan]\n")
-                        
-                        else:
-                            console.print("[yellow]Trade skipped. Continuing to scan for next signal...\n")
 
-                # Sleep with Enter-to-refresh: check every 200ms
-                try:
-                    import msvcrt as _kb
-                except Exception:
-                    _kb = None
-                slept = 0.0
-                step = 0.2
+                # Sleep with Enter-to-refresh
                 max_sleep = max(1.0, float(scan_delay))
-                manual_refresh = False
-                while slept < max_sleep:
-                    # If Enter pressed, break early to refresh immediately
-                    if _kb and _kb.kbhit():
-                        try:
-                            ch = _kb.getch()
-                            # Flush any additional buffered keys
-                            while _kb.kbhit():
-                                _kb.getch()
-                            if ch in (b"\r", b"\n"):
-                                manual_refresh = True
-                                break
-                        except Exception:
-                            pass
-                    time.sleep(step)
-                    slept += step
+                manual_refresh = _sleep_or_enter(max_sleep)
                 if manual_refresh:
                     console.print("[cyan]↻ Manual refresh requested[/cyan]")
 
@@ -13379,12 +14131,14 @@ List:"""
                 pass
             if position_active:
                 console.print(f'\n[yellow]⚠️  Scan interrupted but position still ACTIVE![/yellow]')
-                console.print(f'  Entry: ${entry_price:.2f} | Current: ${current_price:.2f} | P&L: {((current_price - entry_price) / entry_price * 100):+.2f}%')
+                console.print(f'  Entry: ${entry_price:.2f} | Current: ${current_price:.2f} | P&L: {(side_sign * (current_price - entry_price) / entry_price * 100):+.2f}%')
                 console.print(f'  SL: ${stop_loss:.2f} | TP: ${take_profit:.2f}')
                 console.print(f'  Remember to manually close or continue monitoring!\n')
             else:
                 console.print('\n[green]Live scan stopped by user.[/green]\n')
             return
+        finally:
+            enrich_pool.shutdown(wait=False)
 
     def live_best_scanner(self, universe: list, config, analysis_options: dict, desired_rrr: float):
         """Continuously scan a list of tickers and report the top-confidence ticker each cycle."""
@@ -13403,59 +14157,39 @@ List:"""
         # Auto-set scan delay to 60 seconds to respect Polygon rate limits
         scan_delay = 60
         
+        def _score_ticker(t, bars):
+            try:
+                indicators = TechnicalAnalyzer.calculate_indicators(bars)
+                signal = self.analyzer._fallback_analysis(
+                    t, indicators, self.config.get('account_size', 10000),
+                    (self.config.get('risk_per_trade', 2.0)/100.0), float(desired_rrr) if desired_rrr else 2.0
+                )
+                conf = getattr(signal, 'confidence', 0) if signal else 0
+                return (t, signal, indicators, conf)
+            except Exception:
+                return None
+        
         try:
             while True:
-                best = None
-                best_conf = -999
-                for t in universe:
-                    try:
-                        # Use DataManager which automatically uses Polygon for 1m data
-                        bars = DataManager.fetch_data(t, '2d', '1m')
-
-                        if bars is None or bars.empty:
-                            continue
-                        indicators = TechnicalAnalyzer.calculate_indicators(bars)
-                        signal = self.analyzer._fallback_analysis(
-                            t, indicators, self.config.get('account_size', 10000),
-                            (self.config.get('risk_per_trade', 2.0)/100.0), float(desired_rrr) if desired_rrr else 2.0
-                        )
-                        conf = getattr(signal, 'confidence', 0) if signal else 0
-                        if conf > best_conf:
-                            best_conf = conf
-                            best = (t, signal, indicators)
-                    except Exception:
-                        continue
+                # One batched fetch for the universe (Polygon 1m where configured), then
+                # score concurrently; wall time ~ slowest ticker, not the sum
+                bars_map = DataManager.fetch_data_batch(universe, '2d', '1m')
+                with ThreadPoolExecutor(max_workers=max(1, min(16, len(bars_map)))) as ex:
+                    results = list(ex.map(_score_ticker, bars_map.keys(), bars_map.values()))
+                best = max((r for r in results if r), key=lambda r: r[3], default=None)
+                best_conf = best[3] if best else -999
 
                 DisplayManager.show_header()
                 if best:
-                    t, signal, indicators = best
+                    t, signal, indicators, _ = best
                     console.print(f"[bold]Best ticker now:[/bold] {t}  [bold]Confidence:[/bold] {best_conf}")
                     DisplayManager.show_indicators(indicators)
                     DisplayManager.show_trade_recommendation(signal)
                 else:
                     console.print('[yellow]No strong signals found this cycle.[/yellow]')
-                # Sleep with Enter-to-refresh: check every 200ms
-                try:
-                    import msvcrt as _kb
-                except Exception:
-                    _kb = None
-                slept = 0.0
-                step = 0.2
+                # Sleep with Enter-to-refresh
                 max_sleep = max(1.0, float(scan_delay))
-                manual_refresh = False
-                while slept < max_sleep:
-                    if _kb and _kb.kbhit():
-                        try:
-                            ch = _kb.getch()
-                            while _kb.kbhit():
-                                _kb.getch()
-                            if ch in (b"\r", b"\n"):
-                                manual_refresh = True
-                                break
-                        except Exception:
-                            pass
-                    time.sleep(step)
-                    slept += step
+                manual_refresh = _sleep_or_enter(max_sleep)
                 if manual_refresh:
                     console.print("[cyan]↻ Manual refresh requested[/cyan]")
 
@@ -13496,27 +14230,38 @@ List:"""
             with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
                 task = progress.add_task("Fetching market news...", total=len(market_tickers))
                 
-                for t in market_tickers:
-                    try:
-                        news = NewsAnalyzer.get_news(t, limit=5)
-                        all_news.extend(news)
-                    except:
-                        pass
-                    progress.update(task, advance=1)
+                # Fetch all tickers concurrently (TTL-cached, so revisits are instant)
+                with ThreadPoolExecutor(max_workers=len(market_tickers)) as ex:
+                    futures = [ex.submit(NewsAnalyzer.get_news_cached, t, 5) for t in market_tickers]
+                    for fut in futures:
+                        try:
+                            all_news.extend(fut.result())
+                        except:
+                            pass
+                        progress.update(task, advance=1)
             
-            # Remove duplicates by title
+            # Remove duplicates by title (case-insensitive), one pass over title hashes
             seen_titles = set()
             unique_news = []
             for item in all_news:
-                title_lower = item.title.lower()
-                if title_lower not in seen_titles and item.title:
-                    seen_titles.add(title_lower)
+                if not item.title:
+                    continue
+                title_hash = hash(item.title.casefold())
+                if title_hash not in seen_titles:
+                    seen_titles.add(title_hash)
                     unique_news.append(item)
             
             if unique_news:
+                import heapq
                 console.print(f"[bold cyan]🌍 General Market News ({len(unique_news)} articles)[/bold cyan]\n")
                 
-                for idx, item in enumerate(unique_news[:20], 1):
+                # Newest 20 first. get_news stamps "YYYY-MM-DD HH:MM UTC", which orders as a
+                # string; undated items ("Recent"/"Today") keep their fetch order at the end
+                latest_news = heapq.nlargest(
+                    20, unique_news,
+                    key=lambda n: n.published if n.published[:4].isdigit() else ''
+                )
+                for idx, item in enumerate(latest_news, 1):
                     console.print(f"[bold white]{idx}. {item.title}[/bold white]")
                     console.print(f"   [dim]{item.source} | {item.published}[/dim]")
                     if item.url and item.url != '#':
@@ -13538,12 +14283,24 @@ List:"""
         
         theme = Prompt.ask("Enter investment theme to research")
         
+        # Repeat themes are served from the disk cache unless a refresh is requested; the
+        # research is news-driven, so entries expire (config 'theme_cache_ttl_hours')
+        ttl_hours = float(self.config.get('theme_cache_ttl_hours', 6) or 0)
+        research = _load_theme_research(theme, ttl_hours * 3600)
+        if research is not None and Confirm.ask("Cached research found. Force refresh?", default=False):
+            research = None
+        
         console.print(f"\n[yellow]Researching: {theme}...[/yellow]\n")
         
         with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
             task = progress.add_task("Analyzing theme...", total=None)
             
-            research = self.theme_researcher.research_theme(theme)
+            if research is None:
+                research = self.theme_researcher.research_theme(theme)
+                # Only AI research is cached; the keyword fallback (no client or a failed call)
+                # shouldn't mask a real result later
+                if research != self.theme_researcher._basic_research(theme):
+                    _save_theme_research(theme, research)
             
             progress.update(task, description="Gathering news...")
             
@@ -13590,8 +14347,13 @@ List:"""
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = RESULTS_DIR / f"theme_{theme.replace(' ', '_')}_{timestamp}.json"
-        with open(filename, 'w') as f:
-            json.dump(research, f, indent=2)
+        try:
+            import orjson
+            filename.write_bytes(orjson.dumps(research, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        except (ImportError, TypeError):
+            # orjson missing, or content it rejects (e.g. non-str keys): stdlib json
+            with open(filename, 'w') as f:
+                json.dump(research, f, indent=2)
         
         console.print(f"[dim]Research saved to: {filename}[/dim]\n")
         
@@ -13614,24 +14376,26 @@ List:"""
             
             buy_trades = [t for t in insider_trades if "Buy" in t.transaction_type]
             sell_trades = [t for t in insider_trades if "Sell" in t.transaction_type]
+            n_buys = len(buy_trades)
+            n_sells = len(sell_trades)
             
             console.print("[bold cyan]📊 Analysis:[/bold cyan]")
-            console.print(f"Total Insider Buys: [green]{len(buy_trades)}[/green]")
-            console.print(f"Total Insider Sells: [red]{len(sell_trades)}[/red]")
+            console.print(f"Total Insider Buys: [green]{n_buys}[/green]")
+            console.print(f"Total Insider Sells: [red]{n_sells}[/red]")
             
             if buy_trades:
-                total_buy_value = sum([t.value for t in buy_trades])
+                total_buy_value = sum(t.value for t in buy_trades)
                 console.print(f"Total Buy Value: [green]${total_buy_value:,.0f}[/green]")
             
             if sell_trades:
-                total_sell_value = sum([t.value for t in sell_trades])
+                total_sell_value = sum(t.value for t in sell_trades)
                 console.print(f"Total Sell Value: [red]${total_sell_value:,.0f}[/red]")
             
             console.print()
             
-            if len(buy_trades) > len(sell_trades):
+            if n_buys > n_sells:
                 console.print("[green]✓ Bullish Signal: More insider buying than selling[/green]")
-            elif len(sell_trades) > len(buy_trades):
+            elif n_sells > n_buys:
                 console.print("[red]⚠ Bearish Signal: More insider selling than buying[/red]")
             else:
                 console.print("[yellow]⚡ Neutral: Balanced insider activity[/yellow]")
@@ -13672,18 +14436,19 @@ List:"""
         
         # Save results
         if analysis and analysis['holdings']:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            now = datetime.now()  # one clock read so filename and analysis_date agree
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = RESULTS_DIR / f"political_{selected_group}_{timestamp}.json"
             
             save_data = {
                 'group_name': analysis['group']['name'],
                 'members': analysis['group']['members'],
-                'analysis_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'analysis_date': now.strftime("%Y-%m-%d %H:%M:%S"),
                 'holdings': analysis['holdings']
             }
             
-            with open(filename, 'w') as f:
-                json.dump(save_data, f, indent=2)
+            # Encode once, write once (json.dump issues a write per token)
+            filename.write_text(json.dumps(save_data, indent=2), encoding='utf-8')
             
             console.print(f"[dim]Analysis saved to: {filename}[/dim]\n")
         
@@ -13694,7 +14459,16 @@ List:"""
         pass
     
     def settings_menu(self):
-        """Settings menu."""
+        """Settings menu. Edits are written to disk once, on leaving the menu."""
+        saved_snapshot = json.dumps(self.config, sort_keys=True, default=str)
+        try:
+            self._settings_menu_loop()
+        finally:
+            if json.dumps(self.config, sort_keys=True, default=str) != saved_snapshot:
+                ConfigurationManager.save_config(self.config)
+
+    def _settings_menu_loop(self):
+        """Settings menu loop; options update self.config in place."""
         while True:
             DisplayManager.show_header()
             
@@ -13735,7 +14509,6 @@ List:"""
                 # Configure API keys
                 self.api_key = ConfigurationManager.setup_api_keys()
                 self.config['anthropic_api_key'] = self.api_key
-                ConfigurationManager.save_config(self.config)
                 try:
                     import anthropic
                     self.analyzer = AIAnalyzer(self.api_key)
@@ -13750,7 +14523,6 @@ List:"""
                 # Update account size
                 new_size = FloatPrompt.ask("New account size ($)", default=self.config['account_size'])
                 self.config['account_size'] = new_size
-                ConfigurationManager.save_config(self.config)
                 console.print("[green]✓ Account size updated[/green]")
                 Prompt.ask("\nPress Enter to continue")
             
@@ -13763,7 +14535,6 @@ List:"""
                 except Exception:
                     new_risk_ratio = current_ratio
                 self.config['risk_per_trade'] = round(new_risk_ratio * 100.0, 4)
-                ConfigurationManager.save_config(self.config)
                 console.print("[green]✓ Risk per trade updated[/green]")
                 Prompt.ask("\nPress Enter to continue")
             
@@ -13787,7 +14558,6 @@ List:"""
                         return fallback
                 new_rrr = _parse_rrr(rr_input, current_rrr)
                 self.config['default_rrr'] = new_rrr
-                ConfigurationManager.save_config(self.config)
                 console.print(f"[green]✓ Risk:Reward updated to 1:{new_rrr:.2f}[/green]")
                 Prompt.ask("\nPress Enter to continue")
             
@@ -13795,7 +14565,6 @@ List:"""
                 # Update max positions
                 new_max = IntPrompt.ask("New max positions", default=self.config['max_positions'])
                 self.config['max_positions'] = new_max
-                ConfigurationManager.save_config(self.config)
                 console.print("[green]✓ Max positions updated[/green]")
                 Prompt.ask("\nPress Enter to continue")
             
@@ -13804,7 +14573,6 @@ List:"""
                 current_mode = self.config.get('analysis_mode', 'advanced')
                 new_mode = 'basic' if current_mode == 'advanced' else 'advanced'
                 self.config['analysis_mode'] = new_mode
-                ConfigurationManager.save_config(self.config)
                 console.print(f"[green]✓ Analysis mode set to: {new_mode}[/green]")
                 Prompt.ask("\nPress Enter to continue")
             
@@ -13817,7 +14585,6 @@ List:"""
                     telegram_chat = Prompt.ask("Telegram Chat ID", default=self.config.get('telegram_chat_id', ''))
                     self.config['telegram_bot_token'] = telegram_token
                     self.config['telegram_chat_id'] = telegram_chat
-                ConfigurationManager.save_config(self.config)
                 self.notifier = NotificationManager(self.config)
                 console.print("[green]✓ Notification settings updated[/green]")
                 Prompt.ask("\nPress Enter to continue")
@@ -13852,7 +14619,6 @@ List:"""
                 current = bool(self.config.get('enable_crypto_ws', True))
                 new_val = not current
                 self.config['enable_crypto_ws'] = new_val
-                ConfigurationManager.save_config(self.config)
                 if not new_val:
                     try:
                         DataManager.stop_crypto_ws()
@@ -13865,19 +14631,17 @@ List:"""
                 # Test Coinbase WS connectivity and price updates
                 try:
                     sym = Prompt.ask("Crypto symbol to test (Coinbase product id)", default="BTC-USD").upper()
+                    tick_evt = DataManager.register_price_event(sym)
                     DataManager.start_crypto_ws([sym])
                     console.print("[cyan]Connecting to Coinbase WS and waiting for ticks (up to 10s)...[/cyan]")
-                    import time as _t
-                    ok = False
-                    for _ in range(20):
-                        _t.sleep(0.5)
+                    # Wake on the first tick instead of polling the cache
+                    p = DataManager.get_cached_price(sym, max_age=3.0)
+                    if p is None and tick_evt.wait(timeout=10.0):
                         p = DataManager.get_cached_price(sym, max_age=3.0)
-                        if p is not None:
-                            age = DataManager.get_cached_price_age(sym) or 0.0
-                            console.print(f"[green]✓ WS price received[/green] {sym}: ${p:.2f} [dim](age {age:.1f}s)[/dim]")
-                            ok = True
-                            break
-                    if not ok:
+                    if p is not None:
+                        age = DataManager.get_cached_price_age(sym) or 0.0
+                        console.print(f"[green]✓ WS price received[/green] {sym}: ${p:.2f} [dim](age {age:.1f}s)[/dim]")
+                    else:
                         console.print("[yellow]⚠ No WS tick received yet. Ensure 'websockets' is installed and network allows wss.[/yellow]")
                 except Exception as e:
                     console.print(f"[red]❌ Test failed: {e}[/red]")
@@ -13891,101 +14655,102 @@ List:"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = RESULTS_DIR / f"{ticker}_analysis_{timestamp}.json"
         
-        with open(filename, 'w') as f:
-            json.dump(asdict(trade), f, indent=2)
+        # Encode once, write once (json.dump issues a write per token)
+        filename.write_text(json.dumps(trade.to_dict(), indent=2), encoding='utf-8')
         
         console.print(f"[dim]Report saved to: {filename}[/dim]")
     
     def _generate_analysis_chart(self, ticker: str, df: pd.DataFrame, trade: TradeSummary, 
                                  patterns: 'PatternAnalysis', market_structure: 'MarketStructure', 
                                  indicators: 'AdvancedIndicators' = None):
-        """Generate chart with buy/sell signals, stop loss, take profit levels, patterns, and FVGs."""
+        """Generate chart with buy/sell signals, stop loss, take profit levels, patterns, and FVGs.
+
+        Skipped entirely when config 'generate_charts' is False (headless/batch runs).
+        """
+        if not (self.config or {}).get('generate_charts', True):
+            return
+        if not MATPLOTLIB_AVAILABLE:
+            console.print("[yellow]Chart skipped: matplotlib not installed (pip install matplotlib)[/yellow]")
+            return
         try:
-            try:
-                import matplotlib
-            except ImportError:
-                console.print("[yellow]Installing matplotlib...[/yellow]")
-                import subprocess
-                subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", "matplotlib"])
-                import matplotlib
-            matplotlib.use('Agg')
-            import matplotlib.pyplot as plt
-            from matplotlib.patches import Rectangle, Circle, Polygon, FancyBboxPatch
-            from matplotlib.lines import Line2D
             import numpy as _np
             
-            # Cleaner layout with more space
-            fig, ax = plt.subplots(figsize=(18, 11), facecolor='#0f0f0f')
+            # Cleaner layout with more space (shared Agg figure, cleared per render)
+            fig, ax = _analysis_chart_figure()
             ax.set_facecolor('#0f0f0f')
             
             # Plot candlesticks with improved spacing
             candle_width = 0.6
             plot_df = df.tail(250).reset_index(drop=True)  # Last 250 bars for cleaner display
             
-            for idx, row in plot_df.iterrows():
-                x = idx
-                open_price = row.get('Open', row.get('open', row['Close']))
-                high = row.get('High', row.get('high', row['Close']))
-                low = row.get('Low', row.get('low', row['Close']))
-                close = row.get('Close', row.get('close', row['Close']))
-                
-                is_bullish = close >= open_price
-                # Bright green for bullish, deep red for bearish
-                color = '#00ff00' if is_bullish else '#cc0000'
-                
-                # Wick
-                ax.plot([x, x], [low, high], color=color, linewidth=1.5, alpha=0.95, solid_capstyle='butt')
-                
-                # Body
-                body_height = abs(close - open_price)
-                body_bottom = min(open_price, close)
-                
-                if body_height < close * 0.0001:
-                    body_height = close * 0.0001
-                
-                if is_bullish:
-                    rect = Rectangle((x - candle_width/2, body_bottom), candle_width, body_height,
-                                    facecolor='#0f0f0f', edgecolor=color, linewidth=1.6, alpha=1.0)
-                else:
-                    rect = Rectangle((x - candle_width/2, body_bottom), candle_width, body_height,
-                                    facecolor=color, edgecolor=color, linewidth=1.6, alpha=0.85)
-                ax.add_patch(rect)
+            # Column arrays once (lowercase names accepted, Close as the last resort)
+            def _ohlc_col(*names):
+                for name in names:
+                    if name in plot_df.columns:
+                        return plot_df[name].to_numpy(dtype=float)
+                return plot_df['Close'].to_numpy(dtype=float)
+            close = _ohlc_col('Close', 'close')
+            open_price = _ohlc_col('Open', 'open')
+            high = _ohlc_col('High', 'high')
+            low = _ohlc_col('Low', 'low')
+            n = len(plot_df)
+            right_x = n + 1  # level tags just right of the last candle
+            label_x = n + 8  # FVG / OB zone labels
+            last_close = float(close[-1]) if n else 0.0
+            x = _np.arange(n, dtype=float)
+            
+            # Bright green for bullish, deep red for bearish
+            is_bullish = close >= open_price
+            colors = _np.where(is_bullish, '#00ff00', '#cc0000')
+            
+            # Wicks: one LineCollection instead of a Line2D per bar
+            wick_segments = _np.stack([_np.column_stack([x, low]), _np.column_stack([x, high])], axis=1)
+            ax.add_collection(LineCollection(wick_segments, colors=colors, linewidths=1.5, alpha=0.95, capstyle='butt'))
+            
+            # Bodies: hollow bullish / filled bearish (85% alpha) as one PolyCollection
+            body_bottom = _np.minimum(open_price, close)
+            body_top = body_bottom + _np.maximum(_np.abs(close - open_price), close * 0.0001)
+            left = x - candle_width/2
+            right = x + candle_width/2
+            body_verts = _np.stack([_np.column_stack([left, body_bottom]), _np.column_stack([right, body_bottom]),
+                                    _np.column_stack([right, body_top]), _np.column_stack([left, body_top])], axis=1)
+            bull_mask = is_bullish[:, None]
+            body_faces = _np.where(bull_mask, to_rgba('#0f0f0f', 1.0), to_rgba('#cc0000', 0.85))
+            body_edges = _np.where(bull_mask, to_rgba('#00ff00', 1.0), to_rgba('#cc0000', 0.85))
+            ax.add_collection(PolyCollection(body_verts, facecolors=body_faces, edgecolors=body_edges, linewidths=1.6))
+            ax.autoscale_view()
 
             # Add padding on right side for future expansion
-            ax.set_xlim(-5, len(plot_df) + 15)
-            
-            # Draw Fair Value Gaps (FVGs) with labels
-            if market_structure.fair_value_gaps:
-                fvg_count = 0
-                for fvg_low, fvg_high in market_structure.fair_value_gaps[-5:]:  # Last 5 FVGs
-                    fvg_count += 1
-                    # Draw translucent zone for FVG with subtle glow
-                    ax.axhspan(fvg_low, fvg_high, alpha=0.12, color='#FF9800')
-                    # Add borders
-                    ax.axhline(fvg_low, color='#FF9800', linestyle=':', linewidth=1.2, alpha=0.6)
-                    ax.axhline(fvg_high, color='#FF9800', linestyle=':', linewidth=1.2, alpha=0.6)
-                    # Add label on right side
-                    mid_price = (fvg_low + fvg_high) / 2
-                    ax.text(len(plot_df) + 8, mid_price, f"FVG{fvg_count}", fontsize=8, color='#FF9800',
+            ax.set_xlim(-5, n + 15)
+            
+            # Full-width horizontals: x in axes fraction (like axhline/axhspan), y in data
+            full_width = ax.get_yaxis_transform()
+
+            def _zone_bands(zones, color, span_alpha, linestyle, linewidth, line_alpha, tag):
+                """Shade price zones and draw their borders as one collection each, labelled on the right."""
+                bounds = _np.asarray(zones, dtype=float).reshape(-1, 2)
+                verts = [((0, lo), (1, lo), (1, hi), (0, hi)) for lo, hi in bounds.tolist()]
+                ax.add_collection(PolyCollection(verts, facecolors=to_rgba(color, span_alpha),
+                                                 edgecolors=to_rgba(color, span_alpha), transform=full_width),
+                                  autolim=False)
+                ax.hlines(bounds.ravel(), 0, 1, transform=full_width, colors=color,
+                          linestyles=linestyle, linewidth=linewidth, alpha=line_alpha)
+                for i, mid_price in enumerate(bounds.mean(axis=1).tolist(), 1):
+                    ax.text(label_x, mid_price, f"{tag}{i}", fontsize=8, color=color,
                            weight='bold', verticalalignment='center', family='monospace')
+
+            # Draw Fair Value Gaps (FVGs) with labels (last 5)
+            if market_structure.fair_value_gaps:
+                _zone_bands(market_structure.fair_value_gaps[-5:], '#FF9800', 0.12, ':', 1.2, 0.6, 'FVG')
             
-            # Draw Order Blocks with labels
+            # Draw Order Blocks with labels (last 3)
             if market_structure.order_blocks:
-                ob_count = 0
-                for ob_low, ob_high in market_structure.order_blocks[-3:]:  # Last 3 order blocks
-                    ob_count += 1
-                    ax.axhspan(ob_low, ob_high, alpha=0.08, color='#9C27B0')
-                    ax.axhline(ob_low, color='#9C27B0', linestyle='-.', linewidth=1, alpha=0.4)
-                    ax.axhline(ob_high, color='#9C27B0', linestyle='-.', linewidth=1, alpha=0.4)
-                    # Add label on right side
-                    mid_price = (ob_low + ob_high) / 2
-                    ax.text(len(plot_df) + 8, mid_price, f"OB{ob_count}", fontsize=8, color='#9C27B0',
-                           weight='bold', verticalalignment='center', family='monospace')
+                _zone_bands(market_structure.order_blocks[-3:], '#9C27B0', 0.08, '-.', 1, 0.4, 'OB')
             
             # Mark Candlestick Patterns with labels
-            if patterns.candlestick_patterns and len(plot_df) > 0:
-                last_idx = len(plot_df) - 1
-                last_price = plot_df.iloc[-1]['Close']
+            if patterns.candlestick_patterns and n > 0:
+                last_idx = n - 1
+                last_price = last_close
                 pattern_text = ', '.join(patterns.candlestick_patterns[:3])
                 ax.annotate(f"Candlestick:\n{pattern_text}", xy=(last_idx, last_price),
                            xytext=(-120, -120), textcoords='offset points',
@@ -14011,7 +14776,7 @@ List:"""
                        verticalalignment='top', family='monospace')
             
             # Entry point (last bar) with clear label
-            entry_idx = len(plot_df) - 1
+            entry_idx = n - 1
             entry_color = '#00ff00' if trade.action == 'BUY' else '#ff0000'
             
             # Circle entry point
@@ -14029,17 +14794,17 @@ List:"""
             
             # Stop loss line with label
             ax.axhline(trade.stop_loss, color='#ff0000', linestyle='--', linewidth=2.2, alpha=0.85, label=f'Stop Loss: ${trade.stop_loss:.2f}')
-            ax.text(len(plot_df) + 1, trade.stop_loss, 'SL', fontsize=9, color='#ff0000', weight='bold', family='monospace')
+            ax.text(right_x, trade.stop_loss, 'SL', fontsize=9, color='#ff0000', weight='bold', family='monospace')
             
             # Take profit lines with labels
             ax.axhline(trade.take_profit_1, color='#00ff00', linestyle='--', linewidth=2.2, alpha=0.85, label=f'TP1: ${trade.take_profit_1:.2f}')
-            ax.text(len(plot_df) + 1, trade.take_profit_1, 'TP1', fontsize=9, color='#00ff00', weight='bold', family='monospace')
+            ax.text(right_x, trade.take_profit_1, 'TP1', fontsize=9, color='#00ff00', weight='bold', family='monospace')
             
             ax.axhline(trade.take_profit_2, color='#00ff00', linestyle='--', linewidth=1.8, alpha=0.65, label=f'TP2: ${trade.take_profit_2:.2f}')
-            ax.text(len(plot_df) + 1, trade.take_profit_2, 'TP2', fontsize=9, color='#00ff00', weight='bold', family='monospace')
+            ax.text(right_x, trade.take_profit_2, 'TP2', fontsize=9, color='#00ff00', weight='bold', family='monospace')
             
             ax.axhline(trade.take_profit_3, color='#00ff00', linestyle='--', linewidth=1.4, alpha=0.45, label=f'TP3: ${trade.take_profit_3:.2f}')
-            ax.text(len(plot_df) + 1, trade.take_profit_3, 'TP3', fontsize=9, color='#00ff00', weight='bold', family='monospace')
+            ax.text(right_x, trade.take_profit_3, 'TP3', fontsize=9, color='#00ff00', weight='bold', family='monospace')
             
             # Title and labels
             try:
@@ -14059,52 +14824,39 @@ List:"""
                 highs = plot_df['High'].values
                 lows = plot_df['Low'].values
                 closes = plot_df['Close'].values if 'Close' in plot_df.columns else plot_df['close'].values
-                n = len(plot_df)
                 if n >= 20:
-                    # Detect local peaks/troughs
-                    peak_idx = []
-                    trough_idx = []
-                    for i in range(2, n-2):
-                        if highs[i] > highs[i-1] and highs[i] > highs[i+1] and highs[i] > highs[i-2] and highs[i] > highs[i+2]:
-                            peak_idx.append(i)
-                        if lows[i] < lows[i-1] and lows[i] < lows[i+1] and lows[i] < lows[i-2] and lows[i] < lows[i+2]:
-                            trough_idx.append(i)
+                    # Detect local peaks/troughs (strictly beyond both neighbours on each side)
+                    mid_h = highs[2:-2]
+                    mid_l = lows[2:-2]
+                    peak_mask = (mid_h > highs[1:-3]) & (mid_h > highs[3:-1]) & (mid_h > highs[:-4]) & (mid_h > highs[4:])
+                    trough_mask = (mid_l < lows[1:-3]) & (mid_l < lows[3:-1]) & (mid_l < lows[:-4]) & (mid_l < lows[4:])
 
                     # Candidate levels from peaks and troughs
-                    levels = [highs[i] for i in peak_idx] + [lows[i] for i in trough_idx]
-                    if levels:
-                        price_range = float(max(highs) - min(lows))
+                    levels = _np.concatenate([mid_h[peak_mask], mid_l[trough_mask]]).astype(float)
+                    if levels.size:
+                        price_range = float(highs.max() - lows.min())
                         tol = max(0.01, price_range * 0.002)  # ~0.2% of range, min 1c
 
-                        # Cluster levels by proximity
-                        levels_sorted = sorted(levels)
-                        clusters = []  # list of [values]
-                        current = [levels_sorted[0]]
-                        for v in levels_sorted[1:]:
-                            if abs(v - _np.mean(current)) <= tol:
-                                current.append(v)
-                            else:
-                                clusters.append(current)
-                                current = [v]
-                        if current:
-                            clusters.append(current)
-
-                        # Score clusters by touch count
-                        scored = []
-                        for c in clusters:
-                            level = float(_np.mean(c))
-                            touches = sum(1 for x in levels if abs(x - level) <= tol)
-                            scored.append((touches, level))
+                        # Cluster sorted levels wherever the gap to the next exceeds tol; means via reduceat
+                        levels_sorted = _np.sort(levels)
+                        starts = _np.concatenate(([0], _np.flatnonzero(_np.diff(levels_sorted) > tol) + 1))
+                        sizes = _np.diff(_np.append(starts, levels_sorted.size))
+                        centers = _np.add.reduceat(levels_sorted, starts) / sizes
+
+                        # Score clusters by touch count: levels within +/-tol, via binary search
+                        touch_counts = (_np.searchsorted(levels_sorted, centers + tol, side='right')
+                                        - _np.searchsorted(levels_sorted, centers - tol, side='left'))
+                        scored = list(zip(touch_counts.tolist(), centers.tolist()))
 
                         # Keep top 5 well-respected levels with >=3 touches
                         top_levels = [lvl for (tch,lvl) in sorted(scored, key=lambda x: (-x[0], -x[1])) if tch >= 3][:5]
 
-                        # Draw SR lines with labels
-                        sr_count = 0
-                        for lvl in top_levels:
-                            sr_count += 1
-                            ax.axhline(lvl, color='#4FC3F7', linestyle=':', linewidth=1.3, alpha=0.75)
-                            ax.text(len(plot_df) + 1, lvl, f"R{sr_count}", fontsize=8, color='#4FC3F7', weight='bold', family='monospace')
+                        # Draw SR lines (one collection) with labels
+                        if top_levels:
+                            ax.hlines(top_levels, 0, 1, transform=full_width, colors='#4FC3F7',
+                                      linestyles=':', linewidth=1.3, alpha=0.75)
+                        for sr_count, lvl in enumerate(top_levels, 1):
+                            ax.text(right_x, lvl, f"R{sr_count}", fontsize=8, color='#4FC3F7', weight='bold', family='monospace')
                         if top_levels:
                             sr_proxy = Line2D([0],[0], color='#4FC3F7', linestyle=':', linewidth=1.3, alpha=0.75)
                             ax.legend([sr_proxy], [f"Support/Resistance ({len(top_levels)})"], loc='upper right', fontsize=10, facecolor='#1a1a1a', edgecolor='#4FC3F7', framealpha=0.95)
@@ -14115,10 +14867,10 @@ List:"""
             try:
                 win_high = float(plot_df['High'].max())
                 win_low = float(plot_df['Low'].min())
-                ax.axhline(win_high, color='#FFD54F', linestyle='--', linewidth=1.3, alpha=0.7)
-                ax.axhline(win_low, color='#FFD54F', linestyle='--', linewidth=1.3, alpha=0.7)
-                ax.text(len(plot_df) + 1, win_high, 'HI', fontsize=8, color='#FFD54F', weight='bold', family='monospace')
-                ax.text(len(plot_df) + 1, win_low, 'LO', fontsize=8, color='#FFD54F', weight='bold', family='monospace')
+                ax.hlines([win_high, win_low], 0, 1, transform=full_width, colors='#FFD54F',
+                          linestyles='--', linewidth=1.3, alpha=0.7)
+                ax.text(right_x, win_high, 'HI', fontsize=8, color='#FFD54F', weight='bold', family='monospace')
+                ax.text(right_x, win_low, 'LO', fontsize=8, color='#FFD54F', weight='bold', family='monospace')
             except Exception:
                 pass
 
@@ -14143,24 +14895,28 @@ List:"""
                     verticalalignment='top', bbox=dict(boxstyle='round,pad=1', facecolor='#1a1a1a', 
                     alpha=0.97, edgecolor=entry_color, linewidth=3))
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             # Save chart
             chart_dir = RESULTS_DIR / ticker
             chart_dir.mkdir(exist_ok=True)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             chart_path = chart_dir / f'analysis_{timestamp}.png'
-            plt.savefig(chart_path, dpi=120, bbox_inches='tight', facecolor='#1a1a1a')
-            plt.close(fig)
+            fig.savefig(chart_path, dpi=120, facecolor='#1a1a1a', pil_kwargs={'compress_level': 1, 'optimize': False})
             
             console.print(f"[green]📊 Chart saved: {chart_path}[/green]")
             
-            # Auto-open chart
+            # Auto-open only for an interactive session; batch runs must not stall on a viewer
             try:
-                import os
-                os.startfile(str(chart_path))
+                interactive = sys.stdin.isatty() and sys.stdout.isatty()
             except Exception:
-                pass
+                interactive = False
+            # os.startfile is Windows-only; config 'open_charts' turns the viewer off
+            if interactive and sys.platform == 'win32' and (self.config or {}).get('open_charts', True):
+                try:
+                    os.startfile(str(chart_path))
+                except OSError:
+                    pass
             
             # Generate interactive HTML chart with Plotly
             try:
@@ -14168,11 +14924,12 @@ List:"""
                 if html_path:
                     console.print(f"[green]🌐 Interactive chart saved: {html_path}[/green]")
                     # Auto-open in browser
-                    try:
-                        import webbrowser
-                        webbrowser.open(f'file://{html_path}')
-                    except Exception:
-                        pass
+                    if interactive:
+                        try:
+                            import webbrowser
+                            webbrowser.open(f'file://{html_path}')
+                        except Exception:
+                            pass
             except Exception as e:
                 logger.debug(f"Interactive chart generation skipped: {e}")
                 
@@ -14610,17 +15367,49 @@ List:"""
             traceback.print_exc()
             return None
     
+    _TRACKING_COLS = (
+        'timestamp','ticker','action','entry_price','stop_loss','tp1','tp2','tp3',
+        'confidence','win_prob','risk_amount','reward_amount','rr_ratio','position_size',
+        'took_trade','during_market_hours','current_price','hypothetical_pnl','hypothetical_pnl_pct','status','exit_price','actual_pnl','actual_pnl_pct',
+        'exit_date','bars_since_entry','primary_reason'
+    )
+    _TRACKING_NUMERIC_COLS = (
+        'entry_price','stop_loss','tp1','tp2','tp3','confidence','win_prob',
+        'risk_amount','reward_amount','rr_ratio','position_size','current_price',
+        'hypothetical_pnl','exit_price','actual_pnl'
+    )
+    _TRACKING_STATUSES = frozenset({'OPEN','STOPPED','TP1_HIT','TP2_HIT','TP3_HIT'})
+    _TRACKING_FLUSH_EVERY = 20
+    
+    def _tracking_writer(self):
+        """csv.writer over the tracking CSV, opened once for append with a 1 MiB buffer (header on create)."""
+        fh = self._tracking_fh
+        if fh is None or fh.closed:
+            import csv as _csv
+            tracking_file = RESULTS_DIR / 'ai_performance_tracking.csv'
+            is_new = not tracking_file.exists()
+            fh = self._tracking_fh = open(tracking_file, 'a', newline='', encoding='utf-8', buffering=1 << 20)
+            # '\n' rows, matching the rewrites in _save_tracking_df
+            self._tracking_csv = _csv.writer(fh, lineterminator='\n')
+            if is_new:
+                self._tracking_csv.writerow(self._TRACKING_COLS)
+        return self._tracking_csv
+    
+    def _flush_tracking(self):
+        """Push buffered tracking rows to disk (before reads/rewrites and at exit)."""
+        fh = self._tracking_fh
+        if fh is not None and not fh.closed:
+            try:
+                fh.flush()
+            except Exception:
+                pass
+        self._tracking_unflushed = 0
+    
     def _track_trade_decision(self, ticker: str, trade: TradeSummary, took_trade: bool, df: pd.DataFrame):
         """Track trade decision for future monitoring and performance tracking."""
-        tracking_file = RESULTS_DIR / 'ai_performance_tracking.csv'
-        
-        # Initialize tracking file if doesn't exist
-        if not tracking_file.exists():
-            with open(tracking_file, 'w') as f:
-                f.write('timestamp,ticker,action,entry_price,stop_loss,tp1,tp2,tp3,confidence,win_prob,risk_amount,reward_amount,rr_ratio,position_size,took_trade,during_market_hours,current_price,hypothetical_pnl,hypothetical_pnl_pct,status,exit_price,actual_pnl,actual_pnl_pct,exit_date,bars_since_entry,primary_reason\n')
-        
         # Get current price (last close)
-        current_price = df['Close'].iloc[-1] if 'Close' in df.columns else df['close'].iloc[-1]
+        close_col = 'Close' if 'Close' in df.columns else 'close'
+        current_price = float(df[close_col].iat[-1])
         
         # Save as OPEN trade - will be monitored later
         status = 'OPEN'
@@ -14628,72 +15417,182 @@ List:"""
         exit_price = current_price
         
         # Determine if request happened during US equity hours including pre/after (PT 1:00–17:00, Mon–Fri)
-        try:
-            from zoneinfo import ZoneInfo
-            now_pt = datetime.now(ZoneInfo('America/Los_Angeles'))
-            is_weekday = now_pt.weekday() < 5
-            open_pt = now_pt.replace(hour=1, minute=0, second=0, microsecond=0)
-            close_pt = now_pt.replace(hour=17, minute=0, second=0, microsecond=0)
-            during_market_hours = bool(is_weekday and (now_pt >= open_pt) and (now_pt <= close_pt))
-        except Exception:
+        if _PT_TZ is not None:
+            now_pt = datetime.now(_PT_TZ)
+            during_market_hours = now_pt.weekday() < 5 and 1 <= now_pt.hour < 17
+        else:
             during_market_hours = ''  # fallback empty -> will be computed later if needed
 
         # Save to tracking file with AI's exact position size
-        with open(tracking_file, 'a') as f:
-            f.write(f"{trade.timestamp},{ticker},{trade.action},{trade.entry_price},{trade.stop_loss},"
-                   f"{trade.take_profit_1},{trade.take_profit_2},{trade.take_profit_3},"
-                   f"{trade.confidence},{trade.win_probability},{trade.risk_amount},{trade.reward_amount},"
-                   f"{trade.risk_reward_ratio},{trade.position_size},{took_trade},{during_market_hours},{current_price},{hypothetical_pnl:.2f},"
-                   f"{status},{exit_price},{hypothetical_pnl},,"
-                   f"\"{trade.primary_reason[:100]}\"\n")
+        self._tracking_writer().writerow((
+            trade.timestamp, ticker, trade.action, trade.entry_price, trade.stop_loss,
+            trade.take_profit_1, trade.take_profit_2, trade.take_profit_3,
+            trade.confidence, trade.win_probability, trade.risk_amount, trade.reward_amount,
+            trade.risk_reward_ratio, trade.position_size, took_trade, during_market_hours, current_price,
+            round(hypothetical_pnl, 2), '', status, exit_price, hypothetical_pnl, '', '', '',
+            trade.primary_reason[:100],
+        ))
+        self._tracking_unflushed += 1
+        if self._tracking_unflushed >= self._TRACKING_FLUSH_EVERY:
+            self._flush_tracking()
         
         console.print(f"[dim]✓ Trade tracked - will monitor for TP/SL hits (Position: {trade.position_size} shares)[/dim]")
     
     def _load_tracking_df(self, tracking_file) -> pd.DataFrame:
+        """Load tracked trades, preferring the typed Parquet copy next to the CSV.
+
+        Rows are only ever appended to the CSV, so when it is newer than the Parquet
+        snapshot the extra trailing CSV rows are the trades tracked since; they are
+        parsed and appended. Falls back to the CSV alone without pyarrow or a snapshot.
+        """
+        parquet_file = Path(tracking_file).with_suffix('.parquet')
+        df = None
+        if parquet_file.exists():
+            try:
+                import pyarrow  # noqa: F401 - pandas' parquet engine
+                df = pd.read_parquet(parquet_file)
+                if tracking_file.exists() and tracking_file.stat().st_mtime > parquet_file.stat().st_mtime:
+                    tail = self._read_tracking_csv(tracking_file).iloc[len(df):]
+                    if len(tail):
+                        df = pd.concat([df, tail], ignore_index=True)
+            except Exception:
+                df = None
+        if df is None:
+            df = self._read_tracking_csv(tracking_file)
+        # Open trades whose live fields were saved to the sidecar only replace their rows
+        side = self._read_open_positions(tracking_file)
+        if side is not None:
+            rows = side.index[side.index < len(df)]
+            df = pd.concat([df.drop(index=rows), side.loc[rows]]).sort_index()
+        return df
+
+    def _read_open_positions(self, tracking_file) -> Optional[pd.DataFrame]:
+        """open_positions.parquet indexed by main-store row, or None if missing or older than the snapshot."""
+        open_file = Path(tracking_file).with_name('open_positions.parquet')
+        parquet_file = Path(tracking_file).with_suffix('.parquet')
+        try:
+            if not open_file.exists():
+                return None
+            if parquet_file.exists() and open_file.stat().st_mtime < parquet_file.stat().st_mtime:
+                return None
+            import pyarrow  # noqa: F401 - pandas' parquet engine
+            return pd.read_parquet(open_file)
+        except Exception:
+            return None
+
+    def _load_open_trades(self, tracking_file) -> Optional[pd.DataFrame]:
+        """OPEN tracked trades from the sidecar plus trades appended to the CSV since the snapshot.
+
+        Indexed by main-store row like a slice of _load_tracking_df(); None when there
+        is no usable sidecar and the whole file has to be read.
+        """
+        side = self._read_open_positions(tracking_file)
+        if side is None:
+            return None
+        parquet_file = Path(tracking_file).with_suffix('.parquet')
+        try:
+            n_main = 0
+            if parquet_file.exists():
+                import pyarrow.parquet as pq
+                n_main = pq.ParquetFile(parquet_file).metadata.num_rows
+            if tracking_file.exists() and (n_main == 0 or tracking_file.stat().st_mtime > parquet_file.stat().st_mtime):
+                tail = self._read_tracking_csv(tracking_file).iloc[n_main:]
+                tail = tail[~tail.index.isin(side.index)]
+                if len(tail):
+                    side = pd.concat([side, tail])
+        except Exception:
+            return None
+        return side[side['status'] == 'OPEN'].copy()
+
+    def _read_tracking_csv(self, tracking_file) -> pd.DataFrame:
         """Robustly load the tracking CSV even if schema changed across rows.
 
-        Handles older rows with fewer columns and newer rows with added columns
-        by reading via csv.DictReader and normalizing to the expected schema.
+        Reads with pandas' C parser (short legacy rows are padded) and normalizes to
+        the expected schema. Rows wider than the header make the C parser fail; those
+        files go through csv.DictReader, which keeps such rows.
         """
         import csv as _csv
-        expected_cols = [
-            'timestamp','ticker','action','entry_price','stop_loss','tp1','tp2','tp3',
-            'confidence','win_prob','risk_amount','reward_amount','rr_ratio','position_size',
-            'took_trade','during_market_hours','current_price','hypothetical_pnl','hypothetical_pnl_pct','status','exit_price','actual_pnl','actual_pnl_pct',
-            'exit_date','bars_since_entry','primary_reason'
-        ]
-        rows = []
+        expected_cols = list(self._TRACKING_COLS)
         try:
-            with open(tracking_file, 'r', newline='', encoding='utf-8') as f:
-                reader = _csv.DictReader(f)
-                # Map each row into the expected schema, filling missing with ''
-                for r in reader:
-                    clean = {col: r.get(col, '') for col in expected_cols}
-                    rows.append(clean)
-        except Exception as e:
-            # Fallback: try pandas with python engine, skipping bad lines
+            df = pd.read_csv(tracking_file, encoding='utf-8', dtype=str, keep_default_na=False)
+            df = df.reindex(columns=expected_cols, fill_value='')
+        except pd.errors.ParserError:
+            rows = []
             try:
-                return pd.read_csv(tracking_file, engine='python', on_bad_lines='skip')
-            except Exception:
-                raise e
-
-        df = pd.DataFrame(rows, columns=expected_cols)
-        # Coerce numerics
-        numeric_cols = [
-            'entry_price','stop_loss','tp1','tp2','tp3','confidence','win_prob',
-            'risk_amount','reward_amount','rr_ratio','position_size','current_price',
-            'hypothetical_pnl','exit_price','actual_pnl'
-        ]
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+                with open(tracking_file, 'r', newline='', encoding='utf-8') as f:
+                    reader = _csv.DictReader(f)
+                    # Map each row into the expected schema, filling missing with ''
+                    for r in reader:
+                        clean = {col: r.get(col, '') for col in expected_cols}
+                        rows.append(clean)
+            except Exception as e:
+                # Fallback: try pandas with python engine, skipping bad lines
+                try:
+                    return pd.read_csv(tracking_file, engine='python', on_bad_lines='skip')
+                except Exception:
+                    raise e
+            df = pd.DataFrame(rows, columns=expected_cols)
+
+        # Coerce numerics in one block assignment
+        existing = [c for c in self._TRACKING_NUMERIC_COLS if c in df.columns]
+        df[existing] = df[existing].apply(pd.to_numeric, errors='coerce')
         return df
 
+    def _typed_tracking_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Columns in file order with the types the CSV loader produces, for Parquet writes."""
+        typed = df.reindex(columns=list(self._TRACKING_COLS), fill_value='')
+        numeric = frozenset(self._TRACKING_NUMERIC_COLS)
+        for col in typed.columns:
+            if col in numeric:
+                typed[col] = pd.to_numeric(typed[col], errors='coerce')
+            else:
+                typed[col] = typed[col].fillna('').astype(str)
+        return typed
+
+    def _save_open_positions(self, open_df: pd.DataFrame, tracking_file) -> bool:
+        """Write OPEN rows (index = main-store row) to open_positions.parquet; False without pyarrow."""
+        try:
+            import pyarrow  # noqa: F401 - pandas' parquet engine
+        except ImportError:
+            return False
+        typed = self._typed_tracking_df(open_df)
+        typed.index = open_df.index.to_numpy(dtype='int64')
+        typed.index.name = '_row'
+        typed.to_parquet(Path(tracking_file).with_name('open_positions.parquet'), compression='zstd', index=True)
+        return True
+
+    def _save_tracking_df(self, df: pd.DataFrame, tracking_file):
+        """Persist tracked trades: Parquet (zstd) as the primary copy, CSV as a mirror.
+
+        The CSV is rewritten only with config 'export_csv' or when pyarrow is missing;
+        otherwise it keeps serving as the append log for newly tracked trades. The
+        open-positions sidecar is rebuilt from the saved rows.
+        """
+        import csv as _csv
+        df = df.reset_index(drop=True)
+        # Add any missing columns before saving
+        for col in self._TRACKING_COLS:
+            if col not in df.columns:
+                df[col] = ''
+        df = df[list(self._TRACKING_COLS)]
+        try:
+            import pyarrow  # noqa: F401 - pandas' parquet engine
+        except ImportError:
+            df.to_csv(tracking_file, index=False, quoting=_csv.QUOTE_MINIMAL, chunksize=10000, lineterminator='\n')
+            return
+        if (self.config or {}).get('export_csv', False):
+            df.to_csv(tracking_file, index=False, quoting=_csv.QUOTE_MINIMAL, chunksize=10000, lineterminator='\n')
+        # Written after the CSV so the snapshot is never older than a CSV rewritten alongside it,
+        # and before the sidecar so the sidecar counts as current
+        self._typed_tracking_df(df).to_parquet(Path(tracking_file).with_suffix('.parquet'), compression='zstd', index=False)
+        self._save_open_positions(df[df['status'] == 'OPEN'], tracking_file)
+
     def _migrate_tracking_file(self):
         """Fix rows where exit_date precedes entry timestamp; reopen and clear exits.
 
         Also standardizes the CSV columns/order to prevent future tokenization issues.
         """
+        self._flush_tracking()
         tracking_file = RESULTS_DIR / 'ai_performance_tracking.csv'
         if not tracking_file.exists():
             return
@@ -14701,45 +15600,55 @@ List:"""
             df = self._load_tracking_df(tracking_file)
             if df is None or len(df) == 0:
                 return
-            # Parse dates and find backdated exits
-            ts = pd.to_datetime(df.get('timestamp'), errors='coerce')
-            ed = pd.to_datetime(df.get('exit_date'), errors='coerce')
-            mask = (
-                df.get('status').fillna('OPEN') != 'OPEN'
-            ) & ed.notna() & ts.notna() & (ed < ts)
+            # Parse dates and find backdated exits (one pass over plain arrays)
+            ts_arr = pd.to_datetime(df['timestamp'], errors='coerce').to_numpy()
+            ed_arr = pd.to_datetime(df['exit_date'], errors='coerce').to_numpy()
+            status_arr = df['status'].fillna('OPEN').to_numpy()
+            mask = (status_arr != 'OPEN') & ~np.isnat(ed_arr) & ~np.isnat(ts_arr) & (ed_arr < ts_arr)
+
+            # Only rewrite when a row was fixed, or the CSV is the sole copy and its header is stale
+            dirty = False
+            if not tracking_file.with_suffix('.parquet').exists():
+                with open(tracking_file, 'r', encoding='utf-8', newline='') as f:
+                    dirty = f.readline().rstrip('\r\n') != ','.join(self._TRACKING_COLS)
 
             if mask.any():
-                df.loc[mask, 'status'] = 'OPEN'
-                df.loc[mask, 'exit_price'] = ''
-                df.loc[mask, 'actual_pnl'] = 0
-                df.loc[mask, 'exit_date'] = ''
+                # exit_price is numeric after loading; NaN writes out as the same empty cell as ''
+                df.loc[mask, ['status', 'exit_price', 'actual_pnl', 'exit_date']] = ['OPEN', np.nan, 0, '']
+                dirty = True
 
             # Sanitize invalid status values from legacy rows
-            allowed_status = {'OPEN','STOPPED','TP1_HIT','TP2_HIT','TP3_HIT'}
             if 'status' in df.columns:
-                invalid_status = ~df['status'].isin(list(allowed_status))
+                invalid_status = ~df['status'].isin(self._TRACKING_STATUSES)
                 if invalid_status.any():
                     df.loc[invalid_status, 'status'] = 'OPEN'
+                    dirty = True
 
-                # Ensure consistent columns and save
-                import csv as _csv
-                expected_cols = [
-                    'timestamp','ticker','action','entry_price','stop_loss','tp1','tp2','tp3',
-                    'confidence','win_prob','risk_amount','reward_amount','rr_ratio','position_size',
-                    'took_trade','during_market_hours','current_price','hypothetical_pnl','hypothetical_pnl_pct','status','exit_price','actual_pnl','actual_pnl_pct',
-                    'exit_date','bars_since_entry','primary_reason'
-                ]
-                for col in expected_cols:
-                    if col not in df.columns:
-                        df[col] = ''
-                df = df[expected_cols]
-                df.to_csv(tracking_file, index=False, quoting=_csv.QUOTE_MINIMAL)
+            if dirty:
+                self._save_tracking_df(df, tracking_file)
         except Exception:
             # Non-fatal; updater will still try to work
             pass
 
+    @staticmethod
+    def _tracking_fetch_attempts(days_since_entry: int) -> List[Tuple[str, str]]:
+        """(period, interval) fetch order for a tracked trade of the given age, first choice first."""
+        # Prefer intraday data for recent entries to show live-ish P&L
+        if days_since_entry <= 2:
+            return [("5d","5m"), ("10d","15m"), ("3mo","1d")]
+        elif days_since_entry <= 7:
+            return [("10d","15m"), ("3mo","1d")]
+        elif days_since_entry <= 90:
+            return [("3mo","1d")]
+        elif days_since_entry <= 180:
+            return [("6mo","1d")]
+        elif days_since_entry <= 365:
+            return [("1y","1d")]
+        return [("2y","1d")]
+
     def _update_tracked_trades(self):
         """Update all open tracked trades to check if they hit TP or SL."""
+        self._flush_tracking()
         tracking_file = RESULTS_DIR / 'ai_performance_tracking.csv'
         
         if not tracking_file.exists():
@@ -14747,10 +15656,19 @@ List:"""
             return
         
         try:
-            df = self._load_tracking_df(tracking_file)
-            
-            # Filter only OPEN trades
-            open_trades = df[df['status'] == 'OPEN'].copy()
+            # The open-positions sidecar spares reading every closed trade; full load otherwise
+            df = None
+            open_trades = self._load_open_trades(tracking_file)
+            if open_trades is None:
+                df = self._load_tracking_df(tracking_file)
+                # Filter only OPEN trades
+                open_trades = df[df['status'] == 'OPEN'].copy()
+            # Repeat recommendations (same ticker/action/entry) collapse to the most recent one,
+            # the same rows the dashboard keeps, before any bars are fetched for them
+            open_trades = (open_trades.assign(ts_dt=pd.to_datetime(open_trades['timestamp'], errors='coerce'))
+                           .sort_values('ts_dt', kind='stable')
+                           .drop_duplicates(subset=['ticker', 'action', 'entry_price'], keep='last')
+                           .drop(columns='ts_dt'))
             
             if len(open_trades) == 0:
                 console.print("[dim]No open trades to update.[/dim]")
@@ -14758,21 +15676,74 @@ List:"""
             
             console.print(f"\n[yellow]Updating {len(open_trades)} open simulated trades...[/yellow]\n")
             
-            updated = False
-            for idx, row in open_trades.iterrows():
-                ticker = row['ticker']
-                action = row['action']
-                entry_price = float(row['entry_price'])
-                stop_loss = float(row['stop_loss'])
-                tp1 = float(row['tp1'])
-                tp2 = float(row['tp2'])
-                tp3 = float(row['tp3'])
-                risk_amount = float(row['risk_amount'])
-                reward_amount = float(row['reward_amount'])
-                
+            # Each trade's (period, interval) fallback ladder, deduplicated per ticker
+            ladders = set()
+            for ts, tkr in zip(open_trades['timestamp'], open_trades['ticker']):
+                try:
+                    days = (datetime.now() - pd.to_datetime(ts)).days
+                except Exception:
+                    continue
+                if tkr:
+                    ladders.add((tkr, tuple(self._tracking_fetch_attempts(days))))
+            
+            def _fetch_group(group):
+                (per, intr), tkrs = group
+                try:
+                    return per, intr, tkrs, DataManager.fetch_data_batch(sorted(tkrs), per, intr)
+                except Exception as e:
+                    logger.debug(f"Batch prefetch {per}/{intr} failed: {e}")
+                    return per, intr, tkrs, None
+            
+            # Per-run bar cache keyed (ticker, period, interval); dropped when this update returns
+            bars_cache: Dict[Tuple[str, str, str], Optional[pd.DataFrame]] = {}
+            # Prefetch the ladders rung by rung: one batch call per (period, interval) group, the
+            # groups of a rung fetched concurrently, and a rung only for tickers still without bars
+            for rung in range(max((len(attempts) for _, attempts in ladders), default=0)):
+                fetch_groups: Dict[Tuple[str, str], set] = {}
+                for tkr, attempts in ladders:
+                    if rung >= len(attempts) or (tkr, *attempts[rung]) in bars_cache:
+                        continue
+                    earlier = (bars_cache.get((tkr, *a)) for a in attempts[:rung])
+                    if any(f is not None and len(f) >= 5 for f in earlier):
+                        continue
+                    fetch_groups.setdefault(attempts[rung], set()).add(tkr)
+                if not fetch_groups:
+                    continue
+                with ThreadPoolExecutor(max_workers=len(fetch_groups)) as ex:
+                    for per, intr, tkrs, frames in ex.map(_fetch_group, fetch_groups.items()):
+                        if frames is not None:
+                            # The batch already retried its misses one by one; remember them as misses
+                            for tkr in tkrs:
+                                bars_cache[(tkr, per, intr)] = frames.get(tkr)
+            
+            # Tolerance and time-based exit settings (same for every trade, read once)
+            tol_pct = 0.0005
+            max_bars_to_close = 0
+            try:
+                if getattr(self, 'config', None):
+                    tol_pct = float(self.config.get('performance_hit_tolerance_pct', 0.0005))
+                    max_bars_to_close = int(self.config.get('performance_close_after_bars', 0))
+            except Exception:
+                pass
+            tol_up, tol_down = 1 + tol_pct, 1 - tol_pct
+            
+            # Row updates {idx: {col: value}}, written back in one assignment after the loop
+            updates: Dict[Any, Dict[str, Any]] = {}
+            # Still-open rows {idx: (current_price, shares, bars_since_entry)}; P&L computed after the loop
+            open_marks: Dict[Any, Tuple[float, float, int]] = {}
+            # Unpack the per-trade fields into plain arrays once instead of building a row Series per trade
+            levels = open_trades[['entry_price', 'stop_loss', 'tp1', 'tp2', 'tp3', 'risk_amount', 'reward_amount']].to_numpy(dtype=float)
+            if 'position_size' in open_trades.columns:
+                sizes = pd.to_numeric(open_trades['position_size'], errors='coerce').to_numpy(dtype=float)
+            else:
+                sizes = np.full(len(open_trades), np.nan)
+            trades = zip(open_trades.index, open_trades['ticker'], open_trades['action'],
+                         open_trades['timestamp'], levels.tolist(), sizes.tolist())
+            for idx, ticker, action, ts, trade_levels, position_size in trades:
+                entry_price, stop_loss, tp1, tp2, tp3, risk_amount, reward_amount = trade_levels
                 # Use the AI's exact position size from the recommendation, or calculate if missing
-                if 'position_size' in row and pd.notna(row['position_size']) and row['position_size'] != '':
-                    shares = float(row['position_size'])
+                if not np.isnan(position_size):
+                    shares = position_size
                 else:
                     # Fallback: calculate from risk parameters
                     price_distance = abs(entry_price - stop_loss)
@@ -14785,28 +15756,21 @@ List:"""
                 # Fetch latest price data
                 try:
                     # Calculate how many days since entry to determine fetch period
-                    entry_date = pd.to_datetime(row['timestamp'])
+                    entry_date = pd.to_datetime(ts)
                     days_since_entry = (datetime.now() - entry_date).days
                     
-                    # Prefer intraday data for recent entries to show live-ish P&L
-                    attempts = []
-                    if days_since_entry <= 2:
-                        attempts = [("5d","5m"), ("10d","15m"), ("3mo","1d")]
-                    elif days_since_entry <= 7:
-                        attempts = [("10d","15m"), ("3mo","1d")]
-                    elif days_since_entry <= 90:
-                        attempts = [("3mo","1d")]
-                    elif days_since_entry <= 180:
-                        attempts = [("6mo","1d")]
-                    elif days_since_entry <= 365:
-                        attempts = [("1y","1d")]
-                    else:
-                        attempts = [("2y","1d")]
+                    attempts = self._tracking_fetch_attempts(days_since_entry)
 
                     latest_df = None
                     for per, intr in attempts:
                         try:
-                            tmp = DataManager.fetch_data(ticker, per, intr)
+                            key = (ticker, per, intr)
+                            if key in bars_cache:
+                                tmp = bars_cache[key]
+                            else:
+                                # Misses are cached too, so a dead ticker is tried once per run
+                                bars_cache[key] = None
+                                tmp = bars_cache[key] = DataManager.fetch_data(ticker, per, intr)
                             if tmp is not None and len(tmp) >= 5:
                                 latest_df = tmp
                                 break
@@ -14831,40 +15795,24 @@ List:"""
                     except Exception:
                         pass
 
-                    # Get data since entry (including entry date for edge cases)
+                    # Get data since entry (including entry date for edge cases), compared
+                    # as int64 nanoseconds so mixed index/entry resolutions can't trip it
                     try:
-                        relevant_data = latest_df.loc[latest_df.index >= entry_date]
+                        idx_ns = latest_df.index.to_numpy(dtype='datetime64[ns]').view('i8')
+                        entry_ns = pd.Timestamp(entry_date).as_unit('ns').value
+                        if latest_df.index.is_monotonic_increasing:
+                            # Bars are time-ordered: binary search for the first bar at/after entry
+                            relevant_data = latest_df.iloc[int(np.searchsorted(idx_ns, entry_ns, side='left')):]
+                        else:
+                            relevant_data = latest_df[idx_ns >= entry_ns]
                     except Exception:
-                        # As a fallback, coerce both sides to numeric int64 nanoseconds
-                        try:
-                            idx_ns = pd.to_datetime(latest_df.index).view('i8')
-                            entry_ns = pd.to_datetime(entry_date).value
-                            mask = idx_ns >= entry_ns
-                            relevant_data = latest_df.loc[mask]
-                        except Exception:
-                            relevant_data = latest_df.tail(0)
+                        relevant_data = latest_df.tail(0)
                     
                     if len(relevant_data) == 0:
                         # No data at or after entry date (e.g., same day before close/weekend)
                         # Do NOT backdate exits using pre-entry candles. Treat as still OPEN and
                         # update only unrealized P&L using the latest available close.
-                        latest_close = float(latest_df.iloc[-1]['Close'])
-                        if action == 'BUY':
-                            price_diff = latest_close - entry_price
-                            hypothetical_pnl = price_diff * shares
-                            hypothetical_pnl_pct = (price_diff / entry_price * 100.0) if entry_price else 0.0
-                        else:
-                            price_diff = entry_price - latest_close
-                            hypothetical_pnl = price_diff * shares
-                            hypothetical_pnl_pct = (price_diff / entry_price * 100.0) if entry_price else 0.0
-
-                        df.at[idx, 'hypothetical_pnl'] = hypothetical_pnl
-                        df.at[idx, 'hypothetical_pnl_pct'] = hypothetical_pnl_pct
-                        df.at[idx, 'current_price'] = latest_close
-                        df.at[idx, 'bars_since_entry'] = 0
-                        updated = True
-                        pnl_color = "green" if hypothetical_pnl >= 0 else "red"
-                        console.print(f"[{pnl_color}]○ {ticker} {action}: Entry ${entry_price:.2f} → Current ${latest_close:.2f} | {shares:.0f} shares × ${price_diff:.2f} = ${hypothetical_pnl:.2f}[/{pnl_color}]")
+                        open_marks[idx] = (float(latest_df['Close'].iat[-1]), shares, 0)
                         # Skip TP/SL checks for pre-entry data
                         continue
                     
@@ -14872,140 +15820,74 @@ List:"""
                     exit_price = entry_price
                     hypothetical_pnl = 0.0
                     exit_date = ''
-                    # Tolerance and time-based exit settings
-                    tol_pct = 0.0005
-                    max_bars_to_close = 0
-                    try:
-                        if getattr(self, 'config', None):
-                            tol_pct = float(self.config.get('performance_hit_tolerance_pct', 0.0005))
-                            max_bars_to_close = int(self.config.get('performance_close_after_bars', 0))
-                    except Exception:
-                        pass
                     
-                    bar_count = 0
-                    for date, candle in relevant_data.iterrows():
-                        high = float(candle['High'])
-                        low = float(candle['Low'])
-                        close = float(candle['Close'])
-                        bar_count += 1
-                        
-                        if action == 'BUY':
-                            # Check stop loss first
-                            sl_thr = stop_loss * (1 + tol_pct)
-                            if low <= sl_thr:
-                                status = 'STOPPED'
-                                exit_price = stop_loss
-                                hypothetical_pnl = -risk_amount
-                                exit_date = date.strftime('%Y-%m-%d')
-                                break
-                            # Check take profits - use actual price movements
-                            tp3_thr = tp3 * (1 - tol_pct)
-                            tp2_thr = tp2 * (1 - tol_pct)
-                            tp1_thr = tp1 * (1 - tol_pct)
-                            if high >= tp3_thr:
-                                status = 'TP3_HIT'
-                                exit_price = tp3
-                                hypothetical_pnl = (tp3 - entry_price) * shares
-                                exit_date = date.strftime('%Y-%m-%d')
-                                break
-                            elif high >= tp2_thr:
-                                status = 'TP2_HIT'
-                                exit_price = tp2
-                                hypothetical_pnl = (tp2 - entry_price) * shares
-                                exit_date = date.strftime('%Y-%m-%d')
-                                break
-                            elif high >= tp1_thr:
-                                status = 'TP1_HIT'
-                                exit_price = tp1
-                                hypothetical_pnl = (tp1 - entry_price) * shares
-                                exit_date = date.strftime('%Y-%m-%d')
-                                break
-                        
-                        else:  # SELL
-                            # Check stop loss first
-                            sl_thr = stop_loss * (1 - tol_pct)
-                            if high >= sl_thr:
-                                status = 'STOPPED'
-                                exit_price = stop_loss
-                                hypothetical_pnl = -risk_amount
-                                exit_date = date.strftime('%Y-%m-%d')
-                                break
+                    # First bar touching SL/TP (within tol) found on whole columns; SL wins
+                    # within a bar, then TP3 > TP2 > TP1, as a bar-by-bar scan would
+                    H = relevant_data['High'].to_numpy(dtype=float)
+                    L = relevant_data['Low'].to_numpy(dtype=float)
+                    C = relevant_data['Close'].to_numpy(dtype=float)
+                    if action == 'BUY':
+                        side = 1.0
+                        sl_mask = L <= stop_loss * tol_up
+                        tp_masks = [(H >= tp * tol_down, tp, name)
+                                    for tp, name in ((tp3, 'TP3_HIT'), (tp2, 'TP2_HIT'), (tp1, 'TP1_HIT'))]
+                    else:  # SELL
+                        side = -1.0
+                        sl_mask = H >= stop_loss * tol_down
+                        tp_masks = [(L <= tp * tol_up, tp, name)
+                                    for tp, name in ((tp3, 'TP3_HIT'), (tp2, 'TP2_HIT'), (tp1, 'TP1_HIT'))]
+                    n_bars = len(C)
+                    any_hit = sl_mask | tp_masks[0][0] | tp_masks[1][0] | tp_masks[2][0]
+                    hit_i = int(any_hit.argmax()) if any_hit.any() else n_bars
+                    # Time-based exit if enabled and reached bar threshold without TP/SL
+                    time_i = max_bars_to_close - 1 if max_bars_to_close > 0 else n_bars
+                    
+                    bar_count = n_bars
+                    if hit_i < n_bars and hit_i <= time_i:
+                        bar_count = hit_i + 1
+                        exit_date = relevant_data.index[hit_i].strftime('%Y-%m-%d')
+                        if sl_mask[hit_i]:
+                            status = 'STOPPED'
+                            exit_price = stop_loss
+                            hypothetical_pnl = -risk_amount
+                        else:
                             # Check take profits - use actual price movements
-                            tp3_thr = tp3 * (1 + tol_pct)
-                            tp2_thr = tp2 * (1 + tol_pct)
-                            tp1_thr = tp1 * (1 + tol_pct)
-                            if low <= tp3_thr:
-                                status = 'TP3_HIT'
-                                exit_price = tp3
-                                hypothetical_pnl = (entry_price - tp3) * shares
-                                exit_date = date.strftime('%Y-%m-%d')
-                                break
-                            elif low <= tp2_thr:
-                                status = 'TP2_HIT'
-                                exit_price = tp2
-                                hypothetical_pnl = (entry_price - tp2) * shares
-                                exit_date = date.strftime('%Y-%m-%d')
-                                break
-                            elif low <= tp1_thr:
-                                status = 'TP1_HIT'
-                                exit_price = tp1
-                                hypothetical_pnl = (entry_price - tp1) * shares
-                                exit_date = date.strftime('%Y-%m-%d')
-                                break
-
-                        # Time-based exit if enabled and reached bar threshold without TP/SL
-                        if max_bars_to_close > 0 and bar_count >= max_bars_to_close:
-                            status = 'TIME_EXIT'
-                            exit_price = close
-                            if action == 'BUY':
-                                hypothetical_pnl = (close - entry_price) * shares
-                                hypothetical_pnl_pct = ((close - entry_price) / entry_price * 100.0) if entry_price else 0.0
-                            else:
-                                hypothetical_pnl = (entry_price - close) * shares
-                                hypothetical_pnl_pct = ((entry_price - close) / entry_price * 100.0) if entry_price else 0.0
-                            exit_date = date.strftime('%Y-%m-%d')
-                            break
+                            for tp_mask, tp, name in tp_masks:
+                                if tp_mask[hit_i]:
+                                    status = name
+                                    exit_price = tp
+                                    hypothetical_pnl = side * (tp - entry_price) * shares
+                                    break
+                    elif time_i < n_bars:
+                        bar_count = time_i + 1
+                        status = 'TIME_EXIT'
+                        exit_price = float(C[time_i])
+                        hypothetical_pnl = side * (exit_price - entry_price) * shares
+                        exit_date = relevant_data.index[time_i].strftime('%Y-%m-%d')
                     
                     # If still OPEN, calculate unrealized P&L based on current price
                     if status == 'OPEN' and len(relevant_data) > 0:
-                        current_price = float(relevant_data.iloc[-1]['Close'])
-                        
-                        if action == 'BUY':
-                            price_diff = current_price - entry_price
-                            hypothetical_pnl = price_diff * shares
-                            hypothetical_pnl_pct = (price_diff / entry_price * 100.0) if entry_price else 0.0
-                        else:  # SELL
-                            price_diff = entry_price - current_price
-                            hypothetical_pnl = price_diff * shares
-                            hypothetical_pnl_pct = (price_diff / entry_price * 100.0) if entry_price else 0.0
-                        
-                        # Update unrealized P&L for open positions
-                        df.at[idx, 'hypothetical_pnl'] = hypothetical_pnl
-                        df.at[idx, 'hypothetical_pnl_pct'] = hypothetical_pnl_pct
-                        df.at[idx, 'current_price'] = current_price
-                        df.at[idx, 'bars_since_entry'] = bar_count
-                        updated = True
-                        
-                        pnl_color = "green" if hypothetical_pnl >= 0 else "red"
-                        console.print(f"[{pnl_color}]○ {ticker} {action}: Entry ${entry_price:.2f} → Current ${current_price:.2f} | {shares:.0f} shares × ${price_diff:.2f} = ${hypothetical_pnl:.2f}[/{pnl_color}]")
+                        open_marks[idx] = (float(C[-1]), shares, bar_count)
                     
                     # Update the row if status changed to closed
                     elif status != 'OPEN':
-                        df.at[idx, 'status'] = status
-                        df.at[idx, 'exit_price'] = exit_price
-                        df.at[idx, 'hypothetical_pnl'] = hypothetical_pnl
-                        df.at[idx, 'actual_pnl'] = hypothetical_pnl
                         # Realized P&L % from entry
                         try:
                             if action == 'BUY':
-                                df.at[idx, 'actual_pnl_pct'] = ((exit_price - entry_price) / entry_price * 100.0) if entry_price else 0.0
+                                actual_pnl_pct = ((exit_price - entry_price) / entry_price * 100.0) if entry_price else 0.0
                             else:
-                                df.at[idx, 'actual_pnl_pct'] = ((entry_price - exit_price) / entry_price * 100.0) if entry_price else 0.0
+                                actual_pnl_pct = ((entry_price - exit_price) / entry_price * 100.0) if entry_price else 0.0
                         except Exception:
-                            df.at[idx, 'actual_pnl_pct'] = 0.0
-                        df.at[idx, 'exit_date'] = exit_date
-                        df.at[idx, 'bars_since_entry'] = bar_count
-                        updated = True
+                            actual_pnl_pct = 0.0
+                        updates[idx] = {
+                            'status': status,
+                            'exit_price': exit_price,
+                            'hypothetical_pnl': hypothetical_pnl,
+                            'actual_pnl': hypothetical_pnl,
+                            'actual_pnl_pct': actual_pnl_pct,
+                            'exit_date': exit_date,
+                            'bars_since_entry': bar_count,
+                        }
                         
                         pnl_color = "green" if hypothetical_pnl >= 0 else "red"
                         console.print(f"[{pnl_color}]✓ {ticker} {action}: {status} at ${exit_price:.2f} | P&L: ${hypothetical_pnl:.2f}[/{pnl_color}]")
@@ -15014,29 +15896,63 @@ List:"""
                     console.print(f"[dim]Error updating {ticker}: {e}[/dim]")
                     continue
             
+            # Unrealized P&L for every still-open trade in one pass over arrays
+            if open_marks:
+                mark_idx = list(open_marks)
+                marks = np.array(list(open_marks.values()), dtype=float)
+                current, shares_arr = marks[:, 0], marks[:, 1]
+                entry = open_trades.loc[mark_idx, 'entry_price'].to_numpy(dtype=float)
+                actions = open_trades.loc[mark_idx, 'action'].to_numpy()
+                price_diff = np.where(actions == 'BUY', 1.0, -1.0) * (current - entry)
+                pnl = price_diff * shares_arr
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    pnl_pct = np.where(entry != 0, price_diff / entry * 100.0, 0.0)
+                for k, idx in enumerate(mark_idx):
+                    updates[idx] = {
+                        'hypothetical_pnl': float(pnl[k]),
+                        'hypothetical_pnl_pct': float(pnl_pct[k]),
+                        'current_price': float(current[k]),
+                        'bars_since_entry': open_marks[idx][2],
+                    }
+                    pnl_color = "green" if pnl[k] >= 0 else "red"
+                    console.print(f"[{pnl_color}]○ {open_trades.at[idx, 'ticker']} {actions[k]}: Entry ${entry[k]:.2f} → Current ${current[k]:.2f} | {shares_arr[k]:.0f} shares × ${price_diff[k]:.2f} = ${pnl[k]:.2f}[/{pnl_color}]")
+            
             # Save updated dataframe
-            if updated:
-                # Ensure consistent column order and quoting for text fields
-                import csv as _csv
-                expected_cols = [
-                    'timestamp','ticker','action','entry_price','stop_loss','tp1','tp2','tp3',
-                    'confidence','win_prob','risk_amount','reward_amount','rr_ratio','position_size',
-                    'took_trade','during_market_hours','current_price','hypothetical_pnl','hypothetical_pnl_pct','status','exit_price','actual_pnl','actual_pnl_pct',
-                    'exit_date','bars_since_entry','primary_reason'
-                ]
-                # Add any missing columns before saving
-                for col in expected_cols:
-                    if col not in df.columns:
-                        df[col] = ''
-                df = df[expected_cols]
-                df.to_csv(tracking_file, index=False, quoting=_csv.QUOTE_MINIMAL)
+            if updates:
+                closed_any = any('status' in vals for vals in updates.values())
+                # Unrealized P&L alone only rewrites the sidecar; a close rewrites the main store
+                if closed_any or not self._save_open_positions(self._apply_tracking_updates(open_trades, updates), tracking_file):
+                    if df is None:
+                        df = self._load_tracking_df(tracking_file)
+                    self._save_tracking_df(self._apply_tracking_updates(df, updates), tracking_file)
                 console.print(f"\n[green]✓ Trade tracking updated[/green]")
         
         except Exception as e:
             console.print(f"[red]Error updating trades: {e}[/red]")
 
+    @staticmethod
+    def _apply_tracking_updates(df: pd.DataFrame, updates: Dict[Any, Dict[str, Any]]) -> pd.DataFrame:
+        """Write {row: {col: value}} updates into df in place and return it."""
+        # One .loc assignment per column set (open vs closed rows), never NaN-filling other rows
+        by_cols: Dict[Tuple[str, ...], List[Any]] = {}
+        for idx, vals in updates.items():
+            by_cols.setdefault(tuple(vals), []).append(idx)
+        for cols, idxs in by_cols.items():
+            cols = list(cols)
+            # Loaded columns may be string-typed; object columns take the numeric values as-is
+            df[cols] = df[cols].astype(object)
+            df.loc[idxs, cols] = np.array([[updates[i][c] for c in cols] for i in idxs], dtype=object)
+        return df
+
+    @staticmethod
+    def _zero_small(values, eps: float = 0.005) -> np.ndarray:
+        """Float array of `values` with |x| < eps set to 0.0 (NaN kept), so sub-cent P&L prints as 0.00."""
+        a = np.asarray(values, dtype=float)
+        return np.where(np.abs(a) < eps, 0.0, a)
+
     def _view_ai_performance(self):
         """View AI performance statistics and overall P&L."""
+        self._flush_tracking()
         tracking_file = RESULTS_DIR / 'ai_performance_tracking.csv'
         
         if not tracking_file.exists():
@@ -15056,9 +15972,8 @@ List:"""
             # Reload the dataframe after updates
             df = self._load_tracking_df(tracking_file)
             # Sanitize status values before filtering
-            allowed_status = {'OPEN','STOPPED','TP1_HIT','TP2_HIT','TP3_HIT'}
             if 'status' in df.columns:
-                df.loc[~df['status'].isin(list(allowed_status)), 'status'] = 'OPEN'
+                df.loc[~df['status'].isin(self._TRACKING_STATUSES), 'status'] = 'OPEN'
 
             # Ensure numeric types for P&L and related columns to avoid type errors
             try:
@@ -15090,29 +16005,22 @@ List:"""
             except Exception:
                 include_weekends = True
             try:
-                from zoneinfo import ZoneInfo
-                def _compute_mkt(ts):
-                    try:
-                        if pd.isna(ts) or ts == '':
-                            return False
-                        dt = pd.to_datetime(ts, errors='coerce')
-                        if pd.isna(dt):
-                            return False
-                        dt_pt = dt.tz_localize(ZoneInfo('America/Los_Angeles'), nonexistent='NaT', ambiguous='NaT') if dt.tzinfo is None else dt.tz_convert(ZoneInfo('America/Los_Angeles'))
-                        if pd.isna(dt_pt):
-                            return False
-                        is_weekday = dt_pt.weekday() < 5
-                        # Include premarket 1:00 and after-hours to 17:00 PT
-                        open_pt = dt_pt.replace(hour=1, minute=0, second=0, microsecond=0)
-                        close_pt = dt_pt.replace(hour=17, minute=0, second=0, microsecond=0)
-                        if include_weekends:
-                            return bool(dt_pt >= open_pt and dt_pt <= close_pt)
-                        else:
-                            return bool(is_weekday and (dt_pt >= open_pt) and (dt_pt <= close_pt))
-                    except Exception:
-                        return False
+                if _PT_TZ is None:
+                    raise ImportError("zoneinfo/tzdata unavailable")
                 missing_mask = (df['during_market_hours'].astype(str) == '') | (df['during_market_hours'].isna())
-                df.loc[missing_mask, 'during_market_hours'] = df.loc[missing_mask, 'timestamp'].apply(_compute_mkt)
+                if missing_mask.any():
+                    # Vectorized over the missing rows: parse, move to PT, test 1:00-17:00 (inclusive)
+                    ts = pd.to_datetime(df.loc[missing_mask, 'timestamp'], errors='coerce', format='mixed')
+                    ts_pt = (ts.dt.tz_localize(_PT_TZ, nonexistent='NaT', ambiguous='NaT')
+                             if ts.dt.tz is None else ts.dt.tz_convert(_PT_TZ))
+                    # Wall-clock hour as a float: no midnight datetimes built, and DST days aren't off by an hour
+                    hour = ts_pt.dt.hour + ts_pt.dt.minute / 60.0 + ts_pt.dt.second / 3600.0
+                    mkt = (hour >= 1.0) & (hour <= 17.0)
+                    if not include_weekends:
+                        mkt &= ts_pt.dt.weekday < 5
+                    # The loaded column may be string-typed, which rejects bools
+                    df['during_market_hours'] = df['during_market_hours'].astype(object)
+                    df.loc[missing_mask, 'during_market_hours'] = mkt.fillna(False).to_numpy(dtype=object)
                 # Cast to bool where possible
                 df['during_market_hours'] = df['during_market_hours'].astype(str).str.lower().map({'true': True, 'false': False}).fillna(df['during_market_hours'])
             except Exception:
@@ -15205,12 +16113,30 @@ List:"""
                     table.add_row("Worst Trade", f"[red]{worst_trade['ticker']} ${worst_trade['actual_pnl']:.2f}[/red]")
             
             table.add_row("", "")
-            table.add_row("Avg Confidence", f"{df['confidence'].mean():.1f}%")
-            table.add_row("Avg Win Probability", f"{df['win_prob'].mean():.1f}%")
+            means = df[['confidence', 'win_prob']].mean()
+            table.add_row("Avg Confidence", f"{means['confidence']:.1f}%")
+            table.add_row("Avg Win Probability", f"{means['win_prob']:.1f}%")
             
             console.print(table)
             console.print()
             
+            def _mmddyy(values: Optional[pd.Series], n: int) -> List[str]:
+                """Dates as MM/DD/YY ('' if unparseable), parsed as one ISO-8601 column where possible."""
+                if values is None:
+                    return [''] * n
+                try:
+                    return pd.to_datetime(values, errors='coerce', format='ISO8601').dt.strftime('%m/%d/%y').fillna('').tolist()
+                except Exception:
+                    # Mixed UTC offsets can't share one column; parse those one by one
+                    out = []
+                    for v in values:
+                        try:
+                            dt = pd.to_datetime(v, errors='coerce')
+                            out.append(dt.strftime('%m/%d/%y') if pd.notna(dt) else '')
+                        except Exception:
+                            out.append('')
+                    return out
+            
             # Recent closed trades table
             if len(closed_trades) > 0:
                 console.print("[bold cyan]📋 Recent Closed Trades (Last 10)[/bold cyan]\n")
@@ -15224,32 +16150,25 @@ List:"""
                 recent_table.add_column("P&L", justify="right", width=12)
                 recent_table.add_column("Conf%", justify="right", width=6)
                 
-                for _, row in closed_trades.tail(10).iterrows():
-                    action_color = "green" if row['action'] == 'BUY' else "red"
-                    pnl_val = row['actual_pnl']
-                    pnl_color = "green" if pnl_val > 0 else "red"
-                    status_display = row['status'].replace('_', ' ')
-
-                    # Format dates MM/DD/YY
-                    try:
-                        entry_dt = pd.to_datetime(row.get('timestamp'), errors='coerce')
-                        entry_date = entry_dt.strftime('%m/%d/%y') if pd.notna(entry_dt) else ''
-                    except Exception:
-                        entry_date = ''
-                    try:
-                        exit_dt = pd.to_datetime(row.get('exit_date'), errors='coerce')
-                        exit_date = exit_dt.strftime('%m/%d/%y') if pd.notna(exit_dt) else ''
-                    except Exception:
-                        exit_date = ''
+                recent = closed_trades.tail(10)
+                entry_dates = _mmddyy(recent.get('timestamp'), len(recent))
+                exit_dates = _mmddyy(recent.get('exit_date'), len(recent))
+                action_colors = np.where(recent['action'].to_numpy() == 'BUY', 'green', 'red').tolist()
+                pnl_colors = np.where(recent['actual_pnl'].to_numpy(dtype=float) > 0, 'green', 'red').tolist()
+                for row, entry_date, exit_date, action_color, pnl_color in zip(
+                    recent.itertuples(index=False, name='Trade'), entry_dates, exit_dates, action_colors, pnl_colors
+                ):
+                    pnl_val = row.actual_pnl
+                    status_display = row.status.replace('_', ' ')
                     
                     recent_table.add_row(
                         entry_date,
                         exit_date,
-                        row['ticker'],
-                        f"[{action_color}]{row['action']}[/{action_color}]",
+                        row.ticker,
+                        f"[{action_color}]{row.action}[/{action_color}]",
                         status_display,
                         f"[{pnl_color}]${pnl_val:.2f}[/{pnl_color}]",
-                        f"{row['confidence']:.0f}%"
+                        f"{row.confidence:.0f}%"
                     )
                 
                 console.print(recent_table)
@@ -15271,46 +16190,44 @@ List:"""
                 open_table.add_column("TP1", justify="right", width=10)
                 open_table.add_column("Bars", justify="right", width=6)
                 
-                for _, row in open_trades.tail(10).iterrows():
-                    action_color = "green" if row['action'] == 'BUY' else "red"
-                    # Format date MM/DD/YY
-                    try:
-                        entry_dt = pd.to_datetime(row.get('timestamp'), errors='coerce')
-                        entry_date = entry_dt.strftime('%m/%d/%y') if pd.notna(entry_dt) else ''
-                    except Exception:
-                        entry_date = ''
-                    
-                    # Get unrealized P&L if available
-                    unrealized_pnl = row.get('hypothetical_pnl', 0)
-                    # Avoid displaying -0.00
-                    if pd.notna(unrealized_pnl) and abs(unrealized_pnl) < 0.005:
-                        unrealized_pnl = 0.0
-                    current_price = row.get('current_price', row['entry_price'])
-                    pnl_color = "green" if unrealized_pnl >= 0 else "red"
-                    pnl_pct = row.get('hypothetical_pnl_pct', 0.0)
-                    if pd.notna(pnl_pct) and abs(pnl_pct) < 0.005:
-                        pnl_pct = 0.0
-                    bars = int(row.get('bars_since_entry', 0)) if pd.notna(row.get('bars_since_entry', 0)) else 0
+                recent = open_trades.tail(10)
+                entry_dates = _mmddyy(recent.get('timestamp'), len(recent))
+                # Unrealized P&L and P&L% for the shown rows, sub-cent values zeroed to avoid -0.00
+                shown = {}
+                for col in ('hypothetical_pnl', 'hypothetical_pnl_pct'):
+                    vals = (pd.to_numeric(recent[col], errors='coerce').to_numpy(dtype=float)
+                            if col in recent.columns else np.zeros(len(recent)))
+                    shown[col] = self._zero_small(vals).tolist()
+                action_colors = np.where(recent['action'].to_numpy() == 'BUY', 'green', 'red').tolist()
+                pnl_colors = np.where(np.asarray(shown['hypothetical_pnl']) >= 0, 'green', 'red').tolist()
+                for row, entry_date, unrealized_pnl, pnl_pct, action_color, pnl_color in zip(
+                    recent.itertuples(index=False, name='Trade'), entry_dates,
+                    shown['hypothetical_pnl'], shown['hypothetical_pnl_pct'], action_colors, pnl_colors
+                ):
+                    current_price = getattr(row, 'current_price', row.entry_price)
+                    bars = getattr(row, 'bars_since_entry', 0)
+                    bars = int(bars) if pd.notna(bars) else 0
                     
                     open_table.add_row(
                         entry_date,
-                        row['ticker'],
-                        f"[{action_color}]{row['action']}[/{action_color}]",
-                        f"${row['entry_price']:.2f}",
+                        row.ticker,
+                        f"[{action_color}]{row.action}[/{action_color}]",
+                        f"${row.entry_price:.2f}",
                         f"${current_price:.2f}",
                         f"[{pnl_color}]${unrealized_pnl:.2f}[/{pnl_color}]",
                         f"[{pnl_color}]{pnl_pct:.2f}%[/{pnl_color}]",
-                        f"${row['stop_loss']:.2f}",
-                        f"${row['tp1']:.2f}",
+                        f"${row.stop_loss:.2f}",
+                        f"${row.tp1:.2f}",
                         f"{bars}"
                     )
                 
                 console.print(open_table)
                 
                 # Show total unrealized P&L for open positions
-                total_unrealized = open_trades['hypothetical_pnl'].copy() if 'hypothetical_pnl' in open_trades.columns else pd.Series([0])
-                if isinstance(total_unrealized, pd.Series):
-                    total_unrealized = total_unrealized.apply(lambda x: 0.0 if pd.notna(x) and abs(x) < 0.005 else (x if pd.notna(x) else 0)).sum()
+                total_unrealized = 0.0
+                if 'hypothetical_pnl' in open_trades.columns:
+                    pnl_all = pd.to_numeric(open_trades['hypothetical_pnl'], errors='coerce').to_numpy(dtype=float, na_value=0.0)
+                    total_unrealized = float(self._zero_small(pnl_all).sum())
                 unrealized_color = "green" if total_unrealized >= 0 else "red"
                 console.print(f"\n[{unrealized_color}]Total Unrealized P&L: ${total_unrealized:.2f}[/{unrealized_color}]")
             
@@ -15347,6 +16264,100 @@ List:"""
         
         Prompt.ask("\nPress Enter to continue")
 
+    def _cached_yf_download(self, yf_ticker: str, period: str, interval: str, **kwargs) -> pd.DataFrame:
+        """yf.download with an on-disk parquet cache for the simulators' fallback fetches.
+
+        Entries live under <data_folder or results>/yf_cache, keyed by ticker/period/interval
+        plus any yf.download kwargs (prepost=True bars differ from regular-hours ones), and expire after 5 minutes for intraday intervals or a day otherwise. Without pyarrow
+        (or on a bad cache file) this is a plain download.
+        """
+        cache_dir = Path((self.config or {}).get('data_folder') or RESULTS_DIR) / 'yf_cache'
+        key = f"{yf_ticker}_{period}_{interval}" + ''.join(f"_{k}-{v}" for k, v in sorted(kwargs.items()))
+        cache_file = cache_dir / (re.sub(r'[^\w.-]', '_', key) + '.parquet')
+        ttl_seconds = 300 if interval.endswith(('m', 'h')) else 86400
+        try:
+            import pyarrow  # noqa: F401 - pandas' parquet engine
+            parquet_ok = True
+        except ImportError:
+            parquet_ok = False
+        if parquet_ok and cache_file.exists():
+            try:
+                if time.time() - cache_file.stat().st_mtime < ttl_seconds:
+                    return pd.read_parquet(cache_file)
+            except Exception as e:
+                logger.debug(f"yfinance cache read failed for {cache_file}: {e}")
+        raw = yf.download(yf_ticker, period=period, interval=interval, **kwargs)
+        if parquet_ok and raw is not None and not raw.empty:
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                raw.to_parquet(cache_file)
+            except Exception as e:
+                logger.debug(f"yfinance cache write failed for {cache_file}: {e}")
+        return raw
+
+    def _fallback_fetch_and_signals(self, ticker: str, style_choice: str):
+        """yfinance bars with synthetic RSI-cross signals for the replay simulator.
+
+        Walks a per-style (period, interval) ladder until one returns >= 50 bars.
+        Returns (df, time_col, buy_col, sell_col, score_col, buy_th, sell_th), or None
+        (after printing why) if nothing could be fetched.
+        """
+        style_fetch = {
+            "1": {"period": "5d", "interval": "5m"},
+            "2": {"period": "3mo", "interval": "1h"},
+            "3": {"period": "2y", "interval": "1d"},
+        }[style_choice]
+        console.print(f"[cyan]Fetching {ticker} ({style_fetch['period']} @ {style_fetch['interval']}) from yfinance...[/cyan]")
+        # Convert crypto style BTCUSDT -> BTC-USD for yfinance; leave others unchanged
+        yf_ticker = ticker.replace('USDT', '-USD') if ticker.endswith('USDT') and '-' not in ticker else ticker
+        attempts = [(style_fetch['period'], style_fetch['interval'])]
+        # Add broader fallbacks
+        if style_choice == '1':  # Day trading
+            attempts.extend([('10d','15m'), ('30d','30m'), ('90d','1h')])
+        elif style_choice == '2':  # Swing
+            attempts.extend([('6mo','1h'), ('1y','1d')])
+        else:  # Long-term
+            attempts.extend([('5y','1d'), ('10y','1d')])
+        raw = None
+        for period, interval in attempts:
+            console.print(f"[dim]Attempt fetch: period={period} interval={interval} ticker={yf_ticker}[/dim]")
+            try:
+                tmp = self._cached_yf_download(yf_ticker, period, interval, prepost=True)
+                if not tmp.empty and len(tmp) >= 50:
+                    raw = tmp
+                    console.print(f"[green]✓ Fetched {len(raw)} bars (period={period} interval={interval}).[/green]")
+                    break
+                else:
+                    console.print(f"[yellow]No data / too few bars for period={period} interval={interval}")
+            except Exception as e:
+                console.print(f"[yellow]Fetch error period={period} interval={interval}: {e}")
+        if raw is None or raw.empty:
+            console.print("[red]No data fetched after fallback attempts. Aborting replay.")
+            return None
+        raw.reset_index(inplace=True)
+        if isinstance(raw.columns, pd.MultiIndex):
+            raw.columns = [c[0] if isinstance(c, tuple) and c[0] else (c[-1] if isinstance(c, tuple) else c) for c in raw.columns]
+        # Normalize column names
+        time_col = 'Datetime' if 'Datetime' in raw.columns else ('Date' if 'Date' in raw.columns else raw.columns[0])
+        def _ensure_series(x):
+            if isinstance(x, pd.DataFrame):
+                return x.iloc[:,0]
+            if isinstance(x, np.ndarray) and x.ndim > 1:
+                return pd.Series(x[:,0])
+            return x.squeeze() if hasattr(x,'squeeze') else x
+        ts_data = _ensure_series(raw[time_col])
+        closes = _ensure_series(raw['Close'])
+        buy_sig, sell_sig, score = _rsi_cross_signals(closes.to_numpy(dtype=float))
+        df = pd.DataFrame({
+            time_col: ts_data.values if hasattr(ts_data,'values') else ts_data,
+            'close': closes.values if hasattr(closes,'values') else closes,
+            'buy_signal_column': buy_sig,
+            'sell_signal_column': sell_sig,
+            'trade_score': score,
+        })
+        # Synthetic thresholds for the (RSI - 50) / 50 score
+        return df, time_col, 'buy_signal_column', 'sell_signal_column', 'trade_score', 0.25, -0.25
+
     def _run_replay_simulator(self):
         """Visual stepwise replay with automatic defaults (no manual parameter prompts).
 
@@ -15377,182 +16388,39 @@ List:"""
             console.print("[yellow]Config incomplete. Using fallback (yfinance + synthetic signals).[/yellow]")
             fallback_mode = True
 
-        import pandas as pd
-        import numpy as np
-        
-        # Safe matplotlib import with Agg backend
+        # Frames are drawn on Agg-backed Figures (module-level OO imports, no pyplot)
         plotting_available = False
         if self.config and self.config.get('enable_plots', True):
-            try:
-                import matplotlib
-                matplotlib.use('Agg')
-                import matplotlib.pyplot as plt
+            if MATPLOTLIB_AVAILABLE:
                 plotting_available = True
-            except Exception as e:
-                console.print(f"[yellow]Plotting disabled: {e}[/yellow]")
+            else:
+                console.print("[yellow]Plotting disabled: matplotlib not installed[/yellow]")
         else:
             console.print("[yellow]Plotting disabled (enable_plots=false in config)[/yellow]")
             
         if fallback_mode:
-            try:
-                import yfinance as yf
-            except Exception:
-                console.print("[red]yfinance not installed. Install with: pip install yfinance[/red]")
+            fetched = self._fallback_fetch_and_signals(ticker, style_choice)
+            if fetched is None:
                 Prompt.ask("Press Enter")
                 return
-            style_fetch = {
-                "1": {"period": "5d", "interval": "5m"},
-                "2": {"period": "3mo", "interval": "1h"},
-                "3": {"period": "2y", "interval": "1d"},
-            }[style_choice]
-            console.print(f"[cyan]Fetching {ticker} ({style_fetch['period']} @ {style_fetch['interval']}) from yfinance...[/cyan]")
-            def _normalize_ticker(t: str) -> str:
-                # Convert crypto style BTCUSDT -> BTC-USD for yfinance; leave others unchanged
-                if t.endswith('USDT') and '-' not in t:
-                    return t.replace('USDT','-USD')
-                return t
-            yf_ticker = _normalize_ticker(ticker)
-            attempts = [(style_fetch['period'], style_fetch['interval'])]
-            # Add broader fallbacks
-            if style_choice == '1':  # Day trading
-                attempts.extend([('10d','15m'), ('30d','30m'), ('90d','1h')])
-            elif style_choice == '2':  # Swing
-                attempts.extend([('6mo','1h'), ('1y','1d')])
-            else:  # Long-term
-                attempts.extend([('5y','1d'), ('10y','1d')])
-            raw = None
-            for period, interval in attempts:
-                console.print(f"[dim]Attempt fetch: period={period} interval={interval} ticker={yf_ticker}[/dim]")
-                try:
-                    tmp = yf.download(yf_ticker, period=period, interval=interval, prepost=True)
-                    if not tmp.empty and len(tmp) >= 50:
-                        raw = tmp
-                        console.print(f"[green]✓ Fetched {len(raw)} bars (period={period} interval={interval}).[/green]")
-                        break
-                    else:
-                        console.print(f"[yellow]No data / too few bars for period={period} interval={interval}")
-                except Exception as e:
-                    console.print(f"[yellow]Fetch error period={period} interval={interval}: {e}")
-            if raw is None or raw.empty:
-                console.print("[red]No data fetched after fallback attempts. Aborting replay.")
-                Prompt.ask("Press Enter")
-                return
-            raw.reset_index(inplace=True)
-            if isinstance(raw.columns, pd.MultiIndex):
-                raw.columns = [c[0] if isinstance(c, tuple) and c[0] else (c[-1] if isinstance(c, tuple) else c) for c in raw.columns]
-            # Normalize column names
-            time_col = 'Datetime' if 'Datetime' in raw.columns else ('Date' if 'Date' in raw.columns else raw.columns[0])
-            closes = raw['Close']
-            delta = closes.diff()
-            gain = delta.clip(lower=0).rolling(14).mean()
-            loss = (-delta.clip(upper=0)).rolling(14).mean()
-            rs = gain / loss.replace(0, np.nan)
-            rsi = 100 - (100 / (1 + rs))
-            rsi.fillna(50, inplace=True)
-            buy_sig_series = ((rsi.shift(1) < 30) & (rsi >= 30)).astype(int)
-            sell_sig_series = ((rsi.shift(1) > 70) & (rsi <= 70)).astype(int)
-            score_series = (rsi - 50) / 50.0
-            def _ensure_series(x):
-                if isinstance(x, pd.DataFrame):
-                    return x.iloc[:,0]
-                if isinstance(x, np.ndarray) and x.ndim > 1:
-                    return pd.Series(x[:,0])
-                return x.squeeze() if hasattr(x,'squeeze') else x
-            ts_data = _ensure_series(raw[time_col])
-            closes = _ensure_series(closes)
-            buy_sig_series = _ensure_series(buy_sig_series)
-            sell_sig_series = _ensure_series(sell_sig_series)
-            score_series = _ensure_series(score_series)
-            df = pd.DataFrame({
-                time_col: ts_data.values if hasattr(ts_data,'values') else ts_data,
-                'close': closes.values if hasattr(closes,'values') else closes,
-                'buy_signal_column': buy_sig_series.values if hasattr(buy_sig_series,'values') else buy_sig_series,
-                'sell_signal_column': sell_sig_series.values if hasattr(sell_sig_series,'values') else sell_sig_series,
-                'trade_score': score_series.values if hasattr(score_series,'values') else score_series,
-            })
-            buy_col, sell_col, score_col = 'buy_signal_column', 'sell_signal_column', 'trade_score'
-            buy_th, sell_th = 0.25, -0.25  # synthetic thresholds
+            df, time_col, buy_col, sell_col, score_col, buy_th, sell_th = fetched
         else:
             path = Path(data_folder) / ticker / signals_name
             if not path.exists():
                 console.print(f"[yellow]Signals file missing: {path}. Switching to fallback mode.")
                 fallback_mode = True
-                import yfinance as yf
-                style_fetch = {
-                    "1": {"period": "5d", "interval": "5m"},
-                    "2": {"period": "3mo", "interval": "1h"},
-                    "3": {"period": "2y", "interval": "1d"},
-                }[style_choice]
-                def _normalize_ticker(t: str) -> str:
-                    if t.endswith('USDT') and '-' not in t:
-                        return t.replace('USDT','-USD')
-                    return t
-                yf_ticker = _normalize_ticker(ticker)
-                attempts = [(style_fetch['period'], style_fetch['interval'])]
-                if style_choice == '1':
-                    attempts.extend([('10d','15m'), ('30d','30m'), ('90d','1h')])
-                elif style_choice == '2':
-                    attempts.extend([('6mo','1h'), ('1y','1d')])
-                else:
-                    attempts.extend([('5y','1d'), ('10y','1d')])
-                raw = None
-                for period, interval in attempts:
-                    console.print(f"[dim]Attempt fetch: period={period} interval={interval} ticker={yf_ticker}[/dim]")
-                    try:
-                        tmp = yf.download(yf_ticker, period=period, interval=interval, prepost=True)
-                        if not tmp.empty and len(tmp) >= 50:
-                            raw = tmp
-                            console.print(f"[green]✓ Fetched {len(raw)} bars (period={period} interval={interval}).[/green]")
-                            break
-                        else:
-                            console.print(f"[yellow]No data / too few bars for period={period} interval={interval}")
-                    except Exception as e:
-                        console.print(f"[yellow]Fetch error period={period} interval={interval}: {e}")
-                if raw is None or raw.empty:
-                    console.print("[red]No data fetched after fallback attempts. Aborting random simulation.")
+                fetched = self._fallback_fetch_and_signals(ticker, style_choice)
+                if fetched is None:
                     Prompt.ask("Press Enter")
                     return
-                raw.reset_index(inplace=True)
-                if isinstance(raw.columns, pd.MultiIndex):
-                    raw.columns = [c[0] if isinstance(c, tuple) and c[0] else (c[-1] if isinstance(c, tuple) else c) for c in raw.columns]
-                time_col = 'Datetime' if 'Datetime' in raw.columns else ('Date' if 'Date' in raw.columns else raw.columns[0])
-                close = raw['Close']
-                delta = close.diff()
-                gain = delta.clip(lower=0).rolling(14).mean()
-                loss = (-delta.clip(upper=0)).rolling(14).mean()
-                rs = gain / loss.replace(0, np.nan)
-                rsi = 100 - (100 / (1 + rs))
-                rsi.fillna(50, inplace=True)
-                buy_sig_series = ((rsi.shift(1) < 30) & (rsi >= 30)).astype(int)
-                sell_sig_series = ((rsi.shift(1) > 70) & (rsi <= 70)).astype(int)
-                score_series = (rsi - 50) / 50.0
-                def _ensure_series(x):
-                    if isinstance(x, pd.DataFrame):
-                        return x.iloc[:,0]
-                    if isinstance(x, np.ndarray) and x.ndim > 1:
-                        return pd.Series(x[:,0])
-                    return x.squeeze() if hasattr(x,'squeeze') else x
-                ts_data = _ensure_series(raw[time_col])
-                close = _ensure_series(close)
-                buy_sig_series = _ensure_series(buy_sig_series)
-                sell_sig_series = _ensure_series(sell_sig_series)
-                score_series = _ensure_series(score_series)
-                df = pd.DataFrame({
-                    time_col: ts_data.values if hasattr(ts_data,'values') else ts_data,
-                    'close': close.values if hasattr(close,'values') else close,
-                    'buy_signal_column': buy_sig_series.values if hasattr(buy_sig_series,'values') else buy_sig_series,
-                    'sell_signal_column': sell_sig_series.values if hasattr(sell_sig_series,'values') else sell_sig_series,
-                    'trade_score': score_series.values if hasattr(score_series,'values') else score_series,
-                })
-                buy_col, sell_col, score_col = 'buy_signal_column', 'sell_signal_column', 'trade_score'
-                buy_th, sell_th = 0.25, -0.25
+                df, time_col, buy_col, sell_col, score_col, buy_th, sell_th = fetched
             else:
                 console.print(f"[dim]Loading signals: {path}[/dim]")
                 if path.suffix == '.parquet':
                     df = pd.read_parquet(path)
                 else:
                     time_col = self.config.get('time_column', 'date')
-                    df = pd.read_csv(path, parse_dates=[time_col])
+                    df = pd.read_csv(path, parse_dates=[time_col], date_format='ISO8601')
                 time_col = self.config.get('time_column', 'date')
                 signal_sets = self.config.get('signal_sets', [])
                 thr_rule = next((s for s in signal_sets if s.get('generator') == 'threshold_rule'), None)
@@ -15573,26 +16441,47 @@ List:"""
 
         out_dir = Path(data_folder) / ticker / 'replay_frames'
         out_dir.mkdir(parents=True, exist_ok=True)
-        summary = []
         total = len(df)
-        frame_idx = 0
 
         console.print(f"[dim]Generating frames (window={window}, step={step})...[/dim]")
-        for end_i in range(window, total, step):
-            if frame_idx >= max_frames:
-                break
-            current_row = df.iloc[end_i - 1]
-            price = current_row.get('close')
-            buy_sig = bool(current_row[buy_col])
-            sell_sig = bool(current_row[sell_col])
-            score_val = current_row.get(score_col) if score_col and score_col in df.columns else None
-
-            if buy_sig and not sell_sig:
-                action = 'BUY'
-            elif sell_sig and not buy_sig:
-                action = 'SELL'
-            else:
-                action = 'HOLD'
+        if plotting_available:
+            # One figure for every frame: axes are cleared and redrawn, the info text updated in place
+            fig = Figure(figsize=(9, 5))
+            FigureCanvasAgg(fig)
+            axes = fig.subplots(2 if score_col else 1, 1, sharex=True,
+                                gridspec_kw={'height_ratios': [3, 1]} if score_col else None)
+            axes = np.atleast_1d(axes)
+            info_text = fig.text(0.02, 0.02, '', fontsize=10, family='monospace')
+        # Column arrays indexed per frame instead of building a row Series each time
+        close_arr = df['close'].to_numpy()
+        buy_arr = df[buy_col].to_numpy(dtype=bool)
+        sell_arr = df[sell_col].to_numpy(dtype=bool)
+        score_arr = df[score_col].to_numpy() if score_col and score_col in df.columns else None
+        ts_arr = df[time_col].to_numpy()
+
+        # Actions, future returns and outcomes for every frame in one pass
+        end_indices = np.arange(window, total, step)[:max_frames]
+        row_ix = end_indices - 1
+        frame_buys = buy_arr[row_ix]
+        frame_sells = sell_arr[row_ix]
+        actions = np.where(frame_buys & ~frame_sells, 'BUY',
+                           np.where(frame_sells & ~frame_buys, 'SELL', 'HOLD'))
+        entry_prices = close_arr[row_ix]
+        future_prices = close_arr[np.minimum(end_indices + future_horizon, total) - 1]
+        has_future = entry_prices != 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            future_returns = (future_prices - entry_prices) / entry_prices * 100.0
+        passed = np.select([actions == 'BUY', actions == 'SELL'],
+                           [future_returns >= future_ret_thr, future_returns <= -future_ret_thr],
+                           default=np.abs(future_returns) < future_ret_thr)
+        outcomes = np.where(has_future, np.where(passed, 'PASS', 'FAIL'), 'N/A')
+        conf_pcts = np.full(len(end_indices), np.nan)
+
+        for frame_idx, end_i in enumerate(end_indices.tolist()):
+            row_i = end_i - 1
+            price = entry_prices[frame_idx]
+            score_val = score_arr[row_i] if score_arr is not None else None
+            action = str(actions[frame_idx])
 
             confidence = None
             if score_val is not None and buy_th is not None and sell_th is not None:
@@ -15602,20 +16491,8 @@ List:"""
                     confidence = min(1.0, abs(score_val / sell_th))
             conf_pct = round(confidence * 100, 1) if confidence is not None else None
 
-            # Future overlay
-            future_slice = df.iloc[end_i:end_i + future_horizon]
-            future_return = None
-            outcome = 'N/A'
-            if len(future_slice) >= 1 and price:
-                future_last = future_slice['close'].iloc[-1]
-                future_return = (future_last - price) / price * 100.0
-                # Directional success logic
-                if action == 'BUY':
-                    outcome = 'PASS' if future_return >= future_ret_thr else 'FAIL'
-                elif action == 'SELL':
-                    outcome = 'PASS' if future_return <= -future_ret_thr else 'FAIL'
-                else:  # HOLD
-                    outcome = 'PASS' if abs(future_return) < future_ret_thr else 'FAIL'
+            future_return = future_returns[frame_idx] if has_future[frame_idx] else None
+            outcome = str(outcomes[frame_idx])
 
             # Text summary for all modes
             txt = [f"Action: {action}"]
@@ -15630,10 +16507,9 @@ List:"""
 
             if plotting_available:
                 hist_slice = df.iloc[end_i - window:end_i]
-                fig, axes = plt.subplots(2 if score_col else 1, 1, figsize=(9, 5), sharex=True,
-                                     gridspec_kw={'height_ratios': [3, 1]} if score_col else None)
-                if not isinstance(axes, (list, tuple)):
-                    axes = [axes]
+                future_slice = df.iloc[end_i:end_i + future_horizon]
+                for ax in axes:
+                    ax.cla()
                 ax_price = axes[0]
                 ax_price.plot(hist_slice[time_col], hist_slice['close'], color='white')
                 ax_price.set_title(f"{ticker} Replay → {hist_slice[time_col].iloc[-1]}")
@@ -15656,30 +16532,33 @@ List:"""
                         ax_score.axhline(sell_th, color='red', linestyle='--', linewidth=0.7)
                     ax_score.set_ylabel('Score')
 
-                fig.text(0.02, 0.02, '\n'.join(txt), fontsize=10, family='monospace')
-                plt.tight_layout()
+                info_text.set_text('\n'.join(txt))
+                if frame_idx == 0:
+                    # Layout solved once on the first frame; later frames keep the same margins
+                    fig.tight_layout()
                 frame_path = out_dir / f"frame_{frame_idx:04d}.png"
-                plt.savefig(frame_path)
-                plt.close(fig)
+                fig.savefig(frame_path)
             else:
                 # Text-only mode
                 frame_path = out_dir / f"frame_{frame_idx:04d}.txt"
                 with open(frame_path, 'w', encoding='utf-8') as f:
                     f.write('\n'.join(txt))
 
-            summary.append(dict(frame=frame_idx,
-                                timestamp=current_row[time_col],
-                                action=action,
-                                price=price,
-                                score=score_val,
-                                confidence_pct=conf_pct,
-                                future_return_pct=future_return,
-                                outcome=outcome))
-            frame_idx += 1
+            if conf_pct is not None:
+                conf_pcts[frame_idx] = conf_pct
+        frame_idx = len(end_indices)
 
         # Save summary
-        import pandas as pd
-        summary_df = pd.DataFrame(summary)
+        summary_df = pd.DataFrame({
+            'frame': np.arange(frame_idx),
+            'timestamp': ts_arr[row_ix],
+            'action': actions,
+            'price': entry_prices,
+            'score': score_arr[row_ix] if score_arr is not None else np.nan,
+            'confidence_pct': conf_pcts,
+            'future_return_pct': np.where(has_future, future_returns, np.nan),
+            'outcome': outcomes,
+        })
         summary_file = out_dir / 'replay_summary.csv'
         summary_df.to_csv(summary_file, index=False)
         console.print(f"\n[green]Generated {frame_idx} frames in {out_dir}[/green]")
@@ -15692,8 +16571,6 @@ List:"""
         Replaces traditional backtest for quick subjective accuracy review.
         """
         import random
-        import pandas as pd
-        from pathlib import Path
 
         console.clear()
         console.print("[bold cyan]🎯 Random Simulation (Blind Segment Test)[/bold cyan]\n")
@@ -15710,18 +16587,14 @@ List:"""
         signals_name = config.get('signal_file_name')
         time_col = config.get('time_column', 'date')
         fallback_mode = False
-        import numpy as np
-        
-        # Safe matplotlib import with Agg backend
+
+        # Charts are drawn on Agg-backed Figures (module-level OO imports, no pyplot)
         plotting_available = False
         if config.get('enable_plots', True):
-            try:
-                import matplotlib
-                matplotlib.use('Agg')
-                import matplotlib.pyplot as plt
+            if MATPLOTLIB_AVAILABLE:
                 plotting_available = True
-            except Exception as e:
-                console.print(f"[yellow]Plotting disabled: {e}[/yellow]")
+            else:
+                console.print("[yellow]Plotting disabled: matplotlib not installed[/yellow]")
         else:
             console.print("[yellow]Plotting disabled (enable_plots=false in config)[/yellow]")
             
@@ -15746,7 +16619,7 @@ List:"""
                 "3": {"period": "5y", "interval": "1d"},
             }[style_choice]
             console.print(f"[cyan]Fetching {ticker} {style_fetch['period']} @ {style_fetch['interval']} via yfinance...[/cyan]")
-            raw = yf.download(ticker, period=style_fetch['period'], interval=style_fetch['interval'])
+            raw = self._cached_yf_download(ticker, style_fetch['period'], style_fetch['interval'])
             if raw.empty:
                 console.print("[red]No data fetched for fallback. Aborting simulation.[/red]")
                 Prompt.ask("Press Enter")
@@ -15767,15 +16640,6 @@ List:"""
             
             time_col = 'Datetime' if 'Datetime' in raw.columns else ('Date' if 'Date' in raw.columns else raw.columns[0])
             close = raw['close'] if 'close' in raw.columns else (raw['Close'] if 'Close' in raw.columns else raw.iloc[:,1])
-            delta = close.diff()
-            gain = delta.clip(lower=0).rolling(14).mean()
-            loss = (-delta.clip(upper=0)).rolling(14).mean()
-            rs = gain / loss.replace(0, np.nan)
-            rsi = 100 - (100 / (1 + rs))
-            rsi.fillna(50, inplace=True)
-            buy_sig_series = ((rsi.shift(1) < 30) & (rsi >= 30)).astype(int)
-            sell_sig_series = ((rsi.shift(1) > 70) & (rsi <= 70)).astype(int)
-            score_series = (rsi - 50) / 50.0
             def _ensure_series(x):
                 if isinstance(x, pd.DataFrame):
                     return x.iloc[:,0]
@@ -15784,9 +16648,7 @@ List:"""
                 return x.squeeze() if hasattr(x, 'squeeze') else x
             ts_data = _ensure_series(raw[time_col])
             close = _ensure_series(close)
-            buy_sig_series = _ensure_series(buy_sig_series)
-            sell_sig_series = _ensure_series(sell_sig_series)
-            score_series = _ensure_series(score_series)
+            buy_sig_series, sell_sig_series, score_series = _rsi_cross_signals(close.to_numpy(dtype=float))
             
             # Build dataframe with OHLC if available
             df = pd.DataFrame({
@@ -15807,7 +16669,7 @@ List:"""
             if path.suffix == '.parquet':
                 df = pd.read_parquet(path)
             else:
-                df = pd.read_csv(path, parse_dates=[time_col])
+                df = pd.read_csv(path, parse_dates=[time_col], date_format='ISO8601')
             # Signals config
             signal_sets = config.get('signal_sets', [])
             thr_rule = next((s for s in signal_sets if s.get('generator') == 'threshold_rule'), None)
@@ -15935,10 +16797,10 @@ List:"""
         hist_path = None
         if plotting_available:
             try:
-                from matplotlib.patches import Rectangle
-                
-                fig, axes = plt.subplots(2 if score_col else 1, 1, figsize=(16, 9), sharex=True,
-                                         gridspec_kw={'height_ratios': [4, 1]} if score_col else None)
+                fig = Figure(figsize=(16, 9))
+                FigureCanvasAgg(fig)
+                axes = fig.subplots(2 if score_col else 1, 1, sharex=True,
+                                    gridspec_kw={'height_ratios': [4, 1]} if score_col else None)
                 if not hasattr(axes, '__iter__'):
                     axes = [axes]
                 elif hasattr(axes, 'flatten'):
@@ -16054,10 +16916,9 @@ List:"""
                 fig.text(0.02, 0.98, info_text, fontsize=12, family='monospace', color='white',
                         verticalalignment='top', bbox=dict(boxstyle='round', facecolor='#2a2a2a', alpha=0.95, edgecolor='cyan', linewidth=2))
                 
-                plt.tight_layout()
+                fig.tight_layout()
                 hist_path = out_dir / 'segment_historical.png'
-                plt.savefig(hist_path, dpi=120, bbox_inches='tight', facecolor='#1a1a1a')
-                plt.close(fig)
+                fig.savefig(hist_path, dpi=120, bbox_inches='tight', facecolor='#1a1a1a')
                 console.print(f"[green]📊 Historical chart saved: {hist_path}[/green]")
                 
                 # Open the chart
@@ -16110,10 +16971,10 @@ List:"""
                 # Generate future chart with candlesticks (combined historical + future)
                 if plotting_available:
                     try:
-                        from matplotlib.patches import Rectangle
-                        
-                        fig, axes = plt.subplots(2 if score_col else 1, 1, figsize=(16, 9), sharex=True,
-                                                 gridspec_kw={'height_ratios': [3, 1]} if score_col else None)
+                        fig = Figure(figsize=(16, 9))
+                        FigureCanvasAgg(fig)
+                        axes = fig.subplots(2 if score_col else 1, 1, sharex=True,
+                                            gridspec_kw={'height_ratios': [3, 1]} if score_col else None)
                         if not hasattr(axes, '__iter__'):
                             axes = [axes]
                         elif hasattr(axes, 'flatten'):
@@ -16283,10 +17144,9 @@ List:"""
                         fig.text(0.02, 0.98, info_text, fontsize=12, family='monospace', color='white',
                                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='#2a2a2a', alpha=0.95, edgecolor=box_color, linewidth=3))
                         
-                        plt.tight_layout()
+                        fig.tight_layout()
                         future_path = out_dir / 'segment_with_future.png'
-                        plt.savefig(future_path, dpi=120, bbox_inches='tight', facecolor='#1a1a1a')
-                        plt.close(fig)
+                        fig.savefig(future_path, dpi=120, bbox_inches='tight', facecolor='#1a1a1a')
                         console.print(f"[green]📊 Future chart saved: {future_path}[/green]")
                         
                         # Open the chart
@@ -16334,7 +17194,6 @@ List:"""
                 lf.write(f"{summary['end_timestamp']},{ticker},{action},{future_return if future_return is not None else ''},{outcome}\n")
             # Compute cumulative accuracy
             try:
-                import pandas as pd
                 log_df = pd.read_csv(log_path)
                 total_trials = len(log_df)
                 pass_trials = (log_df['outcome'] == 'PASS').sum()
@@ -16560,7 +17419,7 @@ List:"""
             while True:
                 DisplayManager.show_header()
                 console.print("[bold cyan]Live Position Monitor[/bold cyan]\n")
-                console.print(f"[dim]Last update: {datetime.now().strftime('%H:%M:%S')}[/dim]\n")
+                console.print(f"[dim]Last update: {time.strftime('%H:%M:%S')}[/dim]\n")
                 
                 # Update all positions
                 alerts = mgr.update_positions(
@@ -18104,17 +18963,23 @@ class MLSignalWeighter:
         self.trade_history: List[BacktestTrade] = []
     
     @staticmethod
-    def engineer_features(df: pd.DataFrame, indicators: AdvancedIndicators) -> Dict[str, float]:
+    def engineer_features(df: pd.DataFrame, indicators: AdvancedIndicators,
+                          shared: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
         """
         Advanced feature engineering for ML.
         Creates features from price action, indicators, and statistical properties.
+        `shared` (see `_shared_features`) supplies precomputed closes/returns/20-bar range.
         """
         features = {}
         
         try:
             # Price-based features
-            close = df['Close'].values
-            returns = pd.Series(close).pct_change()
+            if shared is not None:
+                close = shared['closes']
+                returns = shared['returns']
+            else:
+                close = df['Close'].values
+                returns = pd.Series(close).pct_change()
             
             # Momentum features
             features['returns_1d'] = returns.iloc[-1] if len(returns) > 0 else 0
@@ -18167,8 +19032,12 @@ class MLSignalWeighter:
                 features['kurtosis'] = 0
             
             # Price level features
-            high_20 = df['High'].tail(20).max()
-            low_20 = df['Low'].tail(20).min()
+            if shared is not None:
+                high_20 = shared['high_20']
+                low_20 = shared['low_20']
+            else:
+                high_20 = df['High'].tail(20).max()
+                low_20 = df['Low'].tail(20).min()
             features['price_position'] = (close[-1] - low_20) / (high_20 - low_20) if (high_20 - low_20) > 0 else 0.5
             
         except Exception as e: